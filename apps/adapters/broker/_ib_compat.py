@@ -27,6 +27,23 @@ def attach_trade_events(
     return tuple(attached)
 
 
+def detach_trade_events(
+    trade: object,
+    *,
+    on_status: Callable[..., None] | None = None,
+    on_filled: Callable[..., None] | None = None,
+    on_fill: Callable[..., None] | None = None,
+) -> tuple[str, ...]:
+    detached: list[str] = []
+    if on_status is not None and _event_remove(trade, "statusEvent", on_status):
+        detached.append("statusEvent")
+    if on_filled is not None and _event_remove(trade, "filledEvent", on_filled):
+        detached.append("filledEvent")
+    if on_fill is not None and _event_remove(trade, "fillEvent", on_fill):
+        detached.append("fillEvent")
+    return tuple(detached)
+
+
 def attach_bar_update_event(
     bars: object,
     handler: Callable[..., None],
@@ -165,6 +182,7 @@ __all__ = [
     "attach_bar_update_event",
     "attach_trade_events",
     "detach_bar_update_event",
+    "detach_trade_events",
     "req_tickers_snapshot",
     "silence_ib_client_loggers",
     "what_if_order",
@@ -175,6 +175,9 @@ class IBKRConnection:
                 )
             )
 
+    def is_connected(self) -> bool:
+        return self._ib.isConnected()
+
     def status(self) -> dict[str, object]:
         return {
             "connected": self._ib.isConnected(),
@@ -24,7 +24,11 @@ from apps.adapters.broker._ib_client import (
     Trade,
     UNSET_DOUBLE,
 )
-from apps.adapters.broker._ib_compat import attach_trade_events, req_tickers_snapshot
+from apps.adapters.broker._ib_compat import (
+    attach_trade_events,
+    detach_trade_events,
+    req_tickers_snapshot,
+)
 
 from apps.adapters.broker.ibkr_connection import IBKRConnection
 from apps.adapters.broker.ibkr_session_phase import IBKRSessionPhaseResolver, SessionPhase
@@ -1979,11 +1983,29 @@ async def _wait_for_order_status(
     poll_interval: float = 0.1,
 ) -> Optional[str]:
     status = trade.orderStatus.status
-    deadline = time.time() + timeout
-    while not status and time.time() < deadline:
-        await asyncio.sleep(poll_interval)
-        status = trade.orderStatus.status
-    return status or None
+    if status:
+        return status
+    status_seen = asyncio.Event()
+
+    def _on_status(*_args: object) -> None:
+        if trade.orderStatus.status:
+            status_seen.set()
+
+    # Wake on the broker's status callback instead of polling; clients without
+    # trade events fall back to the poll loop.
+    if not attach_trade_events(trade, on_status=_on_status):
+        deadline = time.time() + timeout
+        while not status and time.time() < deadline:
+            await asyncio.sleep(poll_interval)
+            status = trade.orderStatus.status
+        return status or None
+    try:
+        await asyncio.wait_for(status_seen.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        detach_trade_events(trade, on_status=_on_status)
+    return trade.orderStatus.status or None
 
 
 async def _wait_for_inventory_confirmation(
@@ -12,6 +12,9 @@ EventHandler = Callable[[EventT], Awaitable[None] | None]
 class InProcessEventBus:
     def __init__(self) -> None:
         self._subscribers: list[tuple[type, EventHandler]] = []
+        # The loop only keeps weak references to tasks; hold async handler tasks
+        # until they finish and drop them from their own done callback.
+        self._handler_tasks: set[asyncio.Task] = set()
 
     def publish(self, event: object) -> None:
         if not self._subscribers:
@@ -39,8 +42,7 @@ class InProcessEventBus:
 
         return _unsubscribe
 
-    @staticmethod
-    def _dispatch(handler: EventHandler, event: object) -> None:
+    def _dispatch(self, handler: EventHandler, event: object) -> None:
         try:
             result = handler(event)
         except Exception as exc:
@@ -56,6 +58,8 @@ class InProcessEventBus:
             except RuntimeError:
                 asyncio.run(result)
             else:
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_tasks.discard)
                 task.add_done_callback(_swallow_task_error)
 
 
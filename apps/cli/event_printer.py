@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import functools
 from datetime import datetime, timezone
 import os
 from time import monotonic
 import sys
-from typing import Optional
+from typing import Any, Callable, Optional
 
 try:
     import readline
@@ -62,6 +63,7 @@ _BAR_STREAM_INFO_COOLDOWN_SECONDS = 15.0
 _BAR_STREAM_INFO_LAST_PRINTED: dict[tuple[str, str, str, bool], float] = {}
 _SUPPRESSED_GATEWAY_REQ_IDS: dict[int, float] = {}
 _GATEWAY_REQ_SUPPRESS_TTL_SECONDS = 10.0
+_ORDER_SUBMITTED_STOP_REASONS = frozenset({"order_submitted", "order_submitted_fast"})
 _SHOW_ORDER_IDS = os.getenv("APPS_CLI_SHOW_ORDER_IDS", "").strip().lower() in {
     "1",
     "true",
@@ -137,682 +139,810 @@ class _BreakoutNarrativeSession:
 
 _BREAKOUT_SESSION_BY_TAG: dict[str, _BreakoutNarrativeSession] = {}
 _BREAKOUT_TAG_BY_ORDER_ID: dict[int, str] = {}
+_ORDER_STATUS_ALIASES = {
+    "pendingsubmit": "pending",
+    "presubmitted": "pending",
+    "submitted": "submitted",
+    "apipending": "pending",
+    "partiallyfilled": "partially_filled",
+    "filled": "filled",
+    "pendingcancel": "cancel_pending",
+    "cancelled": "cancelled",
+    "apicancelled": "cancelled",
+    "inactive": "inactive",
+    "rejected": "rejected",
+    "assigned": "assigned",
+    "repriced": "repriced",
+}
+_FILL_STATUSES = frozenset({"filled", "partiallyfilled", "partially_filled"})
+
+
+def print_event(event: object) -> bool:
+    printer = _EVENT_PRINTERS.get(type(event))
+    if printer is None:
+        return False
+    return printer(event)
+
+
+def _print_breakout_started(event: BreakoutStarted) -> bool:
+    suffix = _breakout_tp_sl_suffix(
+        take_profit=event.take_profit,
+        take_profits=event.take_profits,
+        stop_loss=event.stop_loss,
+    )
+    _print_line(
+        event.timestamp,
+        "BreakoutStarted",
+        f"{event.symbol} level={event.rule.level}{suffix}",
+    )
+    return True
+
+
+def _print_breakout_break_detected(event: BreakoutBreakDetected) -> bool:
+    bar_time = _format_time(event.bar.timestamp)
+    suffix = _breakout_tp_sl_suffix(
+        take_profit=event.take_profit,
+        take_profits=event.take_profits,
+        stop_loss=event.stop_loss,
+    )
+    _print_line(
+        event.timestamp,
+        "BreakoutBreak",
+        f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
+    )
+    return True
+
+
+def _print_breakout_fast_triggered(event: BreakoutFastTriggered) -> bool:
+    bar_time = _format_time(event.bar.timestamp)
+    thresholds = event.thresholds
+    suffix = _breakout_tp_sl_suffix(
+        take_profit=event.take_profit,
+        take_profits=event.take_profits,
+        stop_loss=event.stop_loss,
+    )
+    _print_line(
+        event.timestamp,
+        "BreakoutFast",
+        (
+            f"{event.symbol} level={event.level} bar={bar_time} "
+            f"elapsed={thresholds.elapsed_seconds}s "
+            f"dist={thresholds.distance_cents}c "
+            f"range={thresholds.spread_cents}c "
+            f"max_range={thresholds.max_spread_cents}c "
+            f"scale={thresholds.price_scale:g}{suffix}"
+        ),
+    )
+    return True
+
+
+def _print_breakout_confirmed(event: BreakoutConfirmed) -> bool:
+    if event.client_tag:
+        _CONFIRMED_BY_TAG[event.client_tag] = _EntryFillTiming(
+            confirmed_at=_normalize_timestamp(event.timestamp)
+        )
+        _get_or_create_breakout_session(event.client_tag, event.symbol)
+    suffix = _breakout_tp_sl_suffix(
+        take_profit=event.take_profit,
+        take_profits=event.take_profits,
+        stop_loss=event.stop_loss,
+    )
+    bar_time = _format_time(event.bar.timestamp)
+    _print_line(
+        event.timestamp,
+        "BreakoutConfirmed",
+        f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
+    )
+    return True
+
+
+def _print_breakout_rejected(event: BreakoutRejected) -> bool:
+    bar_time = _format_time(event.bar.timestamp)
+    extras = []
+    if event.reason:
+        extras.append(f"reason={event.reason}")
+    if event.reason == "quote_stale":
+        if event.quote_age_seconds is not None:
+            extras.append(f"age={event.quote_age_seconds:.3f}s")
+        if event.quote_max_age_seconds is not None:
+            extras.append(f"max={event.quote_max_age_seconds:.3f}s")
+    extras.extend(
+        _breakout_tp_sl_parts(
+            take_profit=event.take_profit,
+            take_profits=event.take_profits,
+            stop_loss=event.stop_loss,
+        )
+    )
+    suffix = f" {' '.join(extras)}" if extras else ""
+    _print_line(
+        event.timestamp,
+        "BreakoutRejected",
+        f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
+    )
+    return True
+
+
+def _print_breakout_stopped(event: BreakoutStopped) -> bool:
+    if event.client_tag and event.reason not in _ORDER_SUBMITTED_STOP_REASONS:
+        _CONFIRMED_BY_TAG.pop(event.client_tag, None)
+    return False
+
+
+def _print_order_id_assigned(event: OrderIdAssigned) -> bool:
+    breakout_handled = _handle_breakout_order_id_assigned(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    state = _track_entry_order(
+        order_id=event.order_id,
+        symbol=event.spec.symbol,
+        qty=event.spec.qty,
+        price=event.spec.limit_price,
+    )
+    parts = _lifecycle_parts(
+        symbol=event.spec.symbol,
+        leg="entry",
+        status="assigned",
+        target_qty=state.target_qty if state else float(event.spec.qty),
+        filled_qty=state.filled_qty if state else 0.0,
+        remaining_qty=state.remaining_qty if state else float(event.spec.qty),
+        price=state.price if state else event.spec.limit_price,
+        order_id=event.order_id,
+    )
+    _print_line(event.timestamp, "EntryStatus", " ".join(parts))
+    return True
+
+
+def _print_order_status_changed(event: OrderStatusChanged) -> bool:
+    breakout_handled = _handle_breakout_order_status_changed(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    state = _track_entry_order(
+        order_id=event.order_id,
+        symbol=event.spec.symbol,
+        qty=event.spec.qty,
+        price=event.spec.limit_price,
+        status=event.status,
+    )
+    normalized_status = _normalize_order_status(event.status)
+    target_qty = state.target_qty if state else float(event.spec.qty)
+    filled_qty = state.filled_qty if state else 0.0
+    remaining_qty = (
+        state.remaining_qty
+        if state and state.remaining_qty is not None
+        else max(target_qty - filled_qty, 0.0)
+    )
+    parts = _lifecycle_parts(
+        symbol=event.spec.symbol,
+        leg="entry",
+        status=normalized_status,
+        target_qty=target_qty,
+        filled_qty=filled_qty,
+        remaining_qty=remaining_qty,
+        price=event.spec.limit_price,
+        order_id=event.order_id,
+    )
+    _print_line(event.timestamp, "EntryStatus", " ".join(parts))
+    return True
+
+
+def _print_bracket_child_order_status_changed(event: BracketChildOrderStatusChanged) -> bool:
+    breakout_handled = _handle_breakout_child_status_changed(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    leg = _leg_from_kind(event.kind)
+    state = _track_child_order(
+        order_id=event.order_id,
+        symbol=event.symbol,
+        kind=event.kind,
+        qty=float(event.qty),
+        price=event.price,
+        status=event.status,
+    )
+    target_qty = state.target_qty if state else float(event.qty)
+    filled_qty = state.filled_qty if state else 0.0
+    remaining_qty = (
+        state.remaining_qty
+        if state and state.remaining_qty is not None
+        else max(target_qty - filled_qty, 0.0)
+    )
+    parts = _lifecycle_parts(
+        symbol=event.symbol,
+        leg=leg,
+        status=_normalize_order_status(event.status),
+        target_qty=target_qty,
+        filled_qty=filled_qty,
+        remaining_qty=remaining_qty,
+        price=event.price,
+        order_id=event.order_id,
+    )
+    _print_line(event.timestamp, "ExitStatus", " ".join(parts))
+    return True
+
+
+def _print_ib_gateway_log(event: IbGatewayLog) -> bool:
+    breakout_handled = _handle_breakout_gateway_log(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    correlated = _format_correlated_gateway_log(event)
+    if correlated is not None:
+        label, message = correlated
+        _print_line(event.timestamp, label, message)
+        return True
+    if _should_hide_gateway_log(event):
+        return False
+    if event.code is None and not event.message:
+        return False
+    label = _gateway_label(event)
+    parts = []
+    message = _gateway_message_for_display(event)
+    if message:
+        max_len = _gateway_message_preview_len(label)
+        parts.append(_shorten_message(message, max_len=max_len))
+    if event.code is not None:
+        parts.append(_format_gateway_code(event.code))
+    if event.req_id is not None and event.req_id >= 0 and (_SHOW_ORDER_IDS or label == "IbError"):
+        parts.append(f"req={event.req_id}")
+    if event.advanced:
+        parts.append("adv")
+    _print_line(event.timestamp, label, " ".join(parts))
+    return True
+
+
+def _print_bar_stream_stalled(event: BarStreamStalled) -> bool:
+    _print_line(
+        event.timestamp,
+        "BarStreamStalled",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"silence={event.silence_seconds:.1f}s timeout={event.timeout_seconds:.1f}s"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_recovered(event: BarStreamRecovered) -> bool:
+    if not _should_print_bar_stream_info(
+        kind="recovered",
+        symbol=event.symbol,
+        bar_size=event.bar_size,
+        use_rth=event.use_rth,
+    ):
+        return False
+    _print_line(
+        event.timestamp,
+        "BarStreamRecovered",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"downtime={event.downtime_seconds:.1f}s"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_recovery_started(event: BarStreamRecoveryStarted) -> bool:
+    if not _should_print_bar_stream_info(
+        kind="heal",
+        symbol=event.symbol,
+        bar_size=event.bar_size,
+        use_rth=event.use_rth,
+    ):
+        return False
+    _print_line(
+        event.timestamp,
+        "BarStreamHeal",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"attempt={event.attempt}"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_recovery_failed(event: BarStreamRecoveryFailed) -> bool:
+    _print_line(
+        event.timestamp,
+        "BarStreamHealFail",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"attempt={event.attempt} retry_in={event.retry_in_seconds:.1f}s "
+            f"msg={_shorten_message(event.message)}"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_competing_session_blocked(event: BarStreamCompetingSessionBlocked) -> bool:
+    _print_line(
+        event.timestamp,
+        "BarStreamBlocked",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"code={event.code} msg={_shorten_message(event.message)}"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_competing_session_cleared(event: BarStreamCompetingSessionCleared) -> bool:
+    _print_line(
+        event.timestamp,
+        "BarStreamUnblocked",
+        (
+            f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
+            f"code={event.code} msg={_shorten_message(event.message)}"
+        ),
+    )
+    return True
+
+
+def _print_bar_stream_recovery_scan_scheduled(event: BarStreamRecoveryScanScheduled) -> bool:
+    _print_line(
+        event.timestamp,
+        "BarStreamScan",
+        f"reason={event.reason} groups={event.groups} streams={event.streams}",
+    )
+    return True
+
+
+def _print_order_filled(event: OrderFilled) -> bool:
+    breakout_handled = _handle_breakout_order_filled(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    state = _track_entry_order(
+        order_id=event.order_id,
+        symbol=event.spec.symbol,
+        qty=event.spec.qty,
+        price=event.spec.limit_price,
+        status=event.status,
+        filled_qty=event.filled_qty,
+        remaining_qty=event.remaining_qty,
+    )
+    if not _is_fill_event(event.status, event.filled_qty):
+        return False
+    latency_suffix = _entry_fill_latency_suffix(event)
+    target_qty = state.target_qty if state else float(event.spec.qty)
+    filled_qty = state.filled_qty if state and state.filled_qty is not None else (event.filled_qty or 0.0)
+    remaining_qty = (
+        state.remaining_qty
+        if state and state.remaining_qty is not None
+        else event.remaining_qty
+    )
+    status = "filled" if _is_full_fill(event) else "partially_filled"
+    parts = _lifecycle_parts(
+        symbol=event.spec.symbol,
+        leg="entry",
+        status=status,
+        target_qty=target_qty,
+        filled_qty=filled_qty,
+        remaining_qty=remaining_qty,
+        price=event.avg_fill_price,
+        order_id=event.order_id,
+    )
+    if latency_suffix:
+        parts.append(latency_suffix.strip())
+    _print_line(
+        event.timestamp,
+        "EntryFill",
+        " ".join(parts),
+    )
+    return True
+
+
+def _print_bracket_child_order_broker_snapshot(event: BracketChildOrderBrokerSnapshot) -> bool:
+    breakout_handled = _handle_breakout_child_snapshot(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    leg = _leg_from_kind(event.kind)
+    _track_child_order(
+        order_id=event.order_id,
+        symbol=event.symbol,
+        kind=event.kind,
+        qty=event.expected_qty,
+        status=event.status,
+    )
+    broker_qty = "-"
+    if event.broker_order_qty is not None:
+        broker_qty = f"{event.broker_order_qty:g}"
+    if event.kind.startswith("det70_"):
+        label = "Det70ChildSnapshot"
+    elif event.kind.startswith("detached_"):
+        label = "DetachedChildSnapshot"
+    else:
+        label = "ChildOrderSnapshot"
+    _print_line(
+        event.timestamp,
+        label,
+        (
+            f"{event.symbol} leg={leg} kind={event.kind}"
+            f"{_optional_order_ref(event.order_id)}{_optional_parent_ref(event.parent_order_id)} "
+            f"expected={event.expected_qty:g} broker={broker_qty} status={event.status or '-'}"
+        ),
+    )
+    return True
+
+
+def _print_bracket_child_quantity_mismatch_detected(event: BracketChildQuantityMismatchDetected) -> bool:
+    breakout_handled = _handle_breakout_child_qty_mismatch(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    leg = _leg_from_kind(event.kind)
+    _track_child_order(
+        order_id=event.order_id,
+        symbol=event.symbol,
+        kind=event.kind,
+        qty=event.expected_qty,
+        status=event.status,
+    )
+    if event.kind.startswith("det70_"):
+        label = "Det70QtyMismatch"
+    elif event.kind.startswith("detached_"):
+        label = "DetachedQtyMismatch"
+    else:
+        label = "ChildQtyMismatch"
+    _print_line(
+        event.timestamp,
+        label,
+        (
+            f"{event.symbol} leg={leg} kind={event.kind}"
+            f"{_optional_order_ref(event.order_id)}{_optional_parent_ref(event.parent_order_id)} "
+            f"expected={event.expected_qty:g} broker={event.broker_order_qty:g} "
+            f"status={event.status or '-'}"
+        ),
+    )
+    return True
+
+
+def _print_bracket_child_order_filled(event: BracketChildOrderFilled) -> bool:
+    breakout_handled = _handle_breakout_child_filled(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    leg = _leg_from_kind(event.kind)
+    state = _track_child_order(
+        order_id=event.order_id,
+        symbol=event.symbol,
+        kind=event.kind,
+        qty=event.expected_qty if event.expected_qty is not None else float(event.qty),
+        price=event.price,
+        status=event.status,
+        filled_qty=event.filled_qty,
+        remaining_qty=event.remaining_qty,
+    )
+    if not _is_fill_event(event.status, event.filled_qty):
+        return False
+    fill_price = event.avg_fill_price if event.avg_fill_price is not None else event.price
+    target_qty = (
+        state.target_qty
+        if state and state.target_qty is not None
+        else (event.expected_qty if event.expected_qty is not None else float(event.qty))
+    )
+    filled_qty = (
+        state.filled_qty
+        if state and state.filled_qty is not None
+        else (event.filled_qty or 0.0)
+    )
+    remaining_qty = (
+        state.remaining_qty
+        if state and state.remaining_qty is not None
+        else event.remaining_qty
+    )
+    status = "filled"
+    if (
+        target_qty is not None
+        and filled_qty is not None
+        and filled_qty + 1e-9 < target_qty
+    ):
+        status = "partially_filled"
+    broker_suffix = ""
+    if event.expected_qty is not None and event.broker_order_qty is not None:
+        if abs(event.expected_qty - event.broker_order_qty) > 1e-9:
+            broker_suffix = (
+                f" QTY_MISMATCH expected={event.expected_qty:g} broker={event.broker_order_qty:g}"
+            )
+        else:
+            broker_suffix = f" expected={event.expected_qty:g} broker={event.broker_order_qty:g}"
+    parts = _lifecycle_parts(
+        symbol=event.symbol,
+        leg=leg,
+        status=status,
+        target_qty=target_qty,
+        filled_qty=filled_qty,
+        remaining_qty=remaining_qty,
+        price=fill_price,
+        order_id=event.order_id,
+    )
+    if broker_suffix:
+        parts.append(broker_suffix.strip())
+    _print_line(
+        event.timestamp,
+        "ExitFill",
+        " ".join(parts),
+    )
+    return True
+
+
+def _print_ladder_stop_loss_replaced(event: LadderStopLossReplaced) -> bool:
+    breakout_handled = _handle_breakout_stop_replaced(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    state = _track_repriced_stop(event)
+    leg = state.leg if state else "sl"
+    target_qty = state.target_qty if state else float(event.new_qty)
+    filled_qty = state.filled_qty if state and state.filled_qty is not None else 0.0
+    remaining_qty = (
+        state.remaining_qty
+        if state and state.remaining_qty is not None
+        else max(float(event.new_qty) - filled_qty, 0.0)
+    )
+    parts = _lifecycle_parts(
+        symbol=event.symbol,
+        leg=leg,
+        status="repriced",
+        target_qty=target_qty,
+        filled_qty=filled_qty,
+        remaining_qty=remaining_qty,
+        price=event.new_price,
+        order_id=event.new_order_id,
+    )
+    parts.append(f"from={event.old_price:g}")
+    parts.append(f"reason={event.reason}")
+    _print_line(
+        event.timestamp,
+        "ExitStatus",
+        " ".join(parts),
+    )
+    return True
+
+
+def _print_ladder_stop_loss_replace_failed(event: LadderStopLossReplaceFailed) -> bool:
+    broker = []
+    if event.broker_code is not None:
+        broker.append(f"code={event.broker_code}")
+    if event.broker_message:
+        broker.append(f"msg={_shorten_message(event.broker_message)}")
+    broker_suffix = f" {' '.join(broker)}" if broker else ""
+    if event.execution_mode == "detached70":
+        label = "Det70StopLossReplaceFailed"
+    elif event.execution_mode == "detached":
+        label = "DetachedStopLossReplaceFailed"
+    else:
+        label = "StopLossReplaceFailed"
+    _print_line(
+        event.timestamp,
+        label,
+        (
+            f"{event.symbol}{_optional_order_ref(event.old_order_id)} "
+            f"attempt_qty={event.attempted_qty} attempt_price={event.attempted_price:g} "
+            f"status={event.status or '-'}{broker_suffix}"
+        ),
+    )
+    return True
+
+
+def _print_ladder_protection_state_changed(event: LadderProtectionStateChanged) -> bool:
+    breakout_handled = _handle_breakout_protection_changed(event)
+    if breakout_handled is not None:
+        return breakout_handled
+    tp_ids = ",".join(str(order_id) for order_id in event.active_take_profit_order_ids)
+    if event.execution_mode == "detached70":
+        label = "Det70StopProtection"
+    elif event.execution_mode == "detached":
+        label = "DetachedStopProtection"
+    else:
+        label = "StopProtection"
+    if _SHOW_ORDER_IDS:
+        stop_details = f"stop_order_id={event.stop_order_id} active_tp_ids=[{tp_ids}]"
+    else:
+        stop_details = f"active_tp_count={len(event.active_take_profit_order_ids)}"
+    _print_line(
+        event.timestamp,
+        label,
+        (
+            f"{event.symbol} state={event.state} reason={event.reason} "
+            f"{stop_details}"
+        ),
+    )
+    return True
+
+
+def _print_ladder_stop_loss_cancelled(event: LadderStopLossCancelled) -> bool:
+    if event.execution_mode == "detached70":
+        label = "Det70StopLossCancelled"
+    elif event.execution_mode == "detached":
+        label = "DetachedStopLossCancelled"
+    else:
+        label = "StopLossCancelled"
+    order_ref = _optional_order_ref(event.order_id).strip()
+    order_prefix = f"{order_ref} " if order_ref else ""
+    _print_line(
+        event.timestamp,
+        label,
+        (
+            f"{event.symbol} reason={event.reason} "
+            f"{order_prefix}qty={event.qty} price={event.price:g}"
+        ),
+    )
+    return True
+
+
+def _print_detached_protection_coverage_gap_detected(event: DetachedProtectionCoverageGapDetected) -> bool:
+    if _SHOW_ORDER_IDS:
+        stop_details = f"stop_ids={event.stop_order_ids}"
+    else:
+        stop_details = f"stop_count={event.stop_order_count}"
+    _print_line(
+        event.timestamp,
+        "DetachedProtectionGap",
+        (
+            f"{event.symbol} account={event.account or '-'} "
+            f"tag={event.client_tag or '-'} "
+            f"position={_fmt_qty(event.position_qty)} "
+            f"protected={_fmt_qty(event.protected_qty)} "
+            f"uncovered={_fmt_qty(event.uncovered_qty)} "
+            f"{stop_details} trigger={event.trigger} scope={event.scope}"
+        ),
+    )
+    return True
+
+
+def _print_detached_protection_reconciliation_completed(event: DetachedProtectionReconciliationCompleted) -> bool:
+    if event.gap_count <= 0:
+        return False
+    _print_line(
+        event.timestamp,
+        "DetachedProtectionRecon",
+        (
+            f"{event.trigger} {event.scope} "
+            f"active={event.active_order_count} "
+            f"positions={event.position_count} "
+            f"inspected={event.inspected_position_count} "
+            f"covered={event.covered_position_count} "
+            f"gaps={event.gap_count}"
+        ),
+    )
+    return True
+
+
+def _print_detached_session_restored(event: DetachedSessionRestored) -> bool:
+    tp_count = len(event.active_take_profit_order_ids)
+    if _SHOW_ORDER_IDS:
+        stop_details = f"stop_ids={event.active_stop_order_ids}"
+        tp_details = f"tp_ids={event.active_take_profit_order_ids}"
+    else:
+        stop_details = f"stop_count={len(event.active_stop_order_ids)}"
+        tp_details = f"tp_count={tp_count}"
+    _print_line(
+        event.timestamp,
+        "DetachedSessionRestored",
+        (
+            f"{event.symbol} account={event.account or '-'} "
+            f"tag={event.client_tag or '-'} mode={event.execution_mode} "
+            f"state={event.state} reason={event.reason} "
+            f"position={_fmt_qty(event.position_qty)} "
+            f"protected={_fmt_qty(event.protected_qty)} "
+            f"uncovered={_fmt_qty(event.uncovered_qty)} "
+            f"{tp_details} {stop_details}"
+        ),
+    )
+    return True
+
+
+def _print_detached_session_restore_completed(event: DetachedSessionRestoreCompleted) -> bool:
+    if event.restored_count <= 0:
+        return False
+    _print_line(
+        event.timestamp,
+        "DetachedSessionRestore",
+        (
+            f"{event.trigger} {event.scope} "
+            f"active={event.active_order_count} "
+            f"positions={event.position_count} "
+            f"inspected={event.inspected_position_count} "
+            f"restored={event.restored_count} "
+            f"protected={event.protected_count} "
+            f"unprotected={event.unprotected_count}"
+        ),
+    )
+    return True
+
+
+def _print_orphan_exit_order_detected(event: OrphanExitOrderDetected) -> bool:
+    _print_line(
+        event.timestamp,
+        "OrphanExitDetected",
+        (
+            f"{event.symbol} order_id={event.order_id} parent={event.parent_order_id} "
+            f"remaining={event.remaining_qty} status={event.status or '-'} "
+            f"action={event.action} trigger={event.trigger} scope={event.scope}"
+        ),
+    )
+    return True
+
+
+def _print_orphan_exit_order_cancelled(event: OrphanExitOrderCancelled) -> bool:
+    _print_line(
+        event.timestamp,
+        "OrphanExitCancelled",
+        (
+            f"{event.symbol} order_id={event.order_id} "
+            f"status={event.status or '-'} trigger={event.trigger}"
+        ),
+    )
+    return True
 
 
-def print_event(event: object) -> bool:
-    if isinstance(event, BreakoutStarted):
-        suffix = _breakout_tp_sl_suffix(
-            take_profit=event.take_profit,
-            take_profits=event.take_profits,
-            stop_loss=event.stop_loss,
-        )
-        _print_line(
-            event.timestamp,
-            "BreakoutStarted",
-            f"{event.symbol} level={event.rule.level}{suffix}",
-        )
-        return True
-    if isinstance(event, BreakoutBreakDetected):
-        bar_time = _format_time(event.bar.timestamp)
-        suffix = _breakout_tp_sl_suffix(
-            take_profit=event.take_profit,
-            take_profits=event.take_profits,
-            stop_loss=event.stop_loss,
-        )
-        _print_line(
-            event.timestamp,
-            "BreakoutBreak",
-            f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
-        )
-        return True
-    if isinstance(event, BreakoutFastTriggered):
-        bar_time = _format_time(event.bar.timestamp)
-        thresholds = event.thresholds
-        suffix = _breakout_tp_sl_suffix(
-            take_profit=event.take_profit,
-            take_profits=event.take_profits,
-            stop_loss=event.stop_loss,
-        )
-        _print_line(
-            event.timestamp,
-            "BreakoutFast",
-            (
-                f"{event.symbol} level={event.level} bar={bar_time} "
-                f"elapsed={thresholds.elapsed_seconds}s "
-                f"dist={thresholds.distance_cents}c "
-                f"range={thresholds.spread_cents}c "
-                f"max_range={thresholds.max_spread_cents}c "
-                f"scale={thresholds.price_scale:g}{suffix}"
-            ),
-        )
-        return True
-    if isinstance(event, BreakoutConfirmed):
-        if event.client_tag:
-            _CONFIRMED_BY_TAG[event.client_tag] = _EntryFillTiming(
-                confirmed_at=_normalize_timestamp(event.timestamp)
-            )
-            _get_or_create_breakout_session(event.client_tag, event.symbol)
-        suffix = _breakout_tp_sl_suffix(
-            take_profit=event.take_profit,
-            take_profits=event.take_profits,
-            stop_loss=event.stop_loss,
-        )
-        bar_time = _format_time(event.bar.timestamp)
-        _print_line(
-            event.timestamp,
-            "BreakoutConfirmed",
-            f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
-        )
-        return True
-    if isinstance(event, BreakoutRejected):
-        bar_time = _format_time(event.bar.timestamp)
-        extras = []
-        if event.reason:
-            extras.append(f"reason={event.reason}")
-        if event.reason == "quote_stale":
-            if event.quote_age_seconds is not None:
-                extras.append(f"age={event.quote_age_seconds:.3f}s")
-            if event.quote_max_age_seconds is not None:
-                extras.append(f"max={event.quote_max_age_seconds:.3f}s")
-        extras.extend(
-            _breakout_tp_sl_parts(
-                take_profit=event.take_profit,
-                take_profits=event.take_profits,
-                stop_loss=event.stop_loss,
-            )
-        )
-        suffix = f" {' '.join(extras)}" if extras else ""
-        _print_line(
-            event.timestamp,
-            "BreakoutRejected",
-            f"{event.symbol} level={event.level} bar={bar_time}{suffix}",
-        )
-        return True
-    if isinstance(event, BreakoutStopped):
-        if event.client_tag and event.reason not in {"order_submitted", "order_submitted_fast"}:
-            _CONFIRMED_BY_TAG.pop(event.client_tag, None)
+def _print_orphan_exit_order_cancel_failed(event: OrphanExitOrderCancelFailed) -> bool:
+    _print_line(
+        event.timestamp,
+        "OrphanExitCancelFailed",
+        (
+            f"{event.symbol} order_id={event.order_id} "
+            f"error={event.error_type} msg={_shorten_message(event.message)}"
+        ),
+    )
+    return True
+
+
+def _print_orphan_exit_reconciliation_completed(event: OrphanExitReconciliationCompleted) -> bool:
+    if event.orphan_count <= 0:
         return False
-    if isinstance(event, OrderIdAssigned):
-        breakout_handled = _handle_breakout_order_id_assigned(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        state = _track_entry_order(
-            order_id=event.order_id,
-            symbol=event.spec.symbol,
-            qty=event.spec.qty,
-            price=event.spec.limit_price,
-        )
-        parts = _lifecycle_parts(
-            symbol=event.spec.symbol,
-            leg="entry",
-            status="assigned",
-            target_qty=state.target_qty if state else float(event.spec.qty),
-            filled_qty=state.filled_qty if state else 0.0,
-            remaining_qty=state.remaining_qty if state else float(event.spec.qty),
-            price=state.price if state else event.spec.limit_price,
-            order_id=event.order_id,
-        )
-        _print_line(event.timestamp, "EntryStatus", " ".join(parts))
-        return True
-    if isinstance(event, OrderStatusChanged):
-        breakout_handled = _handle_breakout_order_status_changed(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        state = _track_entry_order(
-            order_id=event.order_id,
-            symbol=event.spec.symbol,
-            qty=event.spec.qty,
-            price=event.spec.limit_price,
-            status=event.status,
-        )
-        normalized_status = _normalize_order_status(event.status)
-        target_qty = state.target_qty if state else float(event.spec.qty)
-        filled_qty = state.filled_qty if state else 0.0
-        remaining_qty = (
-            state.remaining_qty
-            if state and state.remaining_qty is not None
-            else max(target_qty - filled_qty, 0.0)
-        )
-        parts = _lifecycle_parts(
-            symbol=event.spec.symbol,
-            leg="entry",
-            status=normalized_status,
-            target_qty=target_qty,
-            filled_qty=filled_qty,
-            remaining_qty=remaining_qty,
-            price=event.spec.limit_price,
-            order_id=event.order_id,
-        )
-        _print_line(event.timestamp, "EntryStatus", " ".join(parts))
-        return True
-    if isinstance(event, BracketChildOrderStatusChanged):
-        breakout_handled = _handle_breakout_child_status_changed(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        leg = _leg_from_kind(event.kind)
-        state = _track_child_order(
-            order_id=event.order_id,
-            symbol=event.symbol,
-            kind=event.kind,
-            qty=float(event.qty),
-            price=event.price,
-            status=event.status,
-        )
-        target_qty = state.target_qty if state else float(event.qty)
-        filled_qty = state.filled_qty if state else 0.0
-        remaining_qty = (
-            state.remaining_qty
-            if state and state.remaining_qty is not None
-            else max(target_qty - filled_qty, 0.0)
-        )
-        parts = _lifecycle_parts(
-            symbol=event.symbol,
-            leg=leg,
-            status=_normalize_order_status(event.status),
-            target_qty=target_qty,
-            filled_qty=filled_qty,
-            remaining_qty=remaining_qty,
-            price=event.price,
-            order_id=event.order_id,
-        )
-        _print_line(event.timestamp, "ExitStatus", " ".join(parts))
-        return True
-    if isinstance(event, IbGatewayLog):
-        breakout_handled = _handle_breakout_gateway_log(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        correlated = _format_correlated_gateway_log(event)
-        if correlated is not None:
-            label, message = correlated
-            _print_line(event.timestamp, label, message)
-            return True
-        if _should_hide_gateway_log(event):
-            return False
-        if event.code is None and not event.message:
-            return False
-        label = _gateway_label(event)
-        parts = []
-        message = _gateway_message_for_display(event)
-        if message:
-            max_len = _gateway_message_preview_len(label)
-            parts.append(_shorten_message(message, max_len=max_len))
-        if event.code is not None:
-            parts.append(_format_gateway_code(event.code))
-        if event.req_id is not None and event.req_id >= 0 and (_SHOW_ORDER_IDS or label == "IbError"):
-            parts.append(f"req={event.req_id}")
-        if event.advanced:
-            parts.append("adv")
-        _print_line(event.timestamp, label, " ".join(parts))
-        return True
-    if isinstance(event, BarStreamStalled):
-        _print_line(
-            event.timestamp,
-            "BarStreamStalled",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"silence={event.silence_seconds:.1f}s timeout={event.timeout_seconds:.1f}s"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamRecovered):
-        if not _should_print_bar_stream_info(
-            kind="recovered",
-            symbol=event.symbol,
-            bar_size=event.bar_size,
-            use_rth=event.use_rth,
-        ):
-            return False
-        _print_line(
-            event.timestamp,
-            "BarStreamRecovered",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"downtime={event.downtime_seconds:.1f}s"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamRecoveryStarted):
-        if not _should_print_bar_stream_info(
-            kind="heal",
-            symbol=event.symbol,
-            bar_size=event.bar_size,
-            use_rth=event.use_rth,
-        ):
-            return False
-        _print_line(
-            event.timestamp,
-            "BarStreamHeal",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"attempt={event.attempt}"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamRecoveryFailed):
-        _print_line(
-            event.timestamp,
-            "BarStreamHealFail",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"attempt={event.attempt} retry_in={event.retry_in_seconds:.1f}s "
-                f"msg={_shorten_message(event.message)}"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamCompetingSessionBlocked):
-        _print_line(
-            event.timestamp,
-            "BarStreamBlocked",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"code={event.code} msg={_shorten_message(event.message)}"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamCompetingSessionCleared):
-        _print_line(
-            event.timestamp,
-            "BarStreamUnblocked",
-            (
-                f"{event.symbol} bar={event.bar_size} use_rth={event.use_rth} "
-                f"code={event.code} msg={_shorten_message(event.message)}"
-            ),
-        )
-        return True
-    if isinstance(event, BarStreamRecoveryScanScheduled):
-        _print_line(
-            event.timestamp,
-            "BarStreamScan",
-            f"reason={event.reason} groups={event.groups} streams={event.streams}",
-        )
-        return True
-    if isinstance(event, OrderFilled):
-        breakout_handled = _handle_breakout_order_filled(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        state = _track_entry_order(
-            order_id=event.order_id,
-            symbol=event.spec.symbol,
-            qty=event.spec.qty,
-            price=event.spec.limit_price,
-            status=event.status,
-            filled_qty=event.filled_qty,
-            remaining_qty=event.remaining_qty,
-        )
-        if not _is_fill_event(event.status, event.filled_qty):
-            return False
-        latency_suffix = _entry_fill_latency_suffix(event)
-        target_qty = state.target_qty if state else float(event.spec.qty)
-        filled_qty = state.filled_qty if state and state.filled_qty is not None else (event.filled_qty or 0.0)
-        remaining_qty = (
-            state.remaining_qty
-            if state and state.remaining_qty is not None
-            else event.remaining_qty
-        )
-        status = "filled" if _is_full_fill(event) else "partially_filled"
-        parts = _lifecycle_parts(
-            symbol=event.spec.symbol,
-            leg="entry",
-            status=status,
-            target_qty=target_qty,
-            filled_qty=filled_qty,
-            remaining_qty=remaining_qty,
-            price=event.avg_fill_price,
-            order_id=event.order_id,
-        )
-        if latency_suffix:
-            parts.append(latency_suffix.strip())
-        _print_line(
-            event.timestamp,
-            "EntryFill",
-            " ".join(parts),
-        )
-        return True
-    if isinstance(event, BracketChildOrderBrokerSnapshot):
-        breakout_handled = _handle_breakout_child_snapshot(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        leg = _leg_from_kind(event.kind)
-        _track_child_order(
-            order_id=event.order_id,
-            symbol=event.symbol,
-            kind=event.kind,
-            qty=event.expected_qty,
-            status=event.status,
-        )
-        broker_qty = "-"
-        if event.broker_order_qty is not None:
-            broker_qty = f"{event.broker_order_qty:g}"
-        if event.kind.startswith("det70_"):
-            label = "Det70ChildSnapshot"
-        elif event.kind.startswith("detached_"):
-            label = "DetachedChildSnapshot"
-        else:
-            label = "ChildOrderSnapshot"
-        _print_line(
-            event.timestamp,
-            label,
-            (
-                f"{event.symbol} leg={leg} kind={event.kind}"
-                f"{_optional_order_ref(event.order_id)}{_optional_parent_ref(event.parent_order_id)} "
-                f"expected={event.expected_qty:g} broker={broker_qty} status={event.status or '-'}"
-            ),
-        )
-        return True
-    if isinstance(event, BracketChildQuantityMismatchDetected):
-        breakout_handled = _handle_breakout_child_qty_mismatch(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        leg = _leg_from_kind(event.kind)
-        _track_child_order(
-            order_id=event.order_id,
-            symbol=event.symbol,
-            kind=event.kind,
-            qty=event.expected_qty,
-            status=event.status,
-        )
-        if event.kind.startswith("det70_"):
-            label = "Det70QtyMismatch"
-        elif event.kind.startswith("detached_"):
-            label = "DetachedQtyMismatch"
-        else:
-            label = "ChildQtyMismatch"
-        _print_line(
-            event.timestamp,
-            label,
-            (
-                f"{event.symbol} leg={leg} kind={event.kind}"
-                f"{_optional_order_ref(event.order_id)}{_optional_parent_ref(event.parent_order_id)} "
-                f"expected={event.expected_qty:g} broker={event.broker_order_qty:g} "
-                f"status={event.status or '-'}"
-            ),
-        )
-        return True
-    if isinstance(event, BracketChildOrderFilled):
-        breakout_handled = _handle_breakout_child_filled(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        leg = _leg_from_kind(event.kind)
-        state = _track_child_order(
-            order_id=event.order_id,
-            symbol=event.symbol,
-            kind=event.kind,
-            qty=event.expected_qty if event.expected_qty is not None else float(event.qty),
-            price=event.price,
-            status=event.status,
-            filled_qty=event.filled_qty,
-            remaining_qty=event.remaining_qty,
-        )
-        if not _is_fill_event(event.status, event.filled_qty):
-            return False
-        fill_price = event.avg_fill_price if event.avg_fill_price is not None else event.price
-        target_qty = (
-            state.target_qty
-            if state and state.target_qty is not None
-            else (event.expected_qty if event.expected_qty is not None else float(event.qty))
-        )
-        filled_qty = (
-            state.filled_qty
-            if state and state.filled_qty is not None
-            else (event.filled_qty or 0.0)
-        )
-        remaining_qty = (
-            state.remaining_qty
-            if state and state.remaining_qty is not None
-            else event.remaining_qty
-        )
-        status = "filled"
-        if (
-            target_qty is not None
-            and filled_qty is not None
-            and filled_qty + 1e-9 < target_qty
-        ):
-            status = "partially_filled"
-        broker_suffix = ""
-        if event.expected_qty is not None and event.broker_order_qty is not None:
-            if abs(event.expected_qty - event.broker_order_qty) > 1e-9:
-                broker_suffix = (
-                    f" QTY_MISMATCH expected={event.expected_qty:g} broker={event.broker_order_qty:g}"
-                )
-            else:
-                broker_suffix = f" expected={event.expected_qty:g} broker={event.broker_order_qty:g}"
-        parts = _lifecycle_parts(
-            symbol=event.symbol,
-            leg=leg,
-            status=status,
-            target_qty=target_qty,
-            filled_qty=filled_qty,
-            remaining_qty=remaining_qty,
-            price=fill_price,
-            order_id=event.order_id,
-        )
-        if broker_suffix:
-            parts.append(broker_suffix.strip())
-        _print_line(
-            event.timestamp,
-            "ExitFill",
-            " ".join(parts),
-        )
-        return True
-    if isinstance(event, LadderStopLossReplaced):
-        breakout_handled = _handle_breakout_stop_replaced(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        state = _track_repriced_stop(event)
-        leg = state.leg if state else "sl"
-        target_qty = state.target_qty if state else float(event.new_qty)
-        filled_qty = state.filled_qty if state and state.filled_qty is not None else 0.0
-        remaining_qty = (
-            state.remaining_qty
-            if state and state.remaining_qty is not None
-            else max(float(event.new_qty) - filled_qty, 0.0)
-        )
-        parts = _lifecycle_parts(
-            symbol=event.symbol,
-            leg=leg,
-            status="repriced",
-            target_qty=target_qty,
-            filled_qty=filled_qty,
-            remaining_qty=remaining_qty,
-            price=event.new_price,
-            order_id=event.new_order_id,
-        )
-        parts.append(f"from={event.old_price:g}")
-        parts.append(f"reason={event.reason}")
-        _print_line(
-            event.timestamp,
-            "ExitStatus",
-            " ".join(parts),
-        )
-        return True
-    if isinstance(event, LadderStopLossReplaceFailed):
-        broker = []
-        if event.broker_code is not None:
-            broker.append(f"code={event.broker_code}")
-        if event.broker_message:
-            broker.append(f"msg={_shorten_message(event.broker_message)}")
-        broker_suffix = f" {' '.join(broker)}" if broker else ""
-        if event.execution_mode == "detached70":
-            label = "Det70StopLossReplaceFailed"
-        elif event.execution_mode == "detached":
-            label = "DetachedStopLossReplaceFailed"
-        else:
-            label = "StopLossReplaceFailed"
-        _print_line(
-            event.timestamp,
-            label,
-            (
-                f"{event.symbol}{_optional_order_ref(event.old_order_id)} "
-                f"attempt_qty={event.attempted_qty} attempt_price={event.attempted_price:g} "
-                f"status={event.status or '-'}{broker_suffix}"
-            ),
-        )
-        return True
-    if isinstance(event, LadderProtectionStateChanged):
-        breakout_handled = _handle_breakout_protection_changed(event)
-        if breakout_handled is not None:
-            return breakout_handled
-        tp_ids = ",".join(str(order_id) for order_id in event.active_take_profit_order_ids)
-        if event.execution_mode == "detached70":
-            label = "Det70StopProtection"
-        elif event.execution_mode == "detached":
-            label = "DetachedStopProtection"
-        else:
-            label = "StopProtection"
-        if _SHOW_ORDER_IDS:
-            stop_details = f"stop_order_id={event.stop_order_id} active_tp_ids=[{tp_ids}]"
-        else:
-            stop_details = f"active_tp_count={len(event.active_take_profit_order_ids)}"
-        _print_line(
-            event.timestamp,
-            label,
-            (
-                f"{event.symbol} state={event.state} reason={event.reason} "
-                f"{stop_details}"
-            ),
-        )
-        return True
-    if isinstance(event, LadderStopLossCancelled):
-        if event.execution_mode == "detached70":
-            label = "Det70StopLossCancelled"
-        elif event.execution_mode == "detached":
-            label = "DetachedStopLossCancelled"
-        else:
-            label = "StopLossCancelled"
-        order_ref = _optional_order_ref(event.order_id).strip()
-        order_prefix = f"{order_ref} " if order_ref else ""
-        _print_line(
-            event.timestamp,
-            label,
-            (
-                f"{event.symbol} reason={event.reason} "
-                f"{order_prefix}qty={event.qty} price={event.price:g}"
-            ),
-        )
-        return True
-    if isinstance(event, DetachedProtectionCoverageGapDetected):
-        if _SHOW_ORDER_IDS:
-            stop_details = f"stop_ids={event.stop_order_ids}"
-        else:
-            stop_details = f"stop_count={event.stop_order_count}"
-        _print_line(
-            event.timestamp,
-            "DetachedProtectionGap",
-            (
-                f"{event.symbol} account={event.account or '-'} "
-                f"tag={event.client_tag or '-'} "
-                f"position={_fmt_qty(event.position_qty)} "
-                f"protected={_fmt_qty(event.protected_qty)} "
-                f"uncovered={_fmt_qty(event.uncovered_qty)} "
-                f"{stop_details} trigger={event.trigger} scope={event.scope}"
-            ),
-        )
-        return True
-    if isinstance(event, DetachedProtectionReconciliationCompleted):
-        if event.gap_count <= 0:
-            return False
-        _print_line(
-            event.timestamp,
-            "DetachedProtectionRecon",
-            (
-                f"{event.trigger} {event.scope} "
-                f"active={event.active_order_count} "
-                f"positions={event.position_count} "
-                f"inspected={event.inspected_position_count} "
-                f"covered={event.covered_position_count} "
-                f"gaps={event.gap_count}"
-            ),
-        )
-        return True
-    if isinstance(event, DetachedSessionRestored):
-        tp_count = len(event.active_take_profit_order_ids)
-        if _SHOW_ORDER_IDS:
-            stop_details = f"stop_ids={event.active_stop_order_ids}"
-            tp_details = f"tp_ids={event.active_take_profit_order_ids}"
-        else:
-            stop_details = f"stop_count={len(event.active_stop_order_ids)}"
-            tp_details = f"tp_count={tp_count}"
-        _print_line(
-            event.timestamp,
-            "DetachedSessionRestored",
-            (
-                f"{event.symbol} account={event.account or '-'} "
-                f"tag={event.client_tag or '-'} mode={event.execution_mode} "
-                f"state={event.state} reason={event.reason} "
-                f"position={_fmt_qty(event.position_qty)} "
-                f"protected={_fmt_qty(event.protected_qty)} "
-                f"uncovered={_fmt_qty(event.uncovered_qty)} "
-                f"{tp_details} {stop_details}"
-            ),
-        )
-        return True
-    if isinstance(event, DetachedSessionRestoreCompleted):
-        if event.restored_count <= 0:
-            return False
-        _print_line(
-            event.timestamp,
-            "DetachedSessionRestore",
-            (
-                f"{event.trigger} {event.scope} "
-                f"active={event.active_order_count} "
-                f"positions={event.position_count} "
-                f"inspected={event.inspected_position_count} "
-                f"restored={event.restored_count} "
-                f"protected={event.protected_count} "
-                f"unprotected={event.unprotected_count}"
-            ),
-        )
-        return True
-    if isinstance(event, OrphanExitOrderDetected):
-        _print_line(
-            event.timestamp,
-            "OrphanExitDetected",
-            (
-                f"{event.symbol} order_id={event.order_id} parent={event.parent_order_id} "
-                f"remaining={event.remaining_qty} status={event.status or '-'} "
-                f"action={event.action} trigger={event.trigger} scope={event.scope}"
-            ),
-        )
-        return True
-    if isinstance(event, OrphanExitOrderCancelled):
-        _print_line(
-            event.timestamp,
-            "OrphanExitCancelled",
-            (
-                f"{event.symbol} order_id={event.order_id} "
-                f"status={event.status or '-'} trigger={event.trigger}"
-            ),
-        )
-        return True
-    if isinstance(event, OrphanExitOrderCancelFailed):
-        _print_line(
-            event.timestamp,
-            "OrphanExitCancelFailed",
-            (
-                f"{event.symbol} order_id={event.order_id} "
-                f"error={event.error_type} msg={_shorten_message(event.message)}"
-            ),
-        )
-        return True
-    if isinstance(event, OrphanExitReconciliationCompleted):
-        if event.orphan_count <= 0:
-            return False
-        _print_line(
-            event.timestamp,
-            "OrphanExitRecon",
-            (
-                f"{event.trigger} {event.scope}/{event.action} "
-                f"active={event.active_order_count} pos={event.position_count} "
-                f"orphan={event.orphan_count} cancelled={event.cancelled_count} "
-                f"failed={event.cancel_failed_count}"
-            ),
-        )
-        return True
-    return False
+    _print_line(
+        event.timestamp,
+        "OrphanExitRecon",
+        (
+            f"{event.trigger} {event.scope}/{event.action} "
+            f"active={event.active_order_count} pos={event.position_count} "
+            f"orphan={event.orphan_count} cancelled={event.cancelled_count} "
+            f"failed={event.cancel_failed_count}"
+        ),
+    )
+    return True
+
+
+_EVENT_PRINTERS: dict[type, Callable[[Any], bool]] = {
+    BreakoutStarted: _print_breakout_started,
+    BreakoutBreakDetected: _print_breakout_break_detected,
+    BreakoutFastTriggered: _print_breakout_fast_triggered,
+    BreakoutConfirmed: _print_breakout_confirmed,
+    BreakoutRejected: _print_breakout_rejected,
+    BreakoutStopped: _print_breakout_stopped,
+    OrderIdAssigned: _print_order_id_assigned,
+    OrderStatusChanged: _print_order_status_changed,
+    BracketChildOrderStatusChanged: _print_bracket_child_order_status_changed,
+    IbGatewayLog: _print_ib_gateway_log,
+    BarStreamStalled: _print_bar_stream_stalled,
+    BarStreamRecovered: _print_bar_stream_recovered,
+    BarStreamRecoveryStarted: _print_bar_stream_recovery_started,
+    BarStreamRecoveryFailed: _print_bar_stream_recovery_failed,
+    BarStreamCompetingSessionBlocked: _print_bar_stream_competing_session_blocked,
+    BarStreamCompetingSessionCleared: _print_bar_stream_competing_session_cleared,
+    BarStreamRecoveryScanScheduled: _print_bar_stream_recovery_scan_scheduled,
+    OrderFilled: _print_order_filled,
+    BracketChildOrderBrokerSnapshot: _print_bracket_child_order_broker_snapshot,
+    BracketChildQuantityMismatchDetected: _print_bracket_child_quantity_mismatch_detected,
+    BracketChildOrderFilled: _print_bracket_child_order_filled,
+    LadderStopLossReplaced: _print_ladder_stop_loss_replaced,
+    LadderStopLossReplaceFailed: _print_ladder_stop_loss_replace_failed,
+    LadderProtectionStateChanged: _print_ladder_protection_state_changed,
+    LadderStopLossCancelled: _print_ladder_stop_loss_cancelled,
+    DetachedProtectionCoverageGapDetected: _print_detached_protection_coverage_gap_detected,
+    DetachedProtectionReconciliationCompleted: _print_detached_protection_reconciliation_completed,
+    DetachedSessionRestored: _print_detached_session_restored,
+    DetachedSessionRestoreCompleted: _print_detached_session_restore_completed,
+    OrphanExitOrderDetected: _print_orphan_exit_order_detected,
+    OrphanExitOrderCancelled: _print_orphan_exit_order_cancelled,
+    OrphanExitOrderCancelFailed: _print_orphan_exit_order_cancel_failed,
+    OrphanExitReconciliationCompleted: _print_orphan_exit_reconciliation_completed,
+}
 
 
 def _format_tp_list(levels: list[float]) -> str:
-    return "[" + ",".join(f"{level:g}" for level in levels) + "]"
+    return _format_tp_levels(tuple(levels))
+
+
+# Ladders repeat across events for one breakout; bounded since levels are arbitrary floats.
+@functools.lru_cache(maxsize=256)
+def _format_tp_levels(levels: tuple[float, ...]) -> str:
+    return "[" + ",".join(map("{:g}".format, levels)) + "]"
 
 
 def _breakout_tp_sl_parts(
@@ -1113,6 +1243,8 @@ def _optional_parent_ref(parent_order_id: Optional[int]) -> str:
     return f" parent={parent_order_id}"
 
 
+# Bracket kinds come from a small fixed vocabulary; bounded since the broker supplies them.
+@functools.lru_cache(maxsize=256)
 def _leg_from_kind(kind: str) -> str:
     normalized = str(kind or "").strip().lower()
     if not normalized:
@@ -1136,28 +1268,16 @@ def _leg_from_kind(kind: str) -> str:
     return normalized
 
 
+# Broker status strings repeat on every update; bounded since the broker supplies them.
+@functools.lru_cache(maxsize=256)
 def _normalize_order_status(status: Optional[str]) -> str:
     if not status:
         return "-"
     compact = str(status).strip().lower().replace(" ", "").replace("_", "")
-    mapping = {
-        "pendingsubmit": "pending",
-        "presubmitted": "pending",
-        "submitted": "submitted",
-        "apipending": "pending",
-        "partiallyfilled": "partially_filled",
-        "filled": "filled",
-        "pendingcancel": "cancel_pending",
-        "cancelled": "cancelled",
-        "apicancelled": "cancelled",
-        "inactive": "inactive",
-        "rejected": "rejected",
-        "assigned": "assigned",
-        "repriced": "repriced",
-    }
-    if compact in mapping:
-        return mapping[compact]
-    return str(status).strip().lower().replace(" ", "_")
+    normalized = _ORDER_STATUS_ALIASES.get(compact)
+    if normalized is None:
+        normalized = str(status).strip().lower().replace(" ", "_")
+    return normalized
 
 
 def _extract_reject_reason(message: str) -> str:
@@ -1781,7 +1901,11 @@ def _print_line(timestamp, label: str, message: str) -> None:
 
 
 def _format_time(timestamp) -> str:
-    return timestamp.strftime("%H:%M:%S.%f")[:-4]
+    # Same text as strftime("%H:%M:%S.%f")[:-4] without the format parse.
+    return (
+        f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+        f".{timestamp.microsecond // 10000:02d}"
+    )
 
 
 def _is_fill_event(status: Optional[str], filled_qty: Optional[float]) -> bool:
@@ -1789,8 +1913,7 @@ def _is_fill_event(status: Optional[str], filled_qty: Optional[float]) -> bool:
         return True
     if not status:
         return False
-    normalized = str(status).strip().lower()
-    return normalized in {"filled", "partiallyfilled", "partially_filled"}
+    return str(status).strip().lower() in _FILL_STATUSES
 
 
 def _entry_fill_latency_suffix(event: OrderFilled) -> str:
@@ -1813,10 +1936,8 @@ def _entry_fill_latency_suffix(event: OrderFilled) -> str:
 
 
 def _is_full_fill(event: OrderFilled) -> bool:
-    if event.status:
-        normalized = str(event.status).strip().lower()
-        if normalized == "filled":
-            return True
+    if event.status and _normalize_order_status(event.status) == "filled":
+        return True
     if event.filled_qty is None:
         return False
     return event.filled_qty >= event.spec.qty
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -63,18 +64,10 @@ class OrderTracker:
         if not rows:
             return []
         headers = ["id", "side", "symbol", "qty", "type", "limit", "status"]
-        widths = [len(label) for label in headers]
-        for row in rows:
-            for idx, value in enumerate(row):
-                widths[idx] = max(widths[idx], len(value))
-        header = " | ".join(label.ljust(widths[idx]) for idx, label in enumerate(headers))
+        widths = [max(map(len, column)) for column in zip(headers, *rows)]
+        row_format = " | ".join(f"{{:<{width}}}" for width in widths)
         divider = "-+-".join("-" * width for width in widths)
-        lines = [header, divider]
-        for row in rows:
-            lines.append(
-                " | ".join(value.ljust(widths[idx]) for idx, value in enumerate(row))
-            )
-        return lines
+        return [row_format.format(*headers), divider, *itertools.starmap(row_format.format, rows)]
 
     def get_order_record(self, order_id: int) -> Optional[OrderRecord]:
         return self._orders.get(order_id)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import math
 from typing import Optional
 
@@ -82,13 +83,8 @@ def _as_finite_float(value: Optional[float]) -> Optional[float]:
 def _format_simple_table(headers: list[str], rows: list[list[str]]) -> list[str]:
     if not rows:
         return []
-    widths = [len(label) for label in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(value))
-    header = " | ".join(label.ljust(widths[idx]) for idx, label in enumerate(headers))
+    widths = [max(map(len, column)) for column in zip(headers, *rows)]
+    # One str.format per row instead of a per-cell ljust generator.
+    row_format = " | ".join(f"{{:<{width}}}" for width in widths)
     divider = "-+-".join("-" * width for width in widths)
-    lines = [header, divider]
-    for row in rows:
-        lines.append(" | ".join(value.ljust(widths[idx]) for idx, value in enumerate(row)))
-    return lines
+    return [row_format.format(*headers), divider, *itertools.starmap(row_format.format, rows)]
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import functools
+import itertools
 import json
+import math
+import operator
 import os
-import re
 import signal
 import shlex
+import socket
 import sys
-import traceback
-import webbrowser
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Awaitable, Callable, Optional
+from types import MappingProxyType
+from typing import Awaitable, Callable, Iterable, Mapping, Optional, Sequence
 
 try:
     import readline
 except ImportError:
     readline = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from apps.adapters.broker._ib_client import MarketOrder, Stock
 from apps.adapters.broker._ib_compat import what_if_order
 
@@ -61,6 +73,9 @@ from apps.core.positions.models import PositionSnapshot
 from apps.core.positions.service import PositionsService
 from apps.core.strategies.breakout.logic import BreakoutRuleConfig, FastEntryConfig
 from apps.core.strategies.breakout.policy import (
+    DETACHED70_RATIOS,
+    TP_LADDER_BELOW_STOP,
+    check_take_profit_ladder as _core_check_take_profit_ladder,
     default_take_profit_ratios as _core_default_take_profit_ratios,
     expected_detached70_qtys as _core_expected_detached70_qtys,
     infer_ladder_execution_mode as _core_infer_ladder_execution_mode,
@@ -69,13 +84,31 @@ from apps.core.strategies.breakout.policy import (
     parse_take_profit_ratios as _core_parse_take_profit_ratios,
     split_qty_by_ratios as _core_split_qty_by_ratios,
     validate_ladder_execution_mode as _core_validate_ladder_execution_mode,
-    validate_take_profit_levels as _core_validate_take_profit_levels,
 )
 from apps.core.strategies.breakout.runner import BreakoutRunConfig, run_breakout
 
 CommandHandler = Callable[[list[str], dict[str, str]], Awaitable[None]]
 _BREAKOUT_STATE_VERSION = 1
-_TP_MODE_TOKEN = re.compile(r"^tp-(1|2|3)$", re.IGNORECASE)
+_BREAKOUT_JOURNAL_COMPACT_THRESHOLD = 64
+# Mutations inside this window (e.g. resuming N watchers) land in one write.
+_BREAKOUT_STATE_FLUSH_DELAY_SECONDS = 0.05
+_TP_MODE_COUNTS = {"tp-1": 1, "tp-2": 2, "tp-3": 3}
+_AUTO_TP_COUNTS = frozenset({1, 2, 3})
+_TP_LADDER_SIZES = frozenset({2, 3})
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "y", "on"})
+_PENDING_TOKENS = frozenset({"pending", "--pending"})
+_PENDING_TOKEN_LENGTHS = frozenset(map(len, _PENDING_TOKENS))
+_WHAT_IF_REJECTED_STATUSES = frozenset({"inactive", "cancelled", "apicancelled", "rejected"})
+# Quotes and escapes need shlex; the rest are ASCII whitespace that str.split()
+# breaks on but shlex does not.
+_SHLEX_SENSITIVE_CHARS = frozenset("'\"\\\x0b\x0c\x1c\x1d\x1e\x1f")
+_STDIN_READ_LIMIT_BYTES = 64 * 1024
+_PORT_PROBE_INITIAL_DELAY_SECONDS = 0.01
+_PORT_PROBE_MAX_DELAY_SECONDS = 0.25
+_ORDER_SCOPE_ALIASES = {"client": "client", "all_clients": "all_clients", "all-clients": "all_clients"}
+_FILL_STATUSES = frozenset({"filled", "partiallyfilled", "partially_filled"})
+# Exact spellings the broker and event log use, checked before normalizing.
+_FILL_STATUS_SPELLINGS = _FILL_STATUSES | {"Filled", "PartiallyFilled"}
 _TRADE_BLOCKING_WARNING_TERMS = (
     "not eligible",
     "not allowed",
@@ -130,7 +163,105 @@ class _BreakoutTradesSession:
     issues: list[str] = field(default_factory=list)
 
 
+@dataclass
+class _TradesLogCache:
+    path: str
+    day: date
+    inode: int
+    # Byte offset just past the last newline-terminated line already scanned.
+    offset: int = 0
+    records: list[tuple[str, dict]] = field(default_factory=list)
+
+
+class _AdoptedProcess:
+    """PnL server started by an earlier CLI image (e.g. before `refresh`), tracked by pid."""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self._returncode: Optional[int] = None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        if self._returncode is None:
+            self._returncode = _pid_exit_status(self.pid)
+        return self._returncode
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
+    async def wait(self) -> int:
+        while self.returncode is None:
+            await asyncio.sleep(0.05)
+        return self._returncode
+
+    def _signal(self, signum: int) -> None:
+        try:
+            os.kill(self.pid, signum)
+        except ProcessLookupError:
+            pass
+
+
+class _CachedConfigView:
+    """Read view over the REPL config that memoizes parsed values per config version."""
+
+    def __init__(self, config: dict[str, str]) -> None:
+        self._config = config
+        # Kept sorted on insert so `show config` and completion never re-sort.
+        self._sorted_keys = sorted(config)
+        self._version = 0
+        self._parsed: dict[tuple[str, Callable[[str], object]], object] = {}
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: str) -> Optional[str]:
+        return self._config.get(key)
+
+    def sorted_keys(self) -> list[str]:
+        return self._sorted_keys
+
+    def set(self, key: str, value: str) -> None:
+        if key not in self._config:
+            bisect.insort(self._sorted_keys, key)
+        self._config[key] = value
+        self._version += 1
+        self._parsed.clear()
+
+    def parsed(self, key: str, parser: Callable[[str], object]) -> object:
+        # Parse failures are cached too and re-raised as ValueError on every lookup.
+        cache_key = (key, parser)
+        if cache_key in self._parsed:
+            value = self._parsed[cache_key]
+        else:
+            raw = self._config.get(key)
+            if raw is None:
+                value = None
+            else:
+                try:
+                    value = parser(raw)
+                except ValueError as exc:
+                    value = exc
+            self._parsed[cache_key] = value
+        if isinstance(value, ValueError):
+            raise ValueError(*value.args)
+        return value
+
+
 @dataclass(frozen=True)
+class _OptionField:
+    name: str
+    kwarg_keys: tuple[str, ...]
+    config_keys: tuple[str, ...]
+    default: object = None
+    parser: Callable[[str], object] = str
+    error: str = ""
+
+
+@dataclass(frozen=True, slots=True)
 class CommandSpec:
     name: str
     handler: CommandHandler
@@ -175,7 +306,13 @@ class REPL:
         self._event_bus = event_bus
         self._ops_logger = ops_logger
         self._prompt = prompt
+        self._stdin_reader: Optional[asyncio.StreamReader] = None
+        self._stdin_reader_resolved = False
+        # Flex ingestion gets its own worker so a long CSV import never competes with
+        # the default pool that serves stdin and the other blocking calls.
+        self._ingest_executor = _new_ingest_executor()
         self._config: dict[str, str] = dict(initial_config or {})
+        self._cfg = _CachedConfigView(self._config)
         self._account_defaults = {
             key: value.strip()
             for key, value in (account_defaults or {}).items()
@@ -188,18 +325,40 @@ class REPL:
             if resolved_state_path
             else None
         )
+        self._breakout_journal_path = (
+            self._breakout_state_path.with_name(f"{self._breakout_state_path.name}.journal")
+            if self._breakout_state_path
+            else None
+        )
+        self._breakout_journal_entries = 0
+        self._breakout_journal_synced = False
+        self._breakout_journal_pending: list[str] = []
+        # Breakout entries in the snapshot on disk, to skip identical rewrites.
+        self._breakout_state_saved_entries: Optional[list[dict[str, object]]] = None
+        self._breakout_state_flush_handle: Optional[asyncio.TimerHandle] = None
         self._suspend_breakout_state_updates = False
         self._commands: dict[str, CommandSpec] = {}
         self._aliases: dict[str, str] = {}
+        # Names and aliases in one table so resolving a command is a single lookup.
+        self._command_lookup: dict[str, CommandSpec] = {}
+        # Completion reads this on every keystroke; rebuilt only when a command registers.
+        self._sorted_command_names: Optional[list[str]] = None
+        self._help_lines: Optional[list[str]] = None
         self._should_exit = False
         self._breakout_tasks: dict[str, tuple[BreakoutRunConfig, asyncio.Task]] = {}
+        self._breakout_task_names_by_symbol: dict[str, set[str]] = {}
         self._session_phase_prewarm_tasks: dict[str, asyncio.Task] = {}
-        self._pnl_processes: dict[str, asyncio.subprocess.Process] = {}
+        self._pnl_processes: dict[str, asyncio.subprocess.Process | _AdoptedProcess] = {}
+        resolved_pnl_processes_path = _resolve_pnl_processes_path()
+        self._pnl_processes_path = (
+            Path(os.path.expanduser(resolved_pnl_processes_path))
+            if resolved_pnl_processes_path
+            else None
+        )
+        self._pnl_process_records: dict[str, dict[str, object]] = {}
+        self._trades_log_cache: Optional[_TradesLogCache] = None
         orphan_scope = os.getenv("APPS_ORPHAN_EXIT_SCOPE", "all_clients").strip().lower()
-        orphan_scope = orphan_scope.replace("-", "_")
-        if orphan_scope not in {"client", "all_clients"}:
-            orphan_scope = "all_clients"
-        self._orphan_exit_scope = orphan_scope
+        self._orphan_exit_scope = _ORDER_SCOPE_ALIASES.get(orphan_scope, "all_clients")
         orphan_action = os.getenv("APPS_ORPHAN_EXIT_ACTION", "warn").strip().lower()
         if orphan_action not in {"warn", "cancel"}:
             orphan_action = "warn"
@@ -210,6 +369,11 @@ class REPL:
         self._detached_session_restore_scope = self._orphan_exit_scope
         self._detached_session_restore_lock = asyncio.Lock()
         self._completion_matches: list[str] = []
+        self._order_subcommands: dict[str, CommandHandler] = {
+            "cancel": self._cmd_order_cancel,
+            "replace": self._cmd_order_replace,
+            "broker": self._cmd_order_broker,
+        }
         self._register_commands()
         self._setup_readline()
 
@@ -217,7 +381,7 @@ class REPL:
         print("Apps CLI (type 'help' to list commands).")
         while not self._should_exit:
             try:
-                line = await asyncio.to_thread(input, self._prompt)
+                line = await self._read_line(self._prompt)
             except EOFError:
                 print()
                 break
@@ -242,6 +406,43 @@ class REPL:
             await self._run_command_interruptibly(spec, args, kwargs, line)
         await self._stop_pnl_processes()
         await self._stop_breakouts(persist=True)
+        self._flush_pending_breakout_state()
+        self._ingest_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _read_line(self, prompt: str) -> str:
+        reader = await self._piped_stdin_reader()
+        if reader is None:
+            return await asyncio.to_thread(input, prompt)
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        try:
+            raw = await reader.readline()
+        except ValueError:
+            print(f"Input line exceeds {_STDIN_READ_LIMIT_BYTES} bytes; ignored.")
+            return ""
+        if not raw:
+            raise EOFError
+        return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    async def _piped_stdin_reader(self) -> Optional[asyncio.StreamReader]:
+        # Scripted (piped) input is read on the loop instead of one thread hop per
+        # line. A TTY keeps input() so readline editing, history and completion work.
+        if self._stdin_reader_resolved:
+            return self._stdin_reader
+        self._stdin_reader_resolved = True
+        try:
+            if sys.stdin.isatty():
+                return None
+            reader = asyncio.StreamReader(limit=_STDIN_READ_LIMIT_BYTES)
+            await asyncio.get_running_loop().connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader),
+                sys.stdin,
+            )
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            # Regular files, Windows consoles and replaced stdin objects fall back to input().
+            return None
+        self._stdin_reader = reader
+        return reader
 
     async def _run_command_interruptibly(
         self,
@@ -303,7 +504,7 @@ class REPL:
         if await self._wait_for_task_completion(command_task, timeout=0.75):
             return
 
-        if self._connection.status().get("connected"):
+        if self._connection.is_connected():
             print("Interrupt: forcing broker disconnect to release pending command...")
             self._connection.disconnect()
 
@@ -556,8 +757,14 @@ class REPL:
 
     def _register(self, spec: CommandSpec) -> None:
         self._commands[spec.name] = spec
+        self._command_lookup[spec.name] = spec
         for alias in spec.aliases:
             self._aliases[alias] = spec.name
+            # A command's own name always wins over another command's alias.
+            if alias not in self._commands:
+                self._command_lookup[alias] = spec
+        self._sorted_command_names = None
+        self._help_lines = None
 
     def _setup_readline(self) -> None:
         if readline is None:
@@ -580,21 +787,22 @@ class REPL:
         line = readline.get_line_buffer()
         begidx = readline.get_begidx()
         if not line[:begidx].strip():
-            return _match_prefix(text, self._command_names())
+            return _match_sorted_prefix(text, self._command_names())
         try:
             parts = shlex.split(line)
         except ValueError:
             parts = line.strip().split()
         if not parts:
-            return _match_prefix(text, self._command_names())
+            return _match_sorted_prefix(text, self._command_names())
         cmd_name = parts[0].lower()
         if cmd_name in {"help", "commands", "?"}:
-            return _match_prefix(text, self._command_names())
+            return _match_sorted_prefix(text, self._command_names())
         return _match_prefix(text, self._completion_candidates(cmd_name))
 
     def _command_names(self) -> list[str]:
-        names = set(self._commands) | set(self._aliases)
-        return sorted(names)
+        if self._sorted_command_names is None:
+            self._sorted_command_names = sorted(set(self._commands) | set(self._aliases))
+        return self._sorted_command_names
 
     def _completion_candidates(self, command: str) -> list[str]:
         spec = self._resolve_command(command)
@@ -676,23 +884,22 @@ class REPL:
         if name == "show":
             return ["config"]
         if name == "set":
-            return [f"{key}=" for key in sorted(self._config)]
+            return [f"{key}=" for key in self._cfg.sorted_keys()]
         return []
 
     def _resolve_command(self, name: str) -> Optional[CommandSpec]:
-        if name in self._commands:
-            return self._commands[name]
-        target = self._aliases.get(name)
-        if target:
-            return self._commands.get(target)
-        return None
+        return self._command_lookup.get(name)
 
     def _parse_line(self, line: str) -> tuple[Optional[str], list[str], dict[str, str]]:
-        try:
-            tokens = shlex.split(line)
-        except ValueError as exc:
-            print(f"Parse error: {exc}")
-            return None, [], {}
+        if line.isascii() and _SHLEX_SENSITIVE_CHARS.isdisjoint(line):
+            # Nothing for shlex to unquote or escape: a plain split gives the same tokens.
+            tokens = line.split()
+        else:
+            try:
+                tokens = shlex.split(line)
+            except ValueError as exc:
+                print(f"Parse error: {exc}")
+                return None, [], {}
         if not tokens:
             return None, [], {}
         cmd_name = tokens[0].lower()
@@ -703,22 +910,23 @@ class REPL:
         args: list[str] = []
         kwargs: dict[str, str] = {}
         aliases = _flag_aliases(command)
+        normalize_key = _normalize_key
+        token_count = len(tokens)
         idx = 0
-        while idx < len(tokens):
+        while idx < token_count:
             token = tokens[idx]
-            if token.startswith("--"):
-                key, value, consumed = _parse_long_flag(token, tokens, idx)
-                if key:
-                    kwargs[_normalize_key(key, aliases)] = value
-                idx += consumed
-                continue
-            if token.startswith("-") and token != "-":
-                consumed = _parse_short_flag(token, tokens, idx, aliases, kwargs)
+            if token[:1] == "-" and token != "-":
+                if token[1:2] == "-":
+                    key, value, consumed = _parse_long_flag(token, tokens, idx)
+                    if key:
+                        kwargs[normalize_key(key, aliases)] = value
+                else:
+                    consumed = _parse_short_flag(token, tokens, idx, aliases, kwargs)
                 idx += consumed
                 continue
-            if "=" in token:
-                key, value = token.split("=", 1)
-                kwargs[_normalize_key(key, aliases)] = value
+            key, sep, value = token.partition("=")
+            if sep:
+                kwargs[normalize_key(key, aliases)] = value
             else:
                 args.append(token)
             idx += 1
@@ -735,9 +943,10 @@ class REPL:
             print(f"Usage: {spec.usage}")
             return
 
-        specs = sorted(self._commands.values(), key=lambda s: s.name)
-        for spec in specs:
-            print(f"{spec.name:<10} {spec.help}")
+        if self._help_lines is None:
+            specs = sorted(self._commands.values(), key=lambda s: s.name)
+            self._help_lines = [f"{spec.name:<10} {spec.help}" for spec in specs]
+        _print_lines(self._help_lines)
 
     async def _cmd_clear(self, _args: list[str], _kwargs: dict[str, str]) -> None:
         if os.name == "nt":
@@ -799,7 +1008,7 @@ class REPL:
             return
         current = (self._config.get("account") or "").strip()
         if not current or current in self._account_default_values:
-            self._config["account"] = target
+            self._cfg.set("account", target)
 
     async def _cmd_buy(self, args: list[str], kwargs: dict[str, str]) -> None:
         await self._submit_order(OrderSide.BUY, args, kwargs)
@@ -808,14 +1017,14 @@ class REPL:
         await self._submit_order(OrderSide.SELL, args, kwargs)
 
     async def _cmd_can_trade(self, args: list[str], kwargs: dict[str, str]) -> None:
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before checking symbols.")
             return
 
         symbols = _parse_symbol_tokens(
             args=args,
             symbol_value=kwargs.get("symbol") or kwargs.get("symbols"),
-            default_symbol=_config_get(self._config, "symbol"),
+            default_symbol=self._cfg.get("symbol"),
         )
         if not symbols:
             print(self._commands["can-trade"].usage)
@@ -837,12 +1046,12 @@ class REPL:
             print("qty must be greater than zero")
             return
 
-        tif = (kwargs.get("tif") or _config_get(self._config, "tif") or "DAY").strip().upper()
-        outside_rth_value = kwargs.get("outside_rth") or _config_get(self._config, "outside_rth")
+        tif = (kwargs.get("tif") or self._cfg.get("tif") or "DAY").strip().upper()
+        outside_rth_value = kwargs.get("outside_rth") or self._cfg.get("outside_rth")
         outside_rth = _parse_bool(outside_rth_value) if outside_rth_value is not None else False
         exchange = (kwargs.get("exchange") or "SMART").strip().upper()
         currency = (kwargs.get("currency") or "USD").strip().upper()
-        account = kwargs.get("account") or _config_get(self._config, "account")
+        account = kwargs.get("account") or self._cfg.get("account")
         timeout = max(self._connection.config.timeout, 1.0)
 
         account_label = account if account else "(default)"
@@ -938,7 +1147,7 @@ class REPL:
             return False, warning
 
         normalized_status = status.lower()
-        if normalized_status in {"inactive", "cancelled", "apicancelled", "rejected"}:
+        if normalized_status in _WHAT_IF_REJECTED_STATUSES:
             if warning:
                 return False, f"{status}: {warning}"
             return False, f"what-if status={status}"
@@ -958,7 +1167,7 @@ class REPL:
         if not self._bar_stream or not self._order_service:
             print("Breakout not configured.")
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before starting a breakout watcher.")
             return
         if args:
@@ -976,7 +1185,7 @@ class REPL:
                 seen: set[str] = set()
                 for token in cancel_tokens:
                     for raw_symbol in token.split(","):
-                        symbol = raw_symbol.strip().upper()
+                        symbol = _normalize_symbol_key(raw_symbol)
                         if not symbol:
                             continue
                         if symbol == "ALL":
@@ -993,7 +1202,7 @@ class REPL:
                     await self._stop_breakouts(symbol=symbol)
                 return
 
-        symbol = args[0] if args else kwargs.get("symbol") or _config_get(self._config, "symbol")
+        symbol = args[0] if args else kwargs.get("symbol") or self._cfg.get("symbol")
         if not symbol:
             print(self._commands["breakout"].usage)
             return
@@ -1018,8 +1227,8 @@ class REPL:
                     print(self._commands["breakout"].usage)
                     return
 
-        level_raw = kwargs.get("level") or positional_level or _config_get(self._config, "level")
-        qty_raw = kwargs.get("qty") or positional_qty or _config_get(self._config, "qty")
+        level_raw = kwargs.get("level") or positional_level or self._cfg.get("level")
+        qty_raw = kwargs.get("qty") or positional_qty or self._cfg.get("qty")
         if level_raw is None or qty_raw is None:
             print(self._commands["breakout"].usage)
             return
@@ -1040,17 +1249,17 @@ class REPL:
             print("qty must be greater than zero")
             return
 
-        tp_raw = kwargs.get("tp") or positional_tp or _config_get(self._config, "tp")
-        sl_raw = kwargs.get("sl") or positional_sl or _config_get(self._config, "sl")
+        tp_raw = kwargs.get("tp") or positional_tp or self._cfg.get("tp")
+        sl_raw = kwargs.get("sl") or positional_sl or self._cfg.get("sl")
         tp_count_kw = kwargs.get("tp_count")
         tp_alloc_kw = kwargs.get("tp_alloc")
         tp_exec_kw = kwargs.get("tp_exec") or kwargs.get("ladder_exec")
-        tp_count_raw = tp_count_kw or _config_get(self._config, "tp_count")
-        tp_alloc_raw = tp_alloc_kw or _config_get(self._config, "tp_alloc")
+        tp_count_raw = tp_count_kw or self._cfg.get("tp_count")
+        tp_alloc_raw = tp_alloc_kw or self._cfg.get("tp_alloc")
         tp_exec_raw = (
             tp_exec_kw
-            or _config_get(self._config, "tp_exec")
-            or _config_get(self._config, "ladder_exec")
+            or self._cfg.get("tp_exec")
+            or self._cfg.get("ladder_exec")
         )
         tp_exec_explicit = tp_exec_kw is not None and str(tp_exec_kw).strip() != ""
 
@@ -1087,6 +1296,7 @@ class REPL:
         take_profits = None
         take_profit_qtys = None
         stop_loss = None
+        tp_is_auto = False
         if tp_raw is not None or sl_raw is not None:
             if tp_raw is None or sl_raw is None:
                 print("tp and sl must be provided together")
@@ -1101,13 +1311,13 @@ class REPL:
                 return
 
             tp_text = str(tp_raw).strip()
-            tp_text_lower = tp_text.lower()
-            if tp_text_lower == "auto":
+            tp_is_auto = tp_text.lower() == "auto"
+            if tp_is_auto:
                 if not self._tp_service:
                     print("TP service not configured.")
                     return
                 tp_count = _coerce_int(tp_count_raw) if tp_count_raw is not None else 3
-                if tp_count not in {1, 2, 3}:
+                if tp_count not in _AUTO_TP_COUNTS:
                     print("tp_count must be 1, 2, or 3 when tp=auto")
                     return
             elif "-" in tp_text:
@@ -1127,76 +1337,32 @@ class REPL:
                     print("tp must be a number")
                     return
 
-        bar_size = (
-            kwargs.get("bar")
-            or kwargs.get("bar_size")
-            or _config_get(self._config, "bar_size")
-            or "1 min"
-        )
-        fast_value = kwargs.get("fast") or _config_get(self._config, "fast")
-        fast_enabled = _parse_bool(fast_value) if fast_value is not None else True
-        fast_bar_size = (
-            kwargs.get("fast_bar")
-            or _config_get(self._config, "fast_bar")
-            or "1 secs"
-        )
-        use_rth_value = kwargs.get("rth") or kwargs.get("use_rth") or _config_get(self._config, "use_rth")
-        use_rth = _parse_bool(use_rth_value) if use_rth_value is not None else False
-        outside_rth_value = kwargs.get("outside_rth") or _config_get(self._config, "outside_rth")
-        if outside_rth_value is None:
+        options = self._resolve_options(kwargs, _BREAKOUT_OPTION_FIELDS)
+        if options is None:
+            return
+        bar_size = options["bar_size"]
+        use_rth = options["use_rth"]
+        outside_rth = options["outside_rth"]
+        if outside_rth is None:
             outside_rth = not use_rth
-        else:
-            outside_rth = _parse_bool(outside_rth_value)
-        tif = kwargs.get("tif") or _config_get(self._config, "tif") or "DAY"
-        account = kwargs.get("account") or _config_get(self._config, "account")
-        entry_raw = (
-            kwargs.get("entry")
-            or kwargs.get("entry_type")
-            or _config_get(self._config, "entry")
-        )
-        entry_type = OrderType.LIMIT
-        if entry_raw is not None:
-            try:
-                entry_type = _parse_entry_type(entry_raw)
-            except ValueError:
-                print("entry must be 'limit' (lmt) or 'market' (mkt)")
-                return
+        entry_type = options["entry_type"]
         if entry_type == OrderType.LIMIT and not self._quote_port and not self._quote_stream:
             print("limit entry requires quote_port or quote_stream to be configured")
             return
+        tuning_options = self._resolve_options(kwargs, _BREAKOUT_TUNING_OPTION_FIELDS)
+        if tuning_options is None:
+            return
+        options.update(tuning_options)
 
-        max_bars_raw = kwargs.get("max_bars") or _config_get(self._config, "max_bars")
-        max_bars = None
-        if max_bars_raw is not None:
-            try:
-                max_bars = int(max_bars_raw)
-            except ValueError:
-                print("max_bars must be an integer")
-                return
-
-        quote_age_raw = (
-            kwargs.get("quote_age")
-            or kwargs.get("quote_max_age")
-            or _config_get(self._config, "quote_age")
-            or _config_get(self._config, "quote_max_age")
-        )
-        quote_max_age_seconds = 2.0
-        if quote_age_raw is not None:
-            try:
-                quote_max_age_seconds = float(quote_age_raw)
-            except ValueError:
-                print("quote_age must be a number (seconds)")
-                return
-
-        symbol = symbol.strip().upper()
+        symbol = _normalize_symbol_key(symbol)
         if not symbol:
             print(self._commands["breakout"].usage)
             return
 
         if tp_raw is not None or sl_raw is not None:
-            if str(tp_raw).strip().lower() == "auto":
+            if tp_is_auto:
                 tp_count = _coerce_int(tp_count_raw) if tp_count_raw is not None else 3
-                if tp_count is None or tp_count not in {1, 2, 3}:
+                if tp_count is None or tp_count not in _AUTO_TP_COUNTS:
                     print("tp_count must be 1, 2, or 3 when tp=auto")
                     return
                 try:
@@ -1215,12 +1381,13 @@ class REPL:
                     print(f"TP calculation returned only {len(result.levels)} level(s); need {tp_count}.")
                     return
                 resolved_levels = [level_obj.price for level_obj in result.levels[:tp_count]]
-                if not _validate_take_profit_levels(resolved_levels):
-                    print("auto TP levels are not strictly increasing positive prices")
-                    return
-                if resolved_levels[0] <= stop_loss:
+                ladder_error = _check_take_profit_ladder(resolved_levels, stop_loss=stop_loss)
+                if ladder_error == TP_LADDER_BELOW_STOP:
                     print("auto TP levels must be above stop loss")
                     return
+                if ladder_error is not None:
+                    print("auto TP levels are not strictly increasing positive prices")
+                    return
                 if tp_count == 1:
                     take_profit = resolved_levels[0]
                     take_profits = None
@@ -1247,15 +1414,16 @@ class REPL:
                         print("tp must be above stop loss")
                         return
                 if take_profits:
-                    if len(take_profits) not in {2, 3}:
+                    if len(take_profits) not in _TP_LADDER_SIZES:
                         print("tp ladder must include 2 or 3 levels")
                         return
-                    if not _validate_take_profit_levels(take_profits):
-                        print("tp ladder levels must be strictly increasing and greater than zero")
-                        return
-                    if take_profits[0] <= stop_loss:
+                    ladder_error = _check_take_profit_ladder(take_profits, stop_loss=stop_loss)
+                    if ladder_error == TP_LADDER_BELOW_STOP:
                         print("tp ladder levels must be above stop loss")
                         return
+                    if ladder_error is not None:
+                        print("tp ladder levels must be strictly increasing and greater than zero")
+                        return
                     if tp_alloc_raw is not None:
                         ratios = _parse_take_profit_ratios(tp_alloc_raw, len(take_profits))
                         if ratios is None:
@@ -1310,23 +1478,29 @@ class REPL:
                 if ratios is None:
                     print("tp_alloc must be 70-30 when tp_exec=detached70")
                     return
-                if abs(ratios[0] - 0.7) > 1e-9 or abs(ratios[1] - 0.3) > 1e-9:
+                if any(
+                    abs(ratio - expected) > 1e-9
+                    for ratio, expected in zip(ratios, DETACHED70_RATIOS)
+                ):
                     print("tp_alloc must be exactly 70-30 when tp_exec=detached70")
                     return
             try:
-                take_profit_qtys = _split_qty_by_ratios(qty, [0.7, 0.3])
+                take_profit_qtys = _split_qty_by_ratios(qty, DETACHED70_RATIOS)
             except ValueError as exc:
                 print(f"tp_exec detached70 invalid: {exc}")
                 return
 
-        client_tag = kwargs.get("client_tag") or _config_get(self._config, "client_tag")
+        client_tag = options["client_tag"]
         if not client_tag:
             client_tag = _default_breakout_client_tag(symbol, level)
 
         run_config = BreakoutRunConfig(
             symbol=symbol,
             qty=qty,
-            rule=BreakoutRuleConfig(level=level, fast_entry=FastEntryConfig(enabled=fast_enabled)),
+            rule=BreakoutRuleConfig(
+                level=level,
+                fast_entry=FastEntryConfig(enabled=options["fast_enabled"]),
+            ),
             entry_type=entry_type,
             take_profit=take_profit,
             take_profits=take_profits,
@@ -1334,13 +1508,13 @@ class REPL:
             stop_loss=stop_loss,
             use_rth=use_rth,
             bar_size=bar_size,
-            fast_bar_size=fast_bar_size,
-            max_bars=max_bars,
-            tif=tif,
+            fast_bar_size=options["fast_bar_size"],
+            max_bars=options["max_bars"],
+            tif=options["tif"],
             outside_rth=outside_rth,
-            account=account,
+            account=options["account"],
             client_tag=client_tag,
-            quote_max_age_seconds=quote_max_age_seconds,
+            quote_max_age_seconds=options["quote_max_age_seconds"],
             ladder_execution_mode=ladder_execution_mode,
         )
 
@@ -1356,21 +1530,23 @@ class REPL:
         if not self._tp_service:
             print("TP service not configured.")
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before requesting TP levels.")
             return
         if not args:
             print(self._commands["tp"].usage)
             return
 
-        symbol = args[0].strip().upper()
+        symbol = _normalize_symbol_key(args[0])
         if not symbol:
             print(self._commands["tp"].usage)
             return
 
-        bar_size = kwargs.get("bar") or kwargs.get("bar_size") or "1 min"
-        use_rth_value = kwargs.get("rth") or kwargs.get("use_rth")
-        use_rth = _parse_bool(use_rth_value) if use_rth_value is not None else False
+        options = self._resolve_options(kwargs, _TP_OPTION_FIELDS)
+        if options is None:
+            return
+        bar_size = options["bar_size"]
+        use_rth = options["use_rth"]
 
         try:
             result = await self._tp_service.compute_levels(
@@ -1397,6 +1573,54 @@ class REPL:
         for idx, level in enumerate(result.levels, start=1):
             print(f"  TP{idx}: {level.price:g} ({level.reason.value})")
 
+    def _resolve_options(
+        self,
+        kwargs: dict[str, str],
+        fields: tuple[_OptionField, ...],
+    ) -> Optional[dict[str, object]]:
+        resolved: dict[str, object] = {}
+        for option in fields:
+            try:
+                resolved[option.name] = self._resolve_option(kwargs, option)
+            except ValueError:
+                print(option.error)
+                return None
+        return resolved
+
+    def _resolve_option(self, kwargs: dict[str, str], option: _OptionField) -> object:
+        for key in option.kwarg_keys:
+            value = kwargs.get(key)
+            if value:
+                return option.parser(value)
+        for key in option.config_keys:
+            if self._cfg.get(key):
+                return self._cfg.parsed(key, option.parser)
+        return option.default
+
+    def _resolve_broker_orders_options(
+        self,
+        args: list[str],
+        kwargs: dict[str, str],
+        *,
+        usage: str,
+    ) -> Optional[tuple[Optional[str], str]]:
+        remaining = list(args)
+        scope_arg = None
+        if remaining:
+            try:
+                scope_arg = _parse_order_scope(remaining[0])
+            except ValueError:
+                pass
+            if scope_arg:
+                remaining = remaining[1:]
+        if remaining:
+            print(usage)
+            return None
+        options = self._resolve_options(kwargs, _BROKER_ORDERS_OPTION_FIELDS)
+        if options is None:
+            return None
+        return options["account"] or None, options["scope"] or scope_arg or "client"
+
     def _breakout_task_name(self, config: BreakoutRunConfig) -> str:
         return f"breakout:{config.symbol}:{config.rule.level:g}"
 
@@ -1420,19 +1644,20 @@ class REPL:
             name=task_name,
         )
         self._breakout_tasks[task_name] = (config, task)
+        self._breakout_task_names_by_symbol.setdefault(config.symbol, set()).add(task_name)
         self._schedule_session_phase_prewarm(config)
         task.add_done_callback(lambda t: self._on_breakout_done(task_name, t))
         if source == "resume":
             print(f"Resumed breakout watcher: {task_name}")
         else:
             print(f"Breakout watcher started: {task_name}")
-        self._persist_breakout_state()
+        self._record_breakout_state_upsert(task_name, config)
         return True
 
     def _schedule_session_phase_prewarm(self, config: BreakoutRunConfig) -> None:
         if not self._order_service:
             return
-        symbol = config.symbol.strip().upper()
+        symbol = _normalize_symbol_key(config.symbol)
         if not symbol:
             return
         existing = self._session_phase_prewarm_tasks.get(symbol)
@@ -1487,7 +1712,7 @@ class REPL:
 
     async def _prompt_yes_no(self, prompt: str) -> bool:
         try:
-            response = await asyncio.to_thread(input, prompt)
+            response = await self._read_line(prompt)
         except asyncio.CancelledError:
             self._clear_cancel_state()
             return False
@@ -1506,15 +1731,9 @@ class REPL:
 
     async def _cmd_orders(self, _args: list[str], _kwargs: dict[str, str]) -> None:
         if _args:
-            subcommand = _args[0].lower()
-            if subcommand == "cancel":
-                await self._cmd_order_cancel(_args[1:], _kwargs)
-                return
-            if subcommand == "replace":
-                await self._cmd_order_replace(_args[1:], _kwargs)
-                return
-            if subcommand == "broker":
-                await self._cmd_order_broker(_args[1:], _kwargs)
+            handler = self._order_subcommands.get(_args[0].lower())
+            if handler is not None:
+                await handler(_args[1:], _kwargs)
                 return
         if not self._order_tracker:
             print("Order tracker not configured.")
@@ -1524,8 +1743,7 @@ class REPL:
         if not lines:
             print("No orders recorded.")
             return
-        for line in lines:
-            print(line)
+        _print_lines(lines)
 
     async def _cmd_order_cancel(self, args: list[str], _kwargs: dict[str, str]) -> None:
         if not self._order_service:
@@ -1616,27 +1834,18 @@ class REPL:
         if not self._active_orders_service:
             print("Active orders service not configured.")
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before requesting broker orders.")
             return
 
-        normalized_args = list(args)
-        scope_arg = None
-        if normalized_args:
-            parsed_scope = normalized_args[0].strip().lower().replace("-", "_")
-            if parsed_scope in {"client", "all_clients"}:
-                scope_arg = parsed_scope
-                normalized_args = normalized_args[1:]
-        if normalized_args:
-            print("Usage: orders broker [account=...] [scope=client|all_clients]")
-            return
-
-        account = _coerce_str(kwargs.get("account"))
-        scope_raw = _coerce_str(kwargs.get("scope"))
-        scope = (scope_raw or scope_arg or "client").strip().lower().replace("-", "_")
-        if scope not in {"client", "all_clients"}:
-            print("scope must be 'client' or 'all_clients'")
+        resolved = self._resolve_broker_orders_options(
+            args,
+            kwargs,
+            usage="Usage: orders broker [account=...] [scope=client|all_clients]",
+        )
+        if resolved is None:
             return
+        account, scope = resolved
 
         try:
             snapshots = await self._active_orders_service.list_active_orders(
@@ -1655,8 +1864,7 @@ class REPL:
             return
 
         print(f"Active broker orders (scope={scope})")
-        for line in _format_active_orders_table(snapshots):
-            print(line)
+        _print_lines(_format_active_orders_table(snapshots))
 
     async def _cmd_order_broker_cancel_all(self, args: list[str], kwargs: dict[str, str]) -> None:
         if not self._order_service:
@@ -1665,27 +1873,18 @@ class REPL:
         if not self._active_orders_service:
             print("Active orders service not configured.")
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before requesting broker orders.")
             return
 
-        normalized_args = list(args)
-        scope_arg = None
-        if normalized_args:
-            parsed_scope = normalized_args[0].strip().lower().replace("-", "_")
-            if parsed_scope in {"client", "all_clients"}:
-                scope_arg = parsed_scope
-                normalized_args = normalized_args[1:]
-        if normalized_args:
-            print("Usage: orders broker cancel all [account=...] [scope=client|all_clients]")
-            return
-
-        account = _coerce_str(kwargs.get("account"))
-        scope_raw = _coerce_str(kwargs.get("scope"))
-        scope = (scope_raw or scope_arg or "client").strip().lower().replace("-", "_")
-        if scope not in {"client", "all_clients"}:
-            print("scope must be 'client' or 'all_clients'")
+        resolved = self._resolve_broker_orders_options(
+            args,
+            kwargs,
+            usage="Usage: orders broker cancel all [account=...] [scope=client|all_clients]",
+        )
+        if resolved is None:
             return
+        account, scope = resolved
 
         try:
             snapshots = await self._active_orders_service.list_active_orders(
@@ -1721,15 +1920,24 @@ class REPL:
         requested_ids: list[int] = []
         failed_lines: list[str] = []
         print(f"Cancelling {len(order_ids)} active broker order(s) (scope={scope})")
-        for order_id in order_ids:
-            try:
-                await self._order_service.cancel_order(OrderCancelSpec(order_id=order_id))
-            except OrderValidationError as exc:
-                failed_lines.append(f"order_id={order_id} rejected={exc}")
+        # Each cancel waits for a broker status; issue them together so the batch
+        # costs one round trip instead of one per order.
+        results = await asyncio.gather(
+            *(
+                self._order_service.cancel_order(OrderCancelSpec(order_id=order_id))
+                for order_id in order_ids
+            ),
+            return_exceptions=True,
+        )
+        for order_id, result in zip(order_ids, results):
+            if isinstance(result, OrderValidationError):
+                failed_lines.append(f"order_id={order_id} rejected={result}")
                 continue
-            except Exception as exc:
-                failed_lines.append(f"order_id={order_id} error={exc}")
+            if isinstance(result, Exception):
+                failed_lines.append(f"order_id={order_id} error={result}")
                 continue
+            if isinstance(result, BaseException):
+                raise result
             requested_ids.append(order_id)
 
         print(
@@ -1784,26 +1992,17 @@ class REPL:
         if not os.path.exists(log_path):
             print(f"No event log found at {log_path}.")
             return
-        local_tz = datetime.now().astimezone().tzinfo or timezone.utc
-        today = datetime.now().astimezone().date()
-        fills_rows: list[list[str]] = []
+        now_local = datetime.now().astimezone()
+        local_tz = now_local.tzinfo or timezone.utc
+        today = now_local.date()
+        # Any offset puts a local-today timestamp on an adjacent calendar date at
+        # most, so these prefixes reject older lines without building datetimes.
+        today_prefixes = tuple((today + timedelta(days=delta)).isoformat() for delta in (-1, 0, 1))
+        # Raw fill values; formatted for display once, after the scan.
+        fills_rows: list[tuple[object, ...]] = []
         lifecycle_rows: list[list[str]] = []
         completed_rows: list[list[str]] = []
 
-        tracked_types = {
-            "BreakoutConfirmed",
-            "BreakoutStopped",
-            "OrderIdAssigned",
-            "OrderStatusChanged",
-            "OrderFilled",
-            "BracketChildOrderBrokerSnapshot",
-            "BracketChildOrderStatusChanged",
-            "BracketChildOrderFilled",
-            "LadderProtectionStateChanged",
-            "LadderStopLossReplaceFailed",
-            "LadderStopLossReplaced",
-            "IbGatewayLog",
-        }
         sessions_by_key: dict[str, _BreakoutTradesSession] = {}
         session_keys_by_tag: dict[str, list[str]] = {}
         next_session_index_by_tag: dict[str, int] = {}
@@ -1879,418 +2078,422 @@ class REPL:
         ) -> None:
             if qty is None or qty <= 0:
                 return
-            fills_rows.append(
-                [
-                    timestamp_local.strftime("%H:%M:%S.%f")[:-4],
-                    str(fill_type),
-                    str(symbol or "-"),
-                    str(side or "-"),
-                    _format_number(qty),
-                    _format_number(price),
-                    str(status or "-"),
-                    str(order_id or "-"),
-                    str(tag or "-"),
-                ]
-            )
+            fills_rows.append((timestamp_local, fill_type, symbol, side, qty, price, status, order_id, tag))
 
-        with open(log_path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
+        # Repeated `trades` calls only scan what was appended since the last one.
+        log_stat = os.stat(log_path)
+        cache = self._trades_log_cache
+        if (
+            cache is None
+            or cache.path != log_path
+            or cache.day != today
+            or cache.inode != log_stat.st_ino
+            or log_stat.st_size < cache.offset
+        ):
+            cache = _TradesLogCache(path=log_path, day=today, inode=log_stat.st_ino)
+            self._trades_log_cache = cache
+        records, cache.offset, partial_records = await asyncio.to_thread(
+            _scan_trades_log,
+            log_path,
+            cache.offset,
+            today_prefixes,
+        )
+        cache.records.extend(records)
+        for event_type, event in itertools.chain(cache.records, partial_records):
+            timestamp = _parse_jsonl_timestamp(event.get("timestamp"), local_tz)
+            if not timestamp:
+                continue
+            timestamp_local = timestamp.astimezone(local_tz)
+            if timestamp_local.date() != today:
+                continue
+
+            if event_type == "BreakoutConfirmed":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
-                event_type = payload.get("event_type")
-                if event_type not in tracked_types:
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                session = _new_session(tag=tag, symbol=symbol, timestamp_local=timestamp_local)
+                session.level = _maybe_float(event.get("level"))
+                parsed_tps = _coerce_float_list(event.get("take_profits"))
+                if parsed_tps:
+                    session.configured_tps = parsed_tps
+                else:
+                    single_tp = _maybe_float(event.get("take_profit"))
+                    if single_tp is not None:
+                        session.configured_tps = [single_tp]
+                session.configured_sl = _maybe_float(event.get("stop_loss"))
+                continue
+
+            if event_type == "BreakoutStopped":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
-                event = payload.get("event")
-                if not isinstance(event, dict):
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
-                timestamp = _parse_jsonl_timestamp(event.get("timestamp"), local_tz)
-                if not timestamp:
+                session.watcher_stop_time = timestamp_local
+                reason = event.get("reason")
+                if reason:
+                    session.watcher_stop_reason = str(reason)
+                continue
+
+            if event_type == "OrderIdAssigned":
+                spec = event.get("spec")
+                if not isinstance(spec, dict):
+                    spec = {}
+                tag_value = spec.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
-                timestamp_local = timestamp.astimezone(local_tz)
-                if timestamp_local.date() != today:
+                tag = str(tag_value)
+                symbol = str(spec.get("symbol") or "-")
+                order_id = _maybe_int(event.get("order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
+                session.symbol = symbol
+                session.entry_side = str(spec.get("side") or session.entry_side or "")
+                planned_qty = _maybe_float(spec.get("qty"))
+                if planned_qty is not None and planned_qty > 0:
+                    session.planned_entry_qty = planned_qty
+                if order_id is not None:
+                    session.entry_order_id = order_id
+                    session_key_by_entry_order_id[order_id] = session.key
+                unassigned_session_key_by_tag.pop(tag, None)
+                continue
 
-                if event_type == "BreakoutConfirmed":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    session = _new_session(tag=tag, symbol=symbol, timestamp_local=timestamp_local)
-                    session.level = _maybe_float(event.get("level"))
-                    parsed_tps = _coerce_float_list(event.get("take_profits"))
-                    if parsed_tps:
-                        session.configured_tps = parsed_tps
-                    else:
-                        single_tp = _maybe_float(event.get("take_profit"))
-                        if single_tp is not None:
-                            session.configured_tps = [single_tp]
-                    session.configured_sl = _maybe_float(event.get("stop_loss"))
+            if event_type == "OrderStatusChanged":
+                spec = event.get("spec")
+                if not isinstance(spec, dict):
+                    spec = {}
+                tag_value = spec.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
-
-                if event_type == "BreakoutStopped":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.watcher_stop_time = timestamp_local
-                    if event.get("reason"):
-                        session.watcher_stop_reason = str(event.get("reason"))
+                tag = str(tag_value)
+                symbol = str(spec.get("symbol") or "-")
+                order_id = _maybe_int(event.get("order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    order_id=order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
+                session.symbol = symbol
+                if order_id is not None and session.entry_order_id is None:
+                    session.entry_order_id = order_id
+                    session_key_by_entry_order_id[order_id] = session.key
+                status = event.get("status")
+                if status:
+                    session.entry_last_status = str(status)
+                continue
 
-                if event_type == "OrderIdAssigned":
-                    spec = event.get("spec")
-                    if not isinstance(spec, dict):
-                        spec = {}
-                    tag_value = spec.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(spec.get("symbol") or "-")
-                    order_id = _maybe_int(event.get("order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        create_if_missing=True,
+            if event_type == "OrderFilled":
+                spec = event.get("spec")
+                if not isinstance(spec, dict):
+                    spec = {}
+                symbol = spec.get("symbol") or "-"
+                side = spec.get("side") or "-"
+                raw_avg_fill_price = event.get("avg_fill_price")
+                price = _coalesce_number(raw_avg_fill_price, spec.get("limit_price"))
+                status = event.get("status") or "-"
+                raw_order_id = event.get("order_id")
+                order_id = raw_order_id or "-"
+                tag_value = spec.get("client_tag")
+                tag = tag_value or "-"
+                order_id_int = _maybe_int(raw_order_id)
+                cumulative_qty = _maybe_float(event.get("filled_qty"))
+                delta_qty = None
+                if _is_fill_event(status, cumulative_qty):
+                    delta_qty = _delta_from_cumulative(
+                        cumulative_qty,
+                        order_id=order_id_int,
+                        snapshots_by_order_id=entry_filled_cumulative_by_order_id,
                     )
-                    if session is None:
-                        continue
-                    session.symbol = symbol
-                    session.entry_side = str(spec.get("side") or session.entry_side or "")
-                    planned_qty = _maybe_float(spec.get("qty"))
-                    if planned_qty is not None and planned_qty > 0:
-                        session.planned_entry_qty = planned_qty
-                    if order_id is not None:
-                        session.entry_order_id = order_id
-                        session_key_by_entry_order_id[order_id] = session.key
-                    unassigned_session_key_by_tag.pop(tag, None)
-                    continue
+                _record_fill_row(
+                    timestamp_local=timestamp_local,
+                    fill_type="entry",
+                    symbol=symbol,
+                    side=side,
+                    qty=delta_qty,
+                    price=price,
+                    status=status,
+                    order_id=order_id,
+                    tag=tag,
+                )
 
-                if event_type == "OrderStatusChanged":
-                    spec = event.get("spec")
-                    if not isinstance(spec, dict):
-                        spec = {}
-                    tag_value = spec.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(spec.get("symbol") or "-")
-                    order_id = _maybe_int(event.get("order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        order_id=order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.symbol = symbol
-                    if order_id is not None and session.entry_order_id is None:
-                        session.entry_order_id = order_id
-                        session_key_by_entry_order_id[order_id] = session.key
-                    if event.get("status"):
-                        session.entry_last_status = str(event.get("status"))
+                if not _is_breakout_client_tag(tag_value):
                     continue
+                tag_text = str(tag_value)
+                session = _resolve_session(
+                    tag=tag_text,
+                    symbol=str(symbol),
+                    timestamp_local=timestamp_local,
+                    order_id=order_id_int,
+                    create_if_missing=True,
+                )
+                if session is None:
+                    continue
+                session.symbol = str(symbol)
+                session.entry_side = str(side)
+                planned_qty = _maybe_float(spec.get("qty"))
+                if planned_qty is not None and planned_qty > 0:
+                    session.planned_entry_qty = planned_qty
+                if order_id_int is not None:
+                    session_key_by_entry_order_id[order_id_int] = session.key
+                    if session.entry_order_id is None:
+                        session.entry_order_id = order_id_int
+                if cumulative_qty is not None and cumulative_qty > session.entry_filled_qty:
+                    session.entry_filled_qty = cumulative_qty
+                remaining_qty = _maybe_float(event.get("remaining_qty"))
+                if remaining_qty is not None:
+                    session.entry_remaining_qty = remaining_qty
+                if status:
+                    session.entry_last_status = str(status)
+                if delta_qty is not None and delta_qty > 0:
+                    if session.entry_first_fill_time is None:
+                        session.entry_first_fill_time = timestamp_local
+                    if price is not None:
+                        session.entry_notional += delta_qty * price
+                avg_fill_price = _maybe_float(raw_avg_fill_price)
+                if avg_fill_price is not None and avg_fill_price > 0:
+                    session.entry_avg_price = avg_fill_price
+                elif session.entry_filled_qty > 0 and session.entry_notional > 0:
+                    session.entry_avg_price = session.entry_notional / session.entry_filled_qty
+                continue
 
-                if event_type == "OrderFilled":
-                    spec = event.get("spec")
-                    if not isinstance(spec, dict):
-                        spec = {}
-                    symbol = spec.get("symbol") or "-"
-                    side = spec.get("side") or "-"
-                    price = _coalesce_number(event.get("avg_fill_price"), spec.get("limit_price"))
-                    status = event.get("status") or "-"
-                    order_id = event.get("order_id") or "-"
-                    tag = spec.get("client_tag") or "-"
-                    order_id_int = _maybe_int(event.get("order_id"))
-                    cumulative_qty = _maybe_float(event.get("filled_qty"))
-                    delta_qty = None
-                    if _is_fill_event(status, cumulative_qty):
-                        delta_qty = _delta_from_cumulative(
-                            cumulative_qty,
-                            order_id=order_id_int,
-                            snapshots_by_order_id=entry_filled_cumulative_by_order_id,
-                        )
-                    _record_fill_row(
-                        timestamp_local=timestamp_local,
-                        fill_type="entry",
-                        symbol=symbol,
-                        side=side,
-                        qty=delta_qty,
-                        price=price,
-                        status=status,
-                        order_id=order_id,
-                        tag=tag,
-                    )
-
-                    tag_value = spec.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag_text = str(tag_value)
-                    session = _resolve_session(
-                        tag=tag_text,
-                        symbol=str(symbol),
-                        timestamp_local=timestamp_local,
-                        order_id=order_id_int,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.symbol = str(symbol)
-                    session.entry_side = str(side)
-                    planned_qty = _maybe_float(spec.get("qty"))
-                    if planned_qty is not None and planned_qty > 0:
-                        session.planned_entry_qty = planned_qty
-                    if order_id_int is not None:
-                        session_key_by_entry_order_id[order_id_int] = session.key
-                        if session.entry_order_id is None:
-                            session.entry_order_id = order_id_int
-                    if cumulative_qty is not None and cumulative_qty > session.entry_filled_qty:
-                        session.entry_filled_qty = cumulative_qty
-                    remaining_qty = _maybe_float(event.get("remaining_qty"))
-                    if remaining_qty is not None:
-                        session.entry_remaining_qty = remaining_qty
-                    if status:
-                        session.entry_last_status = str(status)
-                    if delta_qty is not None and delta_qty > 0:
-                        if session.entry_first_fill_time is None:
-                            session.entry_first_fill_time = timestamp_local
-                        if price is not None:
-                            session.entry_notional += delta_qty * price
-                    avg_fill_price = _maybe_float(event.get("avg_fill_price"))
-                    if avg_fill_price is not None and avg_fill_price > 0:
-                        session.entry_avg_price = avg_fill_price
-                    elif session.entry_filled_qty > 0 and session.entry_notional > 0:
-                        session.entry_avg_price = session.entry_notional / session.entry_filled_qty
+            if event_type == "BracketChildOrderBrokerSnapshot":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
+                    continue
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                order_id_int = _maybe_int(event.get("order_id"))
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    order_id=order_id_int,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
+                session.symbol = symbol
+                kind = str(event.get("kind") or "")
+                expected_qty = _maybe_float(event.get("expected_qty"))
+                if _is_tp_kind(kind) and expected_qty is not None:
+                    session.tp_expected_by_kind[kind] = expected_qty
+                if order_id_int is not None:
+                    session_key_by_child_order_id[order_id_int] = session.key
+                continue
 
-                if event_type == "BracketChildOrderBrokerSnapshot":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    order_id_int = _maybe_int(event.get("order_id"))
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        order_id=order_id_int,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.symbol = symbol
-                    kind = str(event.get("kind") or "")
-                    expected_qty = _maybe_float(event.get("expected_qty"))
-                    if _is_tp_kind(kind) and expected_qty is not None:
-                        session.tp_expected_by_kind[kind] = expected_qty
-                    if order_id_int is not None:
-                        session_key_by_child_order_id[order_id_int] = session.key
+            if event_type == "BracketChildOrderStatusChanged":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                order_id_int = _maybe_int(event.get("order_id"))
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    order_id=order_id_int,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
+                    continue
+                session.symbol = symbol
+                if order_id_int is not None:
+                    session_key_by_child_order_id[order_id_int] = session.key
+                kind = str(event.get("kind") or "")
+                status = str(event.get("status") or "")
+                if kind:
+                    session.child_status_by_kind[kind] = status
+                continue
 
-                if event_type == "BracketChildOrderStatusChanged":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    order_id_int = _maybe_int(event.get("order_id"))
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
+            if event_type == "BracketChildOrderFilled":
+                status = event.get("status") or "-"
+                raw_order_id = event.get("order_id")
+                order_id_int = _maybe_int(raw_order_id)
+                cumulative_qty = _maybe_float(event.get("filled_qty"))
+                delta_qty = None
+                if _is_fill_event(status, cumulative_qty):
+                    delta_qty = _delta_from_cumulative(
+                        cumulative_qty,
                         order_id=order_id_int,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
+                        snapshots_by_order_id=child_filled_cumulative_by_order_id,
                     )
-                    if session is None:
-                        continue
-                    session.symbol = symbol
-                    if order_id_int is not None:
-                        session_key_by_child_order_id[order_id_int] = session.key
-                    kind = str(event.get("kind") or "")
-                    status = str(event.get("status") or "")
-                    if kind:
-                        session.child_status_by_kind[kind] = status
+                tag_value = event.get("client_tag")
+                is_breakout = _is_breakout_client_tag(tag_value)
+                # Repeated status snapshots without a new execution only
+                # matter for breakout session tracking.
+                if not is_breakout and (delta_qty is None or delta_qty <= 0):
                     continue
+                kind = event.get("kind") or "-"
+                symbol = event.get("symbol") or "-"
+                side = event.get("side") or "-"
+                price = _coalesce_number(event.get("avg_fill_price"), event.get("price"))
+                order_id = raw_order_id or "-"
+                tag = tag_value or "-"
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                _record_fill_row(
+                    timestamp_local=timestamp_local,
+                    fill_type=_format_kind(kind),
+                    symbol=symbol,
+                    side=side,
+                    qty=delta_qty,
+                    price=price,
+                    status=status,
+                    order_id=order_id,
+                    tag=tag,
+                )
 
-                if event_type == "BracketChildOrderFilled":
-                    kind = event.get("kind") or "-"
-                    symbol = event.get("symbol") or "-"
-                    side = event.get("side") or "-"
-                    price = _coalesce_number(event.get("avg_fill_price"), event.get("price"))
-                    status = event.get("status") or "-"
-                    order_id = event.get("order_id") or "-"
-                    tag = event.get("client_tag") or "-"
-                    order_id_int = _maybe_int(event.get("order_id"))
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    cumulative_qty = _maybe_float(event.get("filled_qty"))
-                    delta_qty = None
-                    if _is_fill_event(status, cumulative_qty):
-                        delta_qty = _delta_from_cumulative(
-                            cumulative_qty,
-                            order_id=order_id_int,
-                            snapshots_by_order_id=child_filled_cumulative_by_order_id,
-                        )
-                    _record_fill_row(
-                        timestamp_local=timestamp_local,
-                        fill_type=_format_kind(kind),
-                        symbol=symbol,
-                        side=side,
-                        qty=delta_qty,
-                        price=price,
-                        status=status,
-                        order_id=order_id,
-                        tag=tag,
-                    )
-
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag_text = str(tag_value)
-                    session = _resolve_session(
-                        tag=tag_text,
-                        symbol=str(symbol),
-                        timestamp_local=timestamp_local,
-                        order_id=order_id_int,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.symbol = str(symbol)
-                    if order_id_int is not None:
-                        session_key_by_child_order_id[order_id_int] = session.key
-                    kind_text = str(kind)
-                    session.child_status_by_kind[kind_text] = str(status)
-                    if delta_qty is None or delta_qty <= 0:
-                        continue
-                    if session.first_exit_time is None:
-                        session.first_exit_time = timestamp_local
-                    session.last_exit_time = timestamp_local
-                    if _is_tp_kind(kind_text):
-                        session.tp_filled_qty += delta_qty
-                        if price is not None:
-                            session.tp_notional += delta_qty * price
-                    elif _is_stop_kind(kind_text):
-                        session.stop_filled_qty += delta_qty
-                        if price is not None:
-                            session.stop_notional += delta_qty * price
+                if not is_breakout:
+                    continue
+                tag_text = str(tag_value)
+                session = _resolve_session(
+                    tag=tag_text,
+                    symbol=str(symbol),
+                    timestamp_local=timestamp_local,
+                    order_id=order_id_int,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
+                    continue
+                session.symbol = str(symbol)
+                if order_id_int is not None:
+                    session_key_by_child_order_id[order_id_int] = session.key
+                kind_text = str(kind)
+                session.child_status_by_kind[kind_text] = str(status)
+                if delta_qty is None or delta_qty <= 0:
                     continue
+                if session.first_exit_time is None:
+                    session.first_exit_time = timestamp_local
+                session.last_exit_time = timestamp_local
+                if _is_tp_kind(kind_text):
+                    session.tp_filled_qty += delta_qty
+                    if price is not None:
+                        session.tp_notional += delta_qty * price
+                elif _is_stop_kind(kind_text):
+                    session.stop_filled_qty += delta_qty
+                    if price is not None:
+                        session.stop_notional += delta_qty * price
+                continue
 
-                if event_type == "LadderProtectionStateChanged":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.protection_state = str(event.get("state") or "")
-                    session.protection_reason = str(event.get("reason") or "")
-                    active_tp_ids = event.get("active_take_profit_order_ids")
-                    if isinstance(active_tp_ids, list):
-                        for raw_order_id in active_tp_ids:
-                            order_id = _maybe_int(raw_order_id)
-                            if order_id is None:
-                                continue
-                            session_key_by_child_order_id[order_id] = session.key
-                    stop_order_id = _maybe_int(event.get("stop_order_id"))
-                    if stop_order_id is not None:
-                        session_key_by_child_order_id[stop_order_id] = session.key
+            if event_type == "LadderProtectionStateChanged":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
+                    continue
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
+                session.protection_state = str(event.get("state") or "")
+                session.protection_reason = str(event.get("reason") or "")
+                active_tp_ids = event.get("active_take_profit_order_ids")
+                if isinstance(active_tp_ids, list):
+                    for raw_order_id in active_tp_ids:
+                        order_id = _maybe_int(raw_order_id)
+                        if order_id is None:
+                            continue
+                        session_key_by_child_order_id[order_id] = session.key
+                stop_order_id = _maybe_int(event.get("stop_order_id"))
+                if stop_order_id is not None:
+                    session_key_by_child_order_id[stop_order_id] = session.key
+                continue
 
-                if event_type == "LadderStopLossReplaceFailed":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    session.replace_failed_count += 1
-                    session.last_replace_failed_status = str(event.get("status") or "")
-                    session.last_replace_failed_code = _maybe_int(event.get("broker_code"))
-                    if event.get("broker_message"):
-                        session.last_replace_failed_message = str(event.get("broker_message"))
-                    _append_breakout_issue(session, "stop_replace_failed")
+            if event_type == "LadderStopLossReplaceFailed":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
                     continue
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
+                    continue
+                session.replace_failed_count += 1
+                session.last_replace_failed_status = str(event.get("status") or "")
+                session.last_replace_failed_code = _maybe_int(event.get("broker_code"))
+                broker_message = event.get("broker_message")
+                if broker_message:
+                    session.last_replace_failed_message = str(broker_message)
+                _append_breakout_issue(session, "stop_replace_failed")
+                continue
 
-                if event_type == "LadderStopLossReplaced":
-                    tag_value = event.get("client_tag")
-                    if not _is_breakout_client_tag(tag_value):
-                        continue
-                    tag = str(tag_value)
-                    symbol = str(event.get("symbol") or "-")
-                    parent_order_id = _maybe_int(event.get("parent_order_id"))
-                    session = _resolve_session(
-                        tag=tag,
-                        symbol=symbol,
-                        timestamp_local=timestamp_local,
-                        parent_order_id=parent_order_id,
-                        create_if_missing=True,
-                    )
-                    if session is None:
-                        continue
-                    if session.replace_failed_count > 0:
-                        session.replace_failed_count = max(session.replace_failed_count - 1, 0)
+            if event_type == "LadderStopLossReplaced":
+                tag_value = event.get("client_tag")
+                if not _is_breakout_client_tag(tag_value):
+                    continue
+                tag = str(tag_value)
+                symbol = str(event.get("symbol") or "-")
+                parent_order_id = _maybe_int(event.get("parent_order_id"))
+                session = _resolve_session(
+                    tag=tag,
+                    symbol=symbol,
+                    timestamp_local=timestamp_local,
+                    parent_order_id=parent_order_id,
+                    create_if_missing=True,
+                )
+                if session is None:
                     continue
+                if session.replace_failed_count > 0:
+                    session.replace_failed_count = max(session.replace_failed_count - 1, 0)
+                continue
 
-                if event_type == "IbGatewayLog":
-                    req_id = _maybe_int(event.get("req_id"))
-                    code = _maybe_int(event.get("code"))
-                    if req_id is None or code is None:
-                        continue
-                    key = session_key_by_child_order_id.get(req_id) or session_key_by_entry_order_id.get(req_id)
-                    if not key:
-                        continue
-                    session = sessions_by_key.get(key)
-                    if session is None:
-                        continue
-                    if code == 404:
-                        _append_breakout_issue(session, f"404_locate_hold:{req_id}")
-                    elif code == 201:
-                        _append_breakout_issue(session, f"201_reject:{req_id}")
-                    elif code == 202:
-                        message = str(event.get("message") or "")
-                        if "cannot accept an order at a limit price" in message.lower():
-                            _append_breakout_issue(session, f"202_price_band:{req_id}")
+            if event_type == "IbGatewayLog":
+                req_id = _maybe_int(event.get("req_id"))
+                code = _maybe_int(event.get("code"))
+                if req_id is None or code is None:
+                    continue
+                key = session_key_by_child_order_id.get(req_id) or session_key_by_entry_order_id.get(req_id)
+                if not key:
+                    continue
+                session = sessions_by_key.get(key)
+                if session is None:
+                    continue
+                if code == 404:
+                    _append_breakout_issue(session, f"404_locate_hold:{req_id}")
+                elif code == 201:
+                    _append_breakout_issue(session, f"201_reject:{req_id}")
+                elif code == 202:
+                    message = str(event.get("message") or "")
+                    if "cannot accept an order at a limit price" in message.lower():
+                        _append_breakout_issue(session, f"202_price_band:{req_id}")
 
         sorted_sessions = sorted(
             sessions_by_key.values(),
@@ -2357,71 +2560,74 @@ class REPL:
         print(f"Trades for {today.isoformat()} (local time).")
         print("Fills today (execution deltas):")
         if fills_rows:
-            for line in _format_simple_table(
-                [
-                    "time",
-                    "type",
-                    "symbol",
-                    "side",
-                    "qty",
-                    "price",
-                    "status",
-                    "order_id",
-                    "tag",
-                ],
-                fills_rows,
-            ):
-                print(line)
+            _print_lines(
+                _format_simple_table(
+                    [
+                        "time",
+                        "type",
+                        "symbol",
+                        "side",
+                        "qty",
+                        "price",
+                        "status",
+                        "order_id",
+                        "tag",
+                    ],
+                    [_format_fill_row(*row) for row in fills_rows],
+                )
+            )
         else:
             print("No fills found today.")
         print("Breakout lifecycle today:")
         if lifecycle_rows:
-            for line in _format_simple_table(
-                [
-                    "symbol",
-                    "level",
-                    "tp",
-                    "sl",
-                    "entry_time",
-                    "entry_qty",
-                    "entry_px",
-                    "exit_qty",
-                    "open_qty",
-                    "legs",
-                    "protection",
-                    "watcher",
-                    "issues",
-                ],
-                lifecycle_rows,
-            ):
-                print(line)
+            _print_lines(
+                _format_simple_table(
+                    [
+                        "symbol",
+                        "level",
+                        "tp",
+                        "sl",
+                        "entry_time",
+                        "entry_qty",
+                        "entry_px",
+                        "exit_qty",
+                        "open_qty",
+                        "legs",
+                        "protection",
+                        "watcher",
+                        "issues",
+                    ],
+                    lifecycle_rows,
+                )
+            )
         else:
             print("No breakout sessions found today.")
         print("Completed breakout trades (full exits only):")
         if completed_rows:
-            for line in _format_simple_table(
-                [
-                    "exit_time",
-                    "symbol",
-                    "side",
-                    "qty",
-                    "entry",
-                    "exit",
-                    "pnl",
-                    "kind",
-                    "tag",
-                    "entry_time",
-                ],
-                completed_rows,
-            ):
-                print(line)
+            _print_lines(
+                _format_simple_table(
+                    [
+                        "exit_time",
+                        "symbol",
+                        "side",
+                        "qty",
+                        "entry",
+                        "exit",
+                        "pnl",
+                        "kind",
+                        "tag",
+                        "entry_time",
+                    ],
+                    completed_rows,
+                )
+            )
         else:
             print("No completed breakout trades found today.")
 
     async def _seed_position_origins(self) -> None:
         if not self._position_origin_tracker:
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             return
         timeout = self._connection.config.timeout
         try:
@@ -2442,7 +2648,7 @@ class REPL:
     async def _reconcile_orphan_exit_orders(self, *, trigger: str) -> None:
         if not self._active_orders_service or not self._positions_service:
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             return
 
         async with self._orphan_exit_lock:
@@ -2462,38 +2668,37 @@ class REPL:
                 _print_exception("Orphan exit reconciliation failed (positions)", exc)
                 positions = []
 
-            position_qty_by_account_symbol: dict[tuple[str, str], float] = {}
-            position_qty_by_symbol: dict[str, float] = {}
+            position_qty_by_account_symbol: defaultdict[tuple[str, str], int | float] = defaultdict(int)
+            position_qty_by_symbol: defaultdict[str, int | float] = defaultdict(int)
             for position in positions:
-                symbol = position.symbol.strip().upper()
+                symbol = _normalize_symbol_key(position.symbol)
                 if not symbol:
                     continue
-                account = _normalize_account_key(position.account)
-                qty = float(position.qty or 0.0)
-                position_qty_by_account_symbol[(account, symbol)] = (
-                    position_qty_by_account_symbol.get((account, symbol), 0.0) + qty
-                )
-                position_qty_by_symbol[symbol] = position_qty_by_symbol.get(symbol, 0.0) + qty
+                key = (_normalize_account_key(position.account), symbol)
+                qty = _share_qty(position.qty)
+                position_qty_by_account_symbol[key] += qty
+                position_qty_by_symbol[symbol] += qty
 
             orphan_orders: list[ActiveOrderSnapshot] = []
+            # One sweep is one observation; all its detections share a timestamp.
+            detected_at = datetime.now(timezone.utc)
             for order in active_orders:
                 if (order.side or "").strip().upper() != "SELL":
                     continue
                 if order.parent_order_id is None:
                     continue
-                symbol = (order.symbol or "").strip().upper()
+                symbol = _normalize_symbol_key(order.symbol)
                 if not symbol:
                     continue
-                account = _normalize_account_key(order.account)
-                qty = position_qty_by_account_symbol.get((account, symbol))
+                qty = position_qty_by_account_symbol.get((_normalize_account_key(order.account), symbol))
                 if qty is None:
-                    qty = position_qty_by_symbol.get(symbol, 0.0)
-                if abs(qty) > 1e-9:
+                    qty = position_qty_by_symbol.get(symbol, 0)
+                if not _is_flat_qty(qty):
                     continue
                 orphan_orders.append(order)
                 if self._event_bus:
                     self._event_bus.publish(
-                        OrphanExitOrderDetected.now(
+                        OrphanExitOrderDetected(
                             trigger=trigger,
                             action=action,
                             scope=scope,
@@ -2504,20 +2709,23 @@ class REPL:
                             status=order.status,
                             remaining_qty=order.remaining_qty,
                             client_tag=order.client_tag,
+                            timestamp=detected_at,
                         )
                     )
 
             cancelled_count = 0
             cancel_failed_count = 0
             if auto_cancel:
-                for order in orphan_orders:
-                    if order.order_id is None:
-                        continue
-                    try:
-                        ack = await self._order_service.cancel_order(
-                            OrderCancelSpec(order_id=order.order_id)
-                        )
-                    except Exception as exc:
+                cancel_orders = [order for order in orphan_orders if order.order_id is not None]
+                results = await asyncio.gather(
+                    *(
+                        self._order_service.cancel_order(OrderCancelSpec(order_id=order.order_id))
+                        for order in cancel_orders
+                    ),
+                    return_exceptions=True,
+                )
+                for order, ack in zip(cancel_orders, results):
+                    if isinstance(ack, Exception):
                         cancel_failed_count += 1
                         if self._event_bus:
                             self._event_bus.publish(
@@ -2526,11 +2734,13 @@ class REPL:
                                     order_id=order.order_id,
                                     account=order.account,
                                     symbol=order.symbol,
-                                    error_type=type(exc).__name__,
-                                    message=str(exc),
+                                    error_type=type(ack).__name__,
+                                    message=str(ack),
                                 )
                             )
                         continue
+                    if isinstance(ack, BaseException):
+                        raise ack
                     cancelled_count += 1
                     if self._event_bus:
                         self._event_bus.publish(
@@ -2569,7 +2779,7 @@ class REPL:
             return
         if not self._position_origin_tracker:
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             return
 
         async with self._detached_protection_lock:
@@ -2625,7 +2835,7 @@ class REPL:
             return
         if not self._position_origin_tracker:
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             return
 
         async with self._detached_session_restore_lock:
@@ -2712,7 +2922,7 @@ class REPL:
         if not self._positions_service:
             print("Positions service not configured.")
             return
-        if not self._connection.status().get("connected"):
+        if not self._connection.is_connected():
             print("Not connected. Use `connect` before requesting positions.")
             return
         normalized_args = list(_args)
@@ -2747,7 +2957,7 @@ class REPL:
             if min_realized is None:
                 print("min must be a number")
                 return
-        account = _kwargs.get("account") or _config_get(self._config, "account")
+        account = _kwargs.get("account") or self._cfg.get("account")
         positions = await self._positions_service.list_positions(account=account)
         if not positions:
             print("No positions found.")
@@ -2762,8 +2972,7 @@ class REPL:
                 print("No stock positions with realized P&L found.")
                 return
             print()
-            for line in lines:
-                print(line)
+            _print_lines(lines)
             return
         tag_lookup = None
         exit_lookup = None
@@ -2773,18 +2982,20 @@ class REPL:
             exit_lookup = self._position_origin_tracker.exit_levels_for
             take_profits_lookup = self._position_origin_tracker.take_profits_for
         print()
-        for line in _format_positions_table(
-            positions,
-            tag_lookup=tag_lookup,
-            exit_lookup=exit_lookup,
-            take_profits_lookup=take_profits_lookup,
-        ):
-            print(line)
+        _print_lines(
+            _format_positions_table(
+                positions,
+                tag_lookup=tag_lookup,
+                exit_lookup=exit_lookup,
+                take_profits_lookup=take_profits_lookup,
+            )
+        )
 
     def _print_breakout_status(self) -> None:
         if not self._breakout_tasks:
             print("No breakout watchers running.")
             return
+        lines: list[str] = []
         for name, (config, task) in sorted(self._breakout_tasks.items()):
             state = "running" if not task.done() else "done"
             extras = []
@@ -2799,10 +3010,11 @@ class REPL:
             if config.stop_loss is not None:
                 extras.append(f"sl={config.stop_loss}")
             suffix = f" {' '.join(extras)}" if extras else ""
-            print(
+            lines.append(
                 f"{name} level={config.rule.level} "
                 f"qty={config.qty} state={state}{suffix}"
             )
+        _print_lines(lines)
 
     def _stream_health_summary(
         self,
@@ -2843,18 +3055,23 @@ class REPL:
         *,
         persist: bool = False,
     ) -> None:
+        # A journal line queued by an earlier cancel must land even when nothing is left to stop.
+        self._flush_pending_breakout_state()
         if not self._breakout_tasks:
             if symbol and not persist:
-                print(f"No breakout watchers found for {symbol.strip().upper()}.")
+                print(f"No breakout watchers found for {_normalize_symbol_key(symbol)}.")
             return
-        symbol_filter = symbol.strip().upper() if symbol else None
+        symbol_filter = _normalize_symbol_key(symbol) if symbol else None
         if persist and symbol_filter:
             persist = False
-        targets = []
-        for name, (config, task) in self._breakout_tasks.items():
-            if symbol_filter and config.symbol != symbol_filter:
-                continue
-            targets.append((name, config, task))
+        tasks_by_name = self._breakout_tasks
+        if symbol_filter:
+            targets = [
+                (name, *tasks_by_name[name])
+                for name in sorted(self._breakout_task_names_by_symbol.get(symbol_filter, ()))
+            ]
+        else:
+            targets = [(name, config, task) for name, (config, task) in tasks_by_name.items()]
         if not targets:
             if symbol_filter and not persist:
                 print(f"No breakout watchers found for {symbol_filter}.")
@@ -2862,19 +3079,35 @@ class REPL:
         if persist:
             self._save_breakout_state([config for _, config, _ in targets])
             self._suspend_breakout_state_updates = True
-        for _name, _config, task in targets:
+        tasks = [task for _, _, task in targets]
+        for task in tasks:
             task.cancel()
-        await asyncio.gather(*(task for _, _, task in targets), return_exceptions=True)
+        # Tasks stay registered until they settle so _on_breakout_done can retire them.
+        await asyncio.gather(*tasks, return_exceptions=True)
         for name, _config, _task in targets:
-            self._breakout_tasks.pop(name, None)
-        if not persist:
-            self._persist_breakout_state()
+            # _on_breakout_done usually retired the task already and journaled its delete.
+            if self._forget_breakout_task(name) is not None and not persist:
+                self._record_breakout_state_delete(name)
         print(f"Stopped {len(targets)} breakout watcher(s).")
 
-    def _on_breakout_done(self, task_name: str, task: asyncio.Task) -> None:
+    def _forget_breakout_task(
+        self, task_name: str
+    ) -> Optional[tuple[BreakoutRunConfig, asyncio.Task]]:
         config_task = self._breakout_tasks.pop(task_name, None)
-        if not self._suspend_breakout_state_updates:
-            self._persist_breakout_state()
+        if config_task is None:
+            return None
+        symbol = config_task[0].symbol
+        names = self._breakout_task_names_by_symbol.get(symbol)
+        if names is not None:
+            names.discard(task_name)
+            if not names:
+                del self._breakout_task_names_by_symbol[symbol]
+        return config_task
+
+    def _on_breakout_done(self, task_name: str, task: asyncio.Task) -> None:
+        config_task = self._forget_breakout_task(task_name)
+        if config_task is not None:
+            self._record_breakout_state_delete(task_name)
         if task.cancelled():
             print(f"Breakout watcher cancelled: {task_name}")
             return
@@ -2890,23 +3123,128 @@ class REPL:
         configs = [config for config, _task in self._breakout_tasks.values()]
         self._save_breakout_state(configs)
 
+    def _record_breakout_state_upsert(self, task_name: str, config: BreakoutRunConfig) -> None:
+        self._append_breakout_journal(
+            {
+                "v": _BREAKOUT_STATE_VERSION,
+                "op": "upsert",
+                "key": task_name,
+                "state": _serialize_breakout_config(config),
+            }
+        )
+
+    def _record_breakout_state_delete(self, task_name: str) -> None:
+        self._append_breakout_journal(
+            {"v": _BREAKOUT_STATE_VERSION, "op": "delete", "key": task_name}
+        )
+
+    def _append_breakout_journal(self, entry: dict[str, object]) -> None:
+        if self._suspend_breakout_state_updates or not self._breakout_journal_path:
+            return
+        if self._breakout_journal_synced:
+            self._breakout_journal_pending.append(
+                json.dumps(entry, sort_keys=True, ensure_ascii=True) + "\n"
+            )
+        self._schedule_breakout_state_flush()
+
+    def _schedule_breakout_state_flush(self) -> None:
+        if self._breakout_state_flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_breakout_state()
+            return
+        self._breakout_state_flush_handle = loop.call_later(
+            _BREAKOUT_STATE_FLUSH_DELAY_SECONDS,
+            self._flush_breakout_state,
+        )
+
+    def _flush_pending_breakout_state(self) -> None:
+        handle = self._breakout_state_flush_handle
+        if handle is None:
+            return
+        handle.cancel()
+        self._flush_breakout_state()
+
+    def _flush_breakout_state(self) -> None:
+        self._breakout_state_flush_handle = None
+        if self._suspend_breakout_state_updates:
+            self._breakout_journal_pending.clear()
+            return
+        if not self._breakout_journal_synced:
+            # First flush of the session rewrites the snapshot so entries left by a
+            # previous run are dropped; later flushes only append.
+            self._persist_breakout_state()
+            return
+        pending = self._breakout_journal_pending
+        if not pending:
+            return
+        self._breakout_journal_pending = []
+        try:
+            fd = os.open(
+                self._breakout_journal_path,
+                os.O_RDWR | os.O_CREAT | os.O_APPEND,
+                0o644,
+            )
+            try:
+                payload = "".join(pending).encode("utf-8")
+                size = os.fstat(fd).st_size
+                # Terminate a torn line left by a crash so this batch is not glued onto it.
+                if size and os.pread(fd, 1, size - 1) != b"\n":
+                    payload = b"\n" + payload
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+        except Exception as exc:
+            print(f"Failed to append breakout state: {exc}")
+            return
+        self._breakout_journal_entries += len(pending)
+        if self._breakout_journal_entries >= _BREAKOUT_JOURNAL_COMPACT_THRESHOLD:
+            self._persist_breakout_state()
+
+    def _cancel_breakout_state_flush(self) -> None:
+        handle = self._breakout_state_flush_handle
+        if handle is not None:
+            handle.cancel()
+            self._breakout_state_flush_handle = None
+        self._breakout_journal_pending.clear()
+
     def _save_breakout_state(self, configs: list[BreakoutRunConfig]) -> None:
         if not self._breakout_state_path:
             return
         if not configs:
             self._clear_breakout_state()
             return
-        payload = {
-            "version": _BREAKOUT_STATE_VERSION,
-            "saved_at": datetime.now(timezone.utc).isoformat(),
-            "breakouts": [_serialize_breakout_config(config) for config in configs],
-        }
+        entries = [_serialize_breakout_config(config) for config in configs]
+        if entries != self._breakout_state_saved_entries or not self._breakout_state_path.exists():
+            payload = {
+                "version": _BREAKOUT_STATE_VERSION,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "breakouts": entries,
+            }
+            temp_path = self._breakout_state_path.with_name(f"{self._breakout_state_path.name}.tmp")
+            try:
+                self._breakout_state_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_bytes(_dump_breakout_state(payload))
+                os.replace(temp_path, self._breakout_state_path)
+            except Exception as exc:
+                print(f"Failed to write breakout state: {exc}")
+                return
+            self._breakout_state_saved_entries = entries
+        self._cancel_breakout_state_flush()
+        self._breakout_journal_synced = self._truncate_breakout_journal()
+
+    def _truncate_breakout_journal(self) -> bool:
+        self._breakout_journal_entries = 0
+        if not self._breakout_journal_path:
+            return True
         try:
-            self._breakout_state_path.parent.mkdir(parents=True, exist_ok=True)
-            with self._breakout_state_path.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2, sort_keys=True, ensure_ascii=True)
+            self._breakout_journal_path.unlink(missing_ok=True)
         except Exception as exc:
-            print(f"Failed to write breakout state: {exc}")
+            print(f"Failed to truncate breakout state journal: {exc}")
+            return False
+        return True
 
     def _clear_breakout_state(self) -> None:
         if not self._breakout_state_path:
@@ -2916,18 +3254,42 @@ class REPL:
                 self._breakout_state_path.unlink()
         except Exception as exc:
             print(f"Failed to clear breakout state: {exc}")
+        self._breakout_state_saved_entries = None
+        self._cancel_breakout_state_flush()
+        self._truncate_breakout_journal()
+        self._breakout_journal_synced = False
 
     def _load_breakout_state(self) -> list[BreakoutRunConfig]:
         if not self._breakout_state_path:
             return []
-        if not self._breakout_state_path.exists():
+        entries = self._read_breakout_snapshot()
+        if entries is None:
+            return []
+        configs_by_name: dict[str, BreakoutRunConfig] = {}
+        invalid_entries = 0
+        for entry in entries:
+            if not isinstance(entry, dict):
+                invalid_entries += 1
+                continue
+            config = _deserialize_breakout_config(entry)
+            if config is None:
+                invalid_entries += 1
+                continue
+            configs_by_name[self._breakout_task_name(config)] = config
+        invalid_entries += self._fold_breakout_journal(configs_by_name)
+        if invalid_entries:
+            print(f"Skipped {invalid_entries} invalid breakout state entries.")
+        return list(configs_by_name.values())
+
+    def _read_breakout_snapshot(self) -> Optional[list[object]]:
+        if not self._breakout_state_path or not self._breakout_state_path.exists():
             return []
         try:
             with self._breakout_state_path.open("r", encoding="utf-8") as handle:
                 payload = json.load(handle)
         except Exception as exc:
             print(f"Failed to read breakout state: {exc}")
-            return []
+            return None
         entries: list[object]
         if isinstance(payload, dict):
             entries = payload.get("breakouts", [])
@@ -2935,24 +3297,53 @@ class REPL:
             entries = payload
         else:
             print("Breakout state file has an invalid format.")
-            return []
+            return None
         if not isinstance(entries, list):
             print("Breakout state file has an invalid format.")
-            return []
-        configs: list[BreakoutRunConfig] = []
+            return None
+        return entries
+
+    def _fold_breakout_journal(self, configs_by_name: dict[str, BreakoutRunConfig]) -> int:
+        if not self._breakout_journal_path or not self._breakout_journal_path.exists():
+            return 0
         invalid_entries = 0
-        for entry in entries:
-            if not isinstance(entry, dict):
-                invalid_entries += 1
-                continue
-            config = _deserialize_breakout_config(entry)
-            if config is None:
-                invalid_entries += 1
-                continue
-            configs.append(config)
-        if invalid_entries:
-            print(f"Skipped {invalid_entries} invalid breakout state entries.")
-        return configs
+        try:
+            # Binary lines, so a torn write with broken UTF-8 only costs its own line.
+            with self._breakout_journal_path.open("rb") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn trailing write is expected after a crash mid-append.
+                        invalid_entries += 1
+                        continue
+                    if not isinstance(entry, dict):
+                        invalid_entries += 1
+                        continue
+                    key = entry.get("key")
+                    op = entry.get("op")
+                    if not isinstance(key, str):
+                        invalid_entries += 1
+                        continue
+                    if op == "delete":
+                        configs_by_name.pop(key, None)
+                        continue
+                    state = entry.get("state")
+                    config = (
+                        _deserialize_breakout_config(state)
+                        if op == "upsert" and isinstance(state, dict)
+                        else None
+                    )
+                    if config is None:
+                        invalid_entries += 1
+                        continue
+                    configs_by_name[key] = config
+        except Exception as exc:
+            print(f"Failed to read breakout state journal: {exc}")
+        return invalid_entries
 
     def _format_breakout_summary(self, config: BreakoutRunConfig) -> str:
         parts = [
@@ -2991,14 +3382,15 @@ class REPL:
             print("PnL service not configured.")
             return
         csv_value = kwargs.get("csv") or (args[0] if args else None)
-        account = kwargs.get("account") or _config_get(self._config, "account")
+        account = kwargs.get("account") or self._cfg.get("account")
         source = kwargs.get("source") or "flex"
         if not csv_value or not account:
             print("Usage: ingest-flex csv=... account=... [source=flex]")
             return
         csv_path = Path(csv_value).expanduser()
         try:
-            result = await asyncio.to_thread(
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._ingest_executor,
                 self._pnl_service.ingest_flex,
                 csv_path,
                 account,
@@ -3043,7 +3435,8 @@ class REPL:
                 print(f"Gmail fetch failed: {exc}")
                 return False
         try:
-            result = await asyncio.to_thread(
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._ingest_executor,
                 self._pnl_service.ingest_flex,
                 csv_path,
                 account,
@@ -3066,48 +3459,45 @@ class REPL:
         account = os.getenv("PNL_ACCOUNT") or "paper"
         api_proc = await self._ensure_process(
             name="pnl_api",
-            cmd=[
-                sys.executable,
-                "-m",
-                "uvicorn",
-                "apps.api.main:app",
-                "--reload",
-                "--port",
-                str(api_port),
-            ],
+            cmd=_pnl_server_command("pnl_api", api_port),
+            port=api_port,
         )
         if api_proc is None:
             return
-        web_env = os.environ.copy()
-        web_env["VITE_API_BASE_URL"] = f"http://localhost:{api_port}"
-        if account:
-            web_env.setdefault("VITE_DEFAULT_ACCOUNT", account)
+        # An inherited VITE_DEFAULT_ACCOUNT wins over the default; the API URL always tracks api_port.
+        web_env = {
+            "VITE_DEFAULT_ACCOUNT": account,
+            **os.environ,
+            "VITE_API_BASE_URL": f"http://localhost:{api_port}",
+        }
         web_proc = await self._ensure_process(
             name="pnl_web",
-            cmd=[
-                "npm",
-                "run",
-                "dev",
-                "--",
-                "--port",
-                str(web_port),
-            ],
+            cmd=_pnl_server_command("pnl_web", web_port),
+            port=web_port,
             cwd=Path("web"),
             env=web_env,
             stdin=asyncio.subprocess.DEVNULL,
         )
         if web_proc is None:
             return
-        api_ready = await _wait_for_port("127.0.0.1", api_port, timeout=30.0)
-        web_ready = await _wait_for_port("127.0.0.1", web_port, timeout=60.0)
-        if not api_ready:
-            print("API did not start in time. Check logs.")
-            return
+        # Both servers boot in parallel, so wait on their ports concurrently; the
+        # web probe is dropped as soon as the API is known to have failed.
+        web_wait = asyncio.create_task(_wait_for_port("127.0.0.1", web_port, timeout=60.0))
+        try:
+            api_ready = await _wait_for_port("127.0.0.1", api_port, timeout=30.0)
+            if not api_ready:
+                print("API did not start in time. Check logs.")
+                return
+            web_ready = await web_wait
+        finally:
+            web_wait.cancel()
         if not web_ready:
             print("Web dev server did not start in time. Check logs.")
             return
         url = f"http://localhost:{web_port}"
         print(f"Opening calendar: {url}")
+        import webbrowser
+
         webbrowser.open(url)
 
     async def _cmd_pnl_launch(self, args: list[str], kwargs: dict[str, str]) -> None:
@@ -3121,14 +3511,21 @@ class REPL:
         *,
         name: str,
         cmd: list[str],
+        port: int,
         cwd: Optional[Path] = None,
         env: Optional[dict[str, str]] = None,
         stdin: Optional[int] = None,
-    ) -> Optional[asyncio.subprocess.Process]:
+    ) -> Optional[asyncio.subprocess.Process | _AdoptedProcess]:
         existing = self._pnl_processes.get(name)
         if existing and existing.returncode is None:
             print(f"{name} already running (pid={existing.pid})")
             return existing
+        if _pnl_keep_running():
+            recorded = self._recorded_pnl_process(name, cmd, port)
+            if recorded is not None:
+                self._adopt_pnl_process(name, recorded, cmd, port)
+                print(f"{name} already running (pid={recorded.pid}, reattached)")
+                return recorded
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -3140,40 +3537,129 @@ class REPL:
             print(f"Failed to start {name}: {exc}")
             return None
         self._pnl_processes[name] = proc
+        self._pnl_process_records[name] = {
+            "pid": proc.pid,
+            "port": port,
+            "cmd": cmd,
+            "start": _pid_start_ticks(proc.pid),
+        }
+        # Rewriting the sidecar also drops any stale record this spawn replaced.
+        self._save_pnl_processes()
         print(f"Started {name} (pid={proc.pid})")
         return proc
 
+    def _recorded_pnl_process(
+        self,
+        name: str,
+        cmd: list[str],
+        port: int,
+        records: Optional[dict[str, object]] = None,
+    ) -> Optional[_AdoptedProcess]:
+        # A sidecar entry only counts when it was launched with the same command and
+        # port and its pid still belongs to that launch: a recycled pid has a
+        # different start time, and without one the process cannot be verified.
+        if records is None:
+            records = self._load_pnl_processes()
+        record = records.get(name)
+        if not isinstance(record, dict) or record.get("cmd") != cmd or record.get("port") != port:
+            return None
+        pid = record.get("pid")
+        start = record.get("start")
+        if type(pid) is not int or pid <= 0 or type(start) is not int:
+            return None
+        if _pid_start_ticks(pid) != start:
+            return None
+        proc = _AdoptedProcess(pid)
+        if proc.returncode is not None:
+            return None
+        return proc
+
+    def _adopt_pnl_process(
+        self, name: str, proc: _AdoptedProcess, cmd: list[str], port: int
+    ) -> None:
+        self._pnl_processes[name] = proc
+        self._pnl_process_records[name] = {
+            "pid": proc.pid,
+            "port": port,
+            "cmd": cmd,
+            "start": _pid_start_ticks(proc.pid),
+        }
+
+    def _adopt_recorded_pnl_processes(self) -> None:
+        # Keep tracking servers an earlier session left running, so rewriting the
+        # sidecar on the way out does not forget them.
+        records = self._load_pnl_processes()
+        for name, record in records.items():
+            if name in self._pnl_processes or not isinstance(record, dict):
+                continue
+            port = record.get("port")
+            cmd = _pnl_server_command(name, port) if type(port) is int else None
+            if cmd is None:
+                continue
+            proc = self._recorded_pnl_process(name, cmd, port, records)
+            if proc is not None:
+                self._adopt_pnl_process(name, proc, cmd, port)
+
+    def _load_pnl_processes(self) -> dict[str, object]:
+        if not self._pnl_processes_path:
+            return {}
+        try:
+            payload = json.loads(self._pnl_processes_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _save_pnl_processes(self) -> None:
+        # Records are only ever read back under APPS_PNL_KEEP_RUNNING=1.
+        if not self._pnl_processes_path or not _pnl_keep_running():
+            return
+        path = self._pnl_processes_path
+        records = {
+            name: record
+            for name, record in self._pnl_process_records.items()
+            if name in self._pnl_processes
+        }
+        try:
+            if not records:
+                path.unlink(missing_ok=True)
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_text(json.dumps(records, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"Failed to save PnL process state: {exc}")
+
     async def _cmd_set(self, _args: list[str], kwargs: dict[str, str]) -> None:
         if not kwargs:
             print("Usage: set key=value [key=value ...]")
             return
         for key, value in kwargs.items():
-            self._config[key] = value
+            self._cfg.set(key, value)
         print("Config updated.")
 
     async def _cmd_show(self, args: list[str], _kwargs: dict[str, str]) -> None:
         if args and args[0].lower() != "config":
             print("Usage: show config")
             return
-        account = self._config.get("account")
-        visible_keys = [key for key in sorted(self._config) if key != "account"]
-        if not self._config:
-            print("Config: (empty)")
-        else:
-            for key in visible_keys:
-                print(f"{key}={self._config[key]}")
-        if visible_keys:
-            print("")
+        config = self._config
+        account = config.get("account")
+        lines = [f"{key}={config[key]}" for key in self._cfg.sorted_keys() if key != "account"]
+        if not config:
+            lines.append("Config: (empty)")
+        elif lines:
+            lines.append("")
         default_line = "Default"
         if account:
             default_line += f" account={account}"
-        print(default_line)
-        print("  buy/sell: tif=DAY outside_rth=false")
-        print(
+        lines.append(default_line)
+        lines.append("  buy/sell: tif=DAY outside_rth=false")
+        lines.append(
             "  breakout: bar_size=1 min fast=true fast_bar=1 secs use_rth=false "
             "outside_rth=!use_rth entry=limit tif=DAY quote_age/quote_max_age=2.0 "
             "tp_exec=auto(tp2->detached70,tp3->detached)"
         )
+        _print_lines(lines)
 
     async def _cmd_disconnect(self, _args: list[str], _kwargs: dict[str, str]) -> None:
         self._connection.disconnect()
@@ -3190,6 +3676,8 @@ class REPL:
     async def _cmd_quit(self, _args: list[str], _kwargs: dict[str, str]) -> None:
         await self._stop_pnl_processes()
         await self._stop_breakouts(persist=True)
+        self._flush_pending_breakout_state()
+        self._ingest_executor.shutdown(wait=False, cancel_futures=True)
         self._should_exit = True
 
     async def _cmd_refresh(self, args: list[str], kwargs: dict[str, str]) -> None:
@@ -3198,6 +3686,8 @@ class REPL:
             return
         await self._stop_pnl_processes()
         await self._stop_breakouts(persist=True)
+        self._flush_pending_breakout_state()
+        self._ingest_executor.shutdown(wait=False, cancel_futures=True)
         self._connection.disconnect()
 
         orig_argv = getattr(sys, "orig_argv", None)
@@ -3219,28 +3709,39 @@ class REPL:
             os.execv(sys.executable, exec_args)
         except OSError as exc:
             print(f"Refresh failed: {exc}")
+            # The session carries on, so ingest needs a live worker again.
+            self._ingest_executor = _new_ingest_executor()
 
     async def _stop_pnl_processes(self) -> None:
+        keep_running = _pnl_keep_running()
+        if keep_running:
+            self._adopt_recorded_pnl_processes()
         if not self._pnl_processes:
             return
+        if keep_running:
+            # The dev servers survive quit/refresh and are reattached on the next `pnl open`.
+            for name, proc in list(self._pnl_processes.items()):
+                if proc.returncode is None:
+                    print(f"Leaving {name} running (pid={proc.pid})")
+                else:
+                    del self._pnl_processes[name]
+            self._save_pnl_processes()
+            self._pnl_processes.clear()
+            return
         for name, proc in list(self._pnl_processes.items()):
             if proc.returncode is not None:
                 continue
             print(f"Stopping {name} (pid={proc.pid})...")
             proc.terminate()
-        for name, proc in list(self._pnl_processes.items()):
-            if proc.returncode is not None:
-                continue
-            try:
-                await asyncio.wait_for(proc.wait(), timeout=5.0)
-                print(f"Stopped {name}.")
-            except asyncio.TimeoutError:
-                print(f"Force killing {name} (pid={proc.pid})...")
-                proc.kill()
-                try:
-                    await asyncio.wait_for(proc.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    print(f"Failed to kill {name} (pid={proc.pid}).")
+        # Wait on every child at once so the 5s grace period is shared, not per process.
+        await asyncio.gather(
+            *(
+                _wait_for_pnl_process_exit(name, proc)
+                for name, proc in list(self._pnl_processes.items())
+                if proc.returncode is None
+            )
+        )
+        self._pnl_processes.clear()
 
     def _log_cli_error(self, exc: BaseException, command: Optional[str], raw_input: str) -> None:
         event = CliErrorLogged.now(
@@ -3278,14 +3779,14 @@ class REPL:
                 "| buy|sell SYMBOL QTY [limit=...]"
             )
             return
-        symbol = args[0].strip().upper() if args else None
+        symbol = _normalize_symbol_key(args[0]) if args else None
         if not symbol:
             symbol = (
                 kwargs.get("symbol")
-                or _config_get(self._config, "symbol")
+                or self._cfg.get("symbol")
             )
             if symbol:
-                symbol = symbol.strip().upper()
+                symbol = _normalize_symbol_key(symbol)
         if not symbol:
             print(
                 "Usage: buy|sell SYMBOL qty=... [limit=...] [tif=DAY] "
@@ -3294,7 +3795,7 @@ class REPL:
             )
             return
         positional_qty = args[1] if len(args) > 1 else None
-        qty_raw = kwargs.get("qty") or positional_qty or _config_get(self._config, "qty")
+        qty_raw = kwargs.get("qty") or positional_qty or self._cfg.get("qty")
         if qty_raw is None:
             print(
                 "Usage: buy|sell SYMBOL qty=... [limit=...] [tif=DAY] "
@@ -3310,11 +3811,11 @@ class REPL:
         limit_raw = kwargs.get("limit")
         limit_price = float(limit_raw) if limit_raw is not None else None
         order_type = OrderType.LIMIT if limit_price is not None else OrderType.MARKET
-        tif = kwargs.get("tif") or _config_get(self._config, "tif") or "DAY"
-        outside_rth_value = kwargs.get("outside_rth") or _config_get(self._config, "outside_rth")
+        tif = kwargs.get("tif") or self._cfg.get("tif") or "DAY"
+        outside_rth_value = kwargs.get("outside_rth") or self._cfg.get("outside_rth")
         outside_rth = _parse_bool(outside_rth_value) if outside_rth_value is not None else False
-        account = kwargs.get("account") or _config_get(self._config, "account")
-        client_tag = kwargs.get("client_tag") or _config_get(self._config, "client_tag")
+        account = kwargs.get("account") or self._cfg.get("account")
+        client_tag = kwargs.get("client_tag") or self._cfg.get("client_tag")
 
         spec = OrderSpec(
             symbol=symbol,
@@ -3336,7 +3837,16 @@ class REPL:
 
 
 def _parse_bool(value: str) -> bool:
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    # Single-character flags ("y", "1", "n", "0") skip normalization entirely.
+    if len(value) == 1:
+        return value in "1yY"
+    return _parse_bool_token(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_bool_token(value: str) -> bool:
+    # REPL flags repeat a handful of tokens ("true", "false", "yes"), so memoize per string.
+    return value.strip().lower() in _TRUE_TOKENS
 
 
 def _parse_entry_type(value: str) -> OrderType:
@@ -3348,10 +3858,72 @@ def _parse_entry_type(value: str) -> OrderType:
     raise ValueError("invalid entry type")
 
 
+def _parse_order_scope(value: str) -> Optional[str]:
+    normalized = value.strip().lower()
+    if not normalized:
+        return None
+    scope = _ORDER_SCOPE_ALIASES.get(normalized)
+    if scope is None:
+        raise ValueError("invalid order scope")
+    return scope
+
+
 def _parse_ladder_execution_mode(value: object) -> LadderExecutionMode:
     return _core_parse_ladder_execution_mode(value)
 
 
+# kwarg aliases win over config keys; the first non-empty value is parsed once.
+_BREAKOUT_OPTION_FIELDS: tuple[_OptionField, ...] = (
+    _OptionField("bar_size", ("bar", "bar_size"), ("bar_size",), "1 min"),
+    _OptionField("fast_enabled", ("fast",), ("fast",), True, _parse_bool),
+    _OptionField("fast_bar_size", ("fast_bar",), ("fast_bar",), "1 secs"),
+    _OptionField("use_rth", ("rth", "use_rth"), ("use_rth",), False, _parse_bool),
+    _OptionField("outside_rth", ("outside_rth",), ("outside_rth",), None, _parse_bool),
+    _OptionField("tif", ("tif",), ("tif",), "DAY"),
+    _OptionField("account", ("account",), ("account",)),
+    _OptionField(
+        "entry_type",
+        ("entry", "entry_type"),
+        ("entry",),
+        OrderType.LIMIT,
+        _parse_entry_type,
+        "entry must be 'limit' (lmt) or 'market' (mkt)",
+    ),
+)
+
+# Resolved after the entry type is checked against the quote sources, as the
+# hand-written parsing did, so a bad value here never masks that error.
+_BREAKOUT_TUNING_OPTION_FIELDS: tuple[_OptionField, ...] = (
+    _OptionField("max_bars", ("max_bars",), ("max_bars",), None, int, "max_bars must be an integer"),
+    _OptionField(
+        "quote_max_age_seconds",
+        ("quote_age", "quote_max_age"),
+        ("quote_age", "quote_max_age"),
+        2.0,
+        float,
+        "quote_age must be a number (seconds)",
+    ),
+    _OptionField("client_tag", ("client_tag",), ("client_tag",)),
+)
+
+_TP_OPTION_FIELDS: tuple[_OptionField, ...] = (
+    _OptionField("bar_size", ("bar", "bar_size"), (), "1 min"),
+    _OptionField("use_rth", ("rth", "use_rth"), (), False, _parse_bool),
+)
+
+_BROKER_ORDERS_OPTION_FIELDS: tuple[_OptionField, ...] = (
+    _OptionField("account", ("account",), (), None, str.strip),
+    _OptionField(
+        "scope",
+        ("scope",),
+        (),
+        None,
+        _parse_order_scope,
+        "scope must be 'client' or 'all_clients'",
+    ),
+)
+
+
 def _ladder_execution_mode_label(mode: LadderExecutionMode) -> str:
     return _core_ladder_execution_mode_label(mode)
 
@@ -3365,6 +3937,8 @@ def _coerce_bool(value: object, *, default: bool = False) -> bool:
 
 
 def _coerce_int(value: object) -> Optional[int]:
+    if type(value) is int:
+        return value
     if isinstance(value, bool):
         return None
     if isinstance(value, int):
@@ -3380,6 +3954,11 @@ def _coerce_int(value: object) -> Optional[int]:
 
 
 def _coerce_float(value: object) -> Optional[float]:
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if isinstance(value, bool):
         return None
     if isinstance(value, (int, float)):
@@ -3406,6 +3985,9 @@ def _coerce_float_list(value: object) -> Optional[list[float]]:
         return None
     result: list[float] = []
     for item in value:
+        if type(item) is float:
+            result.append(item)
+            continue
         as_float = _coerce_float(item)
         if as_float is None:
             return None
@@ -3420,6 +4002,9 @@ def _coerce_int_list(value: object) -> Optional[list[int]]:
         return None
     result: list[int] = []
     for item in value:
+        if type(item) is int:
+            result.append(item)
+            continue
         as_int = _coerce_int(item)
         if as_int is None:
             return None
@@ -3428,10 +4013,10 @@ def _coerce_int_list(value: object) -> Optional[list[int]]:
 
 
 def _parse_tp_mode_token(value: str) -> Optional[int]:
-    match = _TP_MODE_TOKEN.fullmatch(value.strip())
-    if not match:
-        return None
-    return int(match.group(1))
+    count = _TP_MODE_COUNTS.get(value)
+    if count is not None:
+        return count
+    return _TP_MODE_COUNTS.get(value.strip().lower())
 
 
 def _default_breakout_client_tag(symbol: str, level: float) -> str:
@@ -3464,19 +4049,26 @@ def _parse_take_profit_ratios(value: object, expected_count: int) -> Optional[li
     return _core_parse_take_profit_ratios(value, expected_count)
 
 
-def _split_qty_by_ratios(total_qty: int, ratios: list[float]) -> list[int]:
+def _split_qty_by_ratios(total_qty: int, ratios: Sequence[float]) -> list[int]:
     return _core_split_qty_by_ratios(total_qty, ratios)
 
 
-def _validate_take_profit_levels(levels: list[float]) -> bool:
-    return _core_validate_take_profit_levels(levels)
+def _check_take_profit_ladder(levels: list[float], *, stop_loss: float) -> Optional[str]:
+    return _core_check_take_profit_ladder(levels, stop_loss=stop_loss)
+
+
+def _dump_breakout_state(payload: dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=True).encode("ascii")
 
 
 def _serialize_breakout_config(config: BreakoutRunConfig) -> dict[str, object]:
+    rule = config.rule
     return {
         "symbol": config.symbol,
         "qty": config.qty,
-        "level": config.rule.level,
+        "level": rule.level,
         "entry_type": config.entry_type.value,
         "take_profit": config.take_profit,
         "take_profits": config.take_profits,
@@ -3485,7 +4077,7 @@ def _serialize_breakout_config(config: BreakoutRunConfig) -> dict[str, object]:
         "use_rth": config.use_rth,
         "bar_size": config.bar_size,
         "fast_bar_size": config.fast_bar_size,
-        "fast_enabled": config.rule.fast_entry.enabled,
+        "fast_enabled": rule.fast_entry.enabled,
         "max_bars": config.max_bars,
         "tif": config.tif,
         "outside_rth": config.outside_rth,
@@ -3497,27 +4089,28 @@ def _serialize_breakout_config(config: BreakoutRunConfig) -> dict[str, object]:
 
 
 def _deserialize_breakout_config(payload: dict[str, object]) -> Optional[BreakoutRunConfig]:
-    symbol = _coerce_str(payload.get("symbol"))
-    level = _coerce_float(payload.get("level"))
-    qty = _coerce_int(payload.get("qty"))
+    get = payload.get
+    symbol = _coerce_str(get("symbol"))
+    level = _coerce_float(get("level"))
+    qty = _coerce_int(get("qty"))
     if not symbol or level is None or qty is None:
         return None
     if level <= 0 or qty <= 0:
         return None
     entry_type = OrderType.LIMIT
-    entry_raw = payload.get("entry_type")
+    entry_raw = get("entry_type")
     if isinstance(entry_raw, str):
         try:
             entry_type = _parse_entry_type(entry_raw)
         except ValueError:
             return None
-    take_profit = _coerce_float(payload.get("take_profit"))
-    take_profits = _coerce_float_list(payload.get("take_profits"))
+    take_profit = _coerce_float(get("take_profit"))
+    take_profits = _coerce_float_list(get("take_profits"))
     if take_profits == []:
         take_profits = None
-    if take_profits and len(take_profits) not in {2, 3}:
+    if take_profits and len(take_profits) not in _TP_LADDER_SIZES:
         return None
-    take_profit_qtys = _coerce_int_list(payload.get("take_profit_qtys"))
+    take_profit_qtys = _coerce_int_list(get("take_profit_qtys"))
     if take_profit_qtys == []:
         take_profit_qtys = None
     if take_profit_qtys is not None:
@@ -3529,24 +4122,24 @@ def _deserialize_breakout_config(payload: dict[str, object]) -> Optional[Breakou
             return None
         if sum(take_profit_qtys) != qty:
             return None
-    stop_loss = _coerce_float(payload.get("stop_loss"))
+    stop_loss = _coerce_float(get("stop_loss"))
     if take_profit is not None and take_profits:
         return None
     if stop_loss is not None and take_profit is None and not take_profits:
         return None
     if stop_loss is None and (take_profit is not None or take_profits):
         return None
-    use_rth = _coerce_bool(payload.get("use_rth"), default=False)
-    bar_size = _coerce_str(payload.get("bar_size")) or "1 min"
-    fast_bar_size = _coerce_str(payload.get("fast_bar_size")) or "1 secs"
-    fast_enabled = _coerce_bool(payload.get("fast_enabled"), default=True)
-    max_bars = _coerce_int(payload.get("max_bars"))
-    tif = _coerce_str(payload.get("tif")) or "DAY"
-    outside_rth = _coerce_bool(payload.get("outside_rth"), default=not use_rth)
-    account = _coerce_str(payload.get("account"))
-    client_tag = _coerce_str(payload.get("client_tag"))
-    quote_max_age_seconds = _coerce_float(payload.get("quote_max_age_seconds")) or 2.0
-    mode_value = payload.get("ladder_execution_mode")
+    use_rth = _coerce_bool(get("use_rth"), default=False)
+    bar_size = _coerce_str(get("bar_size")) or "1 min"
+    fast_bar_size = _coerce_str(get("fast_bar_size")) or "1 secs"
+    fast_enabled = _coerce_bool(get("fast_enabled"), default=True)
+    max_bars = _coerce_int(get("max_bars"))
+    tif = _coerce_str(get("tif")) or "DAY"
+    outside_rth = _coerce_bool(get("outside_rth"), default=not use_rth)
+    account = _coerce_str(get("account"))
+    client_tag = _coerce_str(get("client_tag"))
+    quote_max_age_seconds = _coerce_float(get("quote_max_age_seconds")) or 2.0
+    mode_value = get("ladder_execution_mode")
     try:
         ladder_execution_mode = _core_infer_ladder_execution_mode(
             mode_value=mode_value,
@@ -3566,7 +4159,7 @@ def _deserialize_breakout_config(payload: dict[str, object]) -> Optional[Breakou
     except ValueError:
         return None
     return BreakoutRunConfig(
-        symbol=symbol.strip().upper(),
+        symbol=_normalize_symbol_key(symbol),
         qty=qty,
         rule=BreakoutRuleConfig(level=level, fast_entry=FastEntryConfig(enabled=fast_enabled)),
         entry_type=entry_type,
@@ -3597,22 +4190,84 @@ def _parse_port(value: Optional[str], default: int) -> int:
         return default
 
 
+def _new_ingest_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="flex-ingest")
+
+
+def _pnl_server_command(name: str, port: int) -> Optional[list[str]]:
+    if name == "pnl_api":
+        return [sys.executable, "-m", "uvicorn", "apps.api.main:app", "--reload", "--port", str(port)]
+    if name == "pnl_web":
+        return ["npm", "run", "dev", "--", "--port", str(port)]
+    return None
+
+
+def _pnl_keep_running() -> bool:
+    return os.getenv("APPS_PNL_KEEP_RUNNING", "0") == "1"
+
+
+def _pid_start_ticks(pid: int) -> Optional[int]:
+    # Field 22 of /proc/<pid>/stat; the comm field may contain spaces, so split
+    # after its closing parenthesis. None where /proc is unavailable.
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as handle:
+            stat = handle.read()
+        return int(stat.rpartition(b")")[2].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _pid_exit_status(pid: int) -> Optional[int]:
+    try:
+        waited_pid, status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        # Not our child; a liveness probe is all that is available.
+        try:
+            os.kill(pid, 0)
+        except (ProcessLookupError, PermissionError):
+            return 0
+        return None
+    if waited_pid == 0:
+        return None
+    return os.waitstatus_to_exitcode(status)
+
+
+async def _wait_for_pnl_process_exit(name: str, proc: asyncio.subprocess.Process | _AdoptedProcess) -> None:
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5.0)
+        print(f"Stopped {name}.")
+    except asyncio.TimeoutError:
+        print(f"Force killing {name} (pid={proc.pid})...")
+        proc.kill()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            print(f"Failed to kill {name} (pid={proc.pid}).")
+
+
 async def _wait_for_port(host: str, port: int, *, timeout: float) -> bool:
     loop = asyncio.get_running_loop()
     deadline = loop.time() + timeout
-    while loop.time() < deadline:
+    delay = _PORT_PROBE_INITIAL_DELAY_SECONDS
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        # A bare non-blocking connect is enough to probe; no stream objects needed.
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
         try:
-            reader, writer = await asyncio.open_connection(host, port)
-            writer.close()
-            await writer.wait_closed()
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout=remaining)
             return True
         except OSError:
-            await asyncio.sleep(0.5)
-    return False
-
-
-def _config_get(config: dict[str, str], key: str) -> Optional[str]:
-    return config.get(key)
+            pass
+        finally:
+            sock.close()
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, _PORT_PROBE_MAX_DELAY_SECONDS)
 
 
 def _parse_symbol_tokens(
@@ -3631,7 +4286,7 @@ def _parse_symbol_tokens(
     seen: set[str] = set()
     for token in raw_tokens:
         for raw_symbol in token.split(","):
-            symbol = raw_symbol.strip().upper()
+            symbol = _normalize_symbol_key(raw_symbol)
             if not symbol or symbol in seen:
                 continue
             seen.add(symbol)
@@ -3680,75 +4335,105 @@ def _find_trade_blocking_gateway_reject_for_req(
     return None
 
 
-def _flag_aliases(command: str) -> dict[str, str]:
-    if command in {"buy", "sell"}:
-        return {
-            "q": "qty",
-            "l": "limit",
-            "t": "tif",
-            "o": "outside_rth",
-            "a": "account",
-            "c": "client_tag",
-            "s": "symbol",
-        }
-    if command == "can-trade":
-        return {
-            "s": "symbol",
-            "q": "qty",
-            "t": "tif",
-            "o": "outside_rth",
-            "e": "exchange",
-            "c": "currency",
-            "a": "account",
-        }
-    if command == "connect":
-        return {
-            "h": "host",
-            "p": "port",
-            "c": "client_id",
-            "r": "readonly",
-            "t": "timeout",
-        }
-    if command == "breakout":
-        return {
-            "s": "symbol",
-            "l": "level",
-            "q": "qty",
-            "p": "tp",
-            "x": "sl",
-            "r": "rth",
-            "b": "bar",
-            "m": "max_bars",
-            "t": "tif",
-            "o": "outside_rth",
-            "e": "entry",
-            "a": "account",
-            "c": "client_tag",
-        }
-    if command == "orders":
-        return {
-            "p": "pending",
-            "q": "qty",
-            "l": "limit",
-            "t": "tif",
-            "o": "outside_rth",
-            "a": "account",
-            "s": "scope",
-        }
-    if command == "positions":
-        return {
-            "a": "account",
-            "s": "sort",
-            "m": "min",
-        }
-    return {}
+_BUY_SELL_FLAG_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "q": "qty",
+        "l": "limit",
+        "t": "tif",
+        "o": "outside_rth",
+        "a": "account",
+        "c": "client_tag",
+        "s": "symbol",
+    }
+)
+_FLAG_ALIASES_BY_COMMAND: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "buy": _BUY_SELL_FLAG_ALIASES,
+        "sell": _BUY_SELL_FLAG_ALIASES,
+        "can-trade": MappingProxyType(
+            {
+                "s": "symbol",
+                "q": "qty",
+                "t": "tif",
+                "o": "outside_rth",
+                "e": "exchange",
+                "c": "currency",
+                "a": "account",
+            }
+        ),
+        "connect": MappingProxyType(
+            {
+                "h": "host",
+                "p": "port",
+                "c": "client_id",
+                "r": "readonly",
+                "t": "timeout",
+            }
+        ),
+        "breakout": MappingProxyType(
+            {
+                "s": "symbol",
+                "l": "level",
+                "q": "qty",
+                "p": "tp",
+                "x": "sl",
+                "r": "rth",
+                "b": "bar",
+                "m": "max_bars",
+                "t": "tif",
+                "o": "outside_rth",
+                "e": "entry",
+                "a": "account",
+                "c": "client_tag",
+            }
+        ),
+        "orders": MappingProxyType(
+            {
+                "p": "pending",
+                "q": "qty",
+                "l": "limit",
+                "t": "tif",
+                "o": "outside_rth",
+                "a": "account",
+                "s": "scope",
+            }
+        ),
+        "positions": MappingProxyType(
+            {
+                "a": "account",
+                "s": "sort",
+                "m": "min",
+            }
+        ),
+    }
+)
+_EMPTY_FLAG_ALIASES: Mapping[str, str] = MappingProxyType({})
 
 
-def _normalize_key(key: str, aliases: dict[str, str]) -> str:
-    normalized = key.strip().lstrip("-").lower().replace("-", "_")
+def _flag_aliases(command: str) -> Mapping[str, str]:
+    return _FLAG_ALIASES_BY_COMMAND.get(command, _EMPTY_FLAG_ALIASES)
+
+
+def _normalize_key(key: str, aliases: Mapping[str, str]) -> str:
+    normalized = _normalize_flag_name(key)
     return aliases.get(normalized, normalized)
 
 
+_FLAG_NAME_TRANSLATION = str.maketrans(
+    {"-": "_", **{chr(code): chr(code + 32) for code in range(ord("A"), ord("Z") + 1)}}
+)
+
+
+# The alias tables are per command, but the raw flag spellings repeat across all of them.
+@functools.lru_cache(maxsize=256)
+def _normalize_flag_name(key: str) -> str:
+    name = key.strip().lstrip("-")
+    if name.isascii():
+        # One pass lowercases and maps "-" to "_".
+        return name.translate(_FLAG_NAME_TRANSLATION)
+    return name.lower().replace("-", "_")
+
+
 def _parse_long_flag(
     token: str,
     tokens: list[str],
@@ -3769,7 +4454,7 @@ def _parse_short_flag(
     token: str,
     tokens: list[str],
     idx: int,
-    aliases: dict[str, str],
+    aliases: Mapping[str, str],
     kwargs: dict[str, str],
 ) -> int:
     body = token[1:]
@@ -3794,11 +4479,15 @@ def _is_pending_only(args: list[str], kwargs: dict[str, str]) -> bool:
     if "pending" in kwargs:
         return _parse_bool(kwargs["pending"])
     for arg in args:
-        if arg.lower() in {"pending", "--pending"}:
+        # Only args the right length can match, so most skip the lower() copy.
+        if len(arg) in _PENDING_TOKEN_LENGTHS and arg.lower() in _PENDING_TOKENS:
             return True
     return False
 
 
+_POSITION_SORT_KEY = operator.attrgetter("account", "symbol", "sec_type")
+
+
 def _format_positions_table(
     positions: list[PositionSnapshot],
     *,
@@ -3818,35 +4507,28 @@ def _format_positions_table(
     if tag_lookup:
         headers.append("tag")
     rows: list[list[str]] = []
-    for pos in sorted(positions, key=lambda item: (item.account, item.symbol, item.sec_type)):
-        tag = tag_lookup(pos.account, pos.symbol) if tag_lookup else None
-        tp_value = None
-        sl_value = None
-        if exit_lookup:
-            tp_value, sl_value = exit_lookup(pos.account, pos.symbol)
-            tp_levels = take_profits_lookup(pos.account, pos.symbol) if take_profits_lookup else None
+    for pos in sorted(positions, key=_POSITION_SORT_KEY):
+        account = pos.account
+        symbol = pos.symbol
         row = [
-            pos.account or "-",
-            pos.symbol or "-",
+            account or "-",
+            symbol or "-",
             pos.sec_type or "-",
             _format_number(pos.qty),
             _format_number(pos.avg_cost),
         ]
         if exit_lookup:
-            row.extend([_format_tp_display(tp_levels, tp_value), _format_number(sl_value)])
+            tp_value, sl_value = exit_lookup(account, symbol)
+            tp_levels = take_profits_lookup(account, symbol) if take_profits_lookup else None
+            row.append(_format_tp_display(tp_levels, tp_value))
+            row.append(_format_number(sl_value))
         if tag_lookup:
-            row.append(tag or "-")
+            row.append(tag_lookup(account, symbol) or "-")
         rows.append(row)
-    widths = [len(label) for label in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(value))
-    header = " | ".join(label.ljust(widths[idx]) for idx, label in enumerate(headers))
+    widths = [max(map(len, column)) for column in zip(headers, *rows)]
+    row_format = " | ".join(f"{{:<{width}}}" for width in widths)
     divider = "-+-".join("-" * width for width in widths)
-    lines = [header, divider]
-    for row in rows:
-        lines.append(" | ".join(value.ljust(widths[idx]) for idx, value in enumerate(row)))
-    return lines
+    return [row_format.format(*headers), divider, *itertools.starmap(row_format.format, rows)]
 
 
 def _format_active_orders_table(orders: list[ActiveOrderSnapshot]) -> list[str]:
@@ -3865,31 +4547,38 @@ def _format_active_orders_table(orders: list[ActiveOrderSnapshot]) -> list[str]:
         "account",
         "tag",
     ]
-    rows: list[list[str]] = []
-    for order in sorted(
-        orders,
-        key=lambda item: (
-            item.account or "",
-            item.symbol or "",
-            item.order_id if item.order_id is not None else -1,
-        ),
-    ):
+    rows: list[tuple[str, ...]] = []
+    # Decorate once and let tuples compare natively; the index breaks ties before
+    # the (unorderable) snapshot is reached and keeps the sort stable.
+    keyed = sorted(
+        (
+            order.account or "",
+            order.symbol or "",
+            order.order_id if order.order_id is not None else -1,
+            idx,
+            order,
+        )
+        for idx, order in enumerate(orders)
+    )
+    format_int = _format_int
+    format_number = _format_number
+    for _account, _symbol, _order_id, _idx, order in keyed:
         rows.append(
-            [
-                _format_int(order.order_id),
-                _format_int(order.parent_order_id),
+            (
+                format_int(order.order_id),
+                format_int(order.parent_order_id),
                 order.symbol or "-",
                 order.side or "-",
                 order.order_type or "-",
-                _format_number(order.qty),
-                _format_number(order.filled_qty),
-                _format_number(order.remaining_qty),
-                _format_number(order.limit_price),
-                _format_number(order.stop_price),
+                format_number(order.qty),
+                format_number(order.filled_qty),
+                format_number(order.remaining_qty),
+                format_number(order.limit_price),
+                format_number(order.stop_price),
                 order.status or "-",
                 order.account or "-",
                 order.client_tag or "-",
-            ]
+            )
         )
     return _format_simple_table(headers, rows)
 
@@ -3900,20 +4589,53 @@ def _format_int(value: Optional[int]) -> str:
     return str(value)
 
 
+def _share_qty(value: Optional[float]) -> int | float:
+    # Share books are integral; keeping them as int makes sums exact.
+    qty = value or 0
+    if isinstance(qty, float) and qty.is_integer():
+        return int(qty)
+    return qty
+
+
+def _is_flat_qty(qty: int | float) -> bool:
+    if isinstance(qty, int):
+        return qty == 0
+    return abs(qty) <= 1e-9
+
+
+# Books repeat the same few accounts and symbols on every reconciliation pass, and
+# commands keep naming the same small set of symbols.
+# Interning makes spellings that normalize alike ("DU1", "DU1.") share one key
+# object, so the position/order dict lookups hit on identity.
+@functools.lru_cache(maxsize=1024)
 def _normalize_account_key(value: Optional[str]) -> str:
     if value is None:
         return ""
-    return value.strip().rstrip(".")
+    return sys.intern(value.strip().rstrip("."))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_symbol_key(value: Optional[str]) -> str:
+    return sys.intern((value or "").strip().upper())
 
 
 def _format_number(value: Optional[float], *, precision: int = 4) -> str:
     if value is None:
         return "-"
     try:
-        formatted = f"{float(value):.{precision}f}"
+        as_float = float(value)
     except (TypeError, ValueError):
         return "-"
-    formatted = formatted.rstrip("0").rstrip(".")
+    if as_float == 0.0:
+        # -0.0 == 0.0, so they would share a cache slot; keep the sign as before.
+        return "-0" if math.copysign(1.0, as_float) < 0 else "0"
+    return _format_float(as_float, precision)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_float(value: float, precision: int) -> str:
+    # Table rows repeat the same prices and round-lot quantities.
+    formatted = f"{value:.{precision}f}".rstrip("0").rstrip(".")
     return formatted if formatted else "0"
 
 
@@ -4086,9 +4808,18 @@ def _match_prefix(text: str, options: list[str]) -> list[str]:
     return sorted({option for option in options if option.startswith(text)})
 
 
+def _match_sorted_prefix(text: str, options: list[str]) -> list[str]:
+    # `options` is sorted and unique, so the matches are one contiguous run.
+    start = bisect.bisect_left(options, text)
+    end = start
+    while end < len(options) and options[end].startswith(text):
+        end += 1
+    return options[start:end]
+
+
 def _print_exception(prefix: str, exc: BaseException) -> None:
     error_type = type(exc).__name__
-    message = str(exc).splitlines()[0].strip()
+    message = str(exc).partition("\n")[0].strip()
     if len(message) > 200:
         message = message[:197].rstrip() + "..."
     if message:
@@ -4102,7 +4833,10 @@ def _print_exception(prefix: str, exc: BaseException) -> None:
 
 
 def _format_traceback(exc: BaseException) -> str:
-    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    import traceback
+
+    # format() streams chunks; format_exception() would first copy them into a list.
+    return "".join(traceback.TracebackException.from_exception(exc).format())
 
 
 def _resolve_event_log_path() -> Optional[str]:
@@ -4117,14 +4851,120 @@ def _resolve_ops_log_path() -> Optional[str]:
     return log_path or None
 
 
+def _resolve_pnl_processes_path() -> Optional[str]:
+    # Pids mean nothing after a reboot, so the default lives in a runtime directory
+    # rather than the repo tree.
+    path = os.getenv("APPS_PNL_PROCESSES_PATH")
+    if path is None:
+        runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+        user = getattr(os, "getuid", lambda: "user")()
+        path = os.path.join(runtime_dir, f"apps-{user}", "pnl_processes.json")
+    return path or None
+
+
 def _resolve_breakout_state_path() -> Optional[str]:
     log_path = os.getenv("APPS_BREAKOUT_STATE_PATH", "apps/journal/breakout_state.json")
     return log_path or None
 
 
+# orjson is optional; both parsers accept raw bytes and raise ValueError
+# subclasses on malformed or non-UTF-8 lines.
+_loads_jsonl_line = orjson.loads if orjson is not None else json.loads
+
+_EVENT_LOG_READ_BUFFER_BYTES = 1 << 20
+_TRADES_TRACKED_EVENT_TYPES = frozenset(
+    {
+        "BreakoutConfirmed",
+        "BreakoutStopped",
+        "OrderIdAssigned",
+        "OrderStatusChanged",
+        "OrderFilled",
+        "BracketChildOrderBrokerSnapshot",
+        "BracketChildOrderStatusChanged",
+        "BracketChildOrderFilled",
+        "LadderProtectionStateChanged",
+        "LadderStopLossReplaceFailed",
+        "LadderStopLossReplaced",
+        "IbGatewayLog",
+    }
+)
+_TRADES_TRACKED_EVENT_TYPE_BYTES = frozenset(
+    name.encode("ascii") for name in _TRADES_TRACKED_EVENT_TYPES
+)
+# JsonlEventLogger writes event_type first with json.dumps' default separators.
+_JSONL_EVENT_TYPE_PREFIX = b'{"event_type": "'
+
+
+def _jsonl_event_type_hint(line: bytes) -> Optional[bytes]:
+    # None means "not logger-shaped": callers must fully parse, never drop.
+    if not line.startswith(_JSONL_EVENT_TYPE_PREFIX):
+        return None
+    start = len(_JSONL_EVENT_TYPE_PREFIX)
+    end = line.find(b'"', start)
+    if end < 0:
+        return None
+    return line[start:end]
+
+
+def _scan_trades_log(
+    log_path: str,
+    start: int,
+    today_prefixes: tuple[str, ...],
+) -> tuple[list[tuple[str, dict]], int, list[tuple[str, dict]]]:
+    # Scans from ``start`` (always a line boundary) to EOF. Returns records from
+    # complete lines, the offset just past the last of them, and records from an
+    # unterminated last line that may still be mid-append.
+    records: list[tuple[str, dict]] = []
+    partial_records: list[tuple[str, dict]] = []
+    # Every log line passes through this loop; bind its globals locally.
+    event_type_hint = _jsonl_event_type_hint
+    loads_line = _loads_jsonl_line
+    tracked_type_bytes = _TRADES_TRACKED_EVENT_TYPE_BYTES
+    tracked_types = _TRADES_TRACKED_EVENT_TYPES
+    with open(log_path, "rb", buffering=_EVENT_LOG_READ_BUFFER_BYTES) as handle:
+        handle.seek(start)
+        resume_at = start
+        for line in handle:
+            if line.endswith(b"\n"):
+                resume_at += len(line)
+                target = records
+            else:
+                target = partial_records
+            line = line.strip()
+            if not line:
+                continue
+            hinted_type = event_type_hint(line)
+            if hinted_type is not None and hinted_type not in tracked_type_bytes:
+                continue
+            try:
+                payload = loads_line(line)
+            except ValueError:
+                continue
+            if not isinstance(payload, dict):
+                continue
+            event_type = payload.get("event_type")
+            if event_type not in tracked_types:
+                continue
+            event = payload.get("event")
+            if not isinstance(event, dict):
+                continue
+            raw_timestamp = event.get("timestamp")
+            if isinstance(raw_timestamp, str) and not raw_timestamp.startswith(today_prefixes):
+                continue
+            target.append((event_type, event))
+    return records, resume_at, partial_records
+
+
 def _parse_jsonl_timestamp(value: object, local_tz) -> Optional[datetime]:
     if not value or not isinstance(value, str):
         return None
+    return _parse_jsonl_timestamp_text(value, local_tz)
+
+
+# Events from one order update share timestamp strings; tzinfo objects are
+# hashable, and the parsed datetimes are immutable, so results can be shared.
+@functools.lru_cache(maxsize=4096)
+def _parse_jsonl_timestamp_text(value: str, local_tz) -> Optional[datetime]:
     try:
         parsed = datetime.fromisoformat(value)
     except ValueError:
@@ -4135,16 +4975,20 @@ def _parse_jsonl_timestamp(value: object, local_tz) -> Optional[datetime]:
 
 
 def _is_fill_event(status: object, filled_qty: object) -> bool:
-    qty = _maybe_float(filled_qty)
+    # A canonical fill status settles it without coercing filled_qty.
+    if type(status) is str and status in _FILL_STATUS_SPELLINGS:
+        return True
+    qty = filled_qty if type(filled_qty) is float else _maybe_float(filled_qty)
     if qty is not None and qty > 0:
         return True
     if not status:
         return False
-    normalized = str(status).strip().lower()
-    return normalized in {"filled", "partiallyfilled", "partially_filled"}
+    return str(status).strip().lower() in _FILL_STATUSES
 
 
 def _maybe_float(value: object) -> Optional[float]:
+    if type(value) is float:
+        return value
     if value is None:
         return None
     try:
@@ -4171,38 +5015,78 @@ def _compute_pnl(
     qty_val = _maybe_float(qty)
     if entry is None or exit_val is None or qty_val is None:
         return None
-    side = str(entry_side or "").strip().upper()
-    sign = 1.0 if side == "BUY" else -1.0
-    return (exit_val - entry) * qty_val * sign
+    if entry_side == "BUY" or str(entry_side or "").strip().upper() == "BUY":
+        return (exit_val - entry) * qty_val
+    return -((exit_val - entry) * qty_val)
+
 
+def _print_lines(lines: Iterable[str]) -> None:
+    # One write per table instead of a print() (and its flush check) per row;
+    # str.join does the newline plumbing in C instead of an f-string per line.
+    if not isinstance(lines, list):
+        lines = list(lines)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def _format_simple_table(headers: list[str], rows: list[list[str]]) -> list[str]:
+
+def _format_simple_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> list[str]:
     if not rows:
         return []
-    widths = [len(label) for label in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(value))
-    header = " | ".join(label.ljust(widths[idx]) for idx, label in enumerate(headers))
+    widths = [max(map(len, column)) for column in zip(headers, *rows)]
+    # One str.format per row instead of a per-cell ljust generator.
+    row_format = " | ".join(f"{{:<{width}}}" for width in widths)
     divider = "-+-".join("-" * width for width in widths)
-    lines = [header, divider]
-    for row in rows:
-        lines.append(" | ".join(value.ljust(widths[idx]) for idx, value in enumerate(row)))
-    return lines
+    return [row_format.format(*headers), divider, *itertools.starmap(row_format.format, rows)]
+
+
+def _format_fill_row(
+    timestamp_local: datetime,
+    fill_type: str,
+    symbol: object,
+    side: object,
+    qty: float,
+    price: Optional[float],
+    status: object,
+    order_id: object,
+    tag: object,
+) -> list[str]:
+    return [
+        _format_time_value(timestamp_local),
+        fill_type,
+        _format_text_cell(symbol),
+        _format_text_cell(side),
+        _format_number(qty),
+        _format_number(price),
+        _format_text_cell(status),
+        _format_text_cell(order_id),
+        _format_text_cell(tag),
+    ]
+
+
+def _format_text_cell(value: object) -> str:
+    if isinstance(value, str):
+        return value or "-"
+    return str(value or "-")
+
+
+_KIND_LABELS = {"take_profit": "tp", "stop_loss": "sl"}
 
 
 def _format_kind(kind: object) -> str:
-    normalized = str(kind or "").strip().lower()
-    if normalized == "take_profit":
-        return "tp"
-    if normalized == "stop_loss":
-        return "sl"
-    if normalized:
-        return normalized
-    return "-"
+    if not kind:
+        return "-"
+    if type(kind) is str:
+        label = _KIND_LABELS.get(kind)
+        if label is not None:
+            return label
+    normalized = str(kind).strip().lower()
+    return _KIND_LABELS.get(normalized) or normalized or "-"
 
 
 def _format_time_value(value: object) -> str:
     if isinstance(value, datetime):
-        return value.strftime("%H:%M:%S.%f")[:-4]
+        return (
+            f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            f".{value.microsecond // 10000:02d}"
+        )
     return "-"
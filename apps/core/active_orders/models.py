@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActiveOrderSnapshot:
     order_id: Optional[int]
     perm_id: Optional[int]
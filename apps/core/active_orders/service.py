@@ -5,6 +5,17 @@ from typing import Optional
 from apps.core.active_orders.models import ActiveOrderSnapshot
 from apps.core.active_orders.ports import ActiveOrdersPort
 
+# Spellings callers actually pass, mapped straight to the canonical scope; anything
+# else is normalized once and looked up again.
+_SCOPE_CANON = {
+    "client": "client",
+    "Client": "client",
+    "CLIENT": "client",
+    "all_clients": "all_clients",
+    "all-clients": "all_clients",
+    "ALL_CLIENTS": "all_clients",
+}
+
 
 class ActiveOrdersService:
     def __init__(self, port: ActiveOrdersPort) -> None:
@@ -16,7 +27,9 @@ class ActiveOrdersService:
         account: Optional[str] = None,
         scope: str = "client",
     ) -> list[ActiveOrderSnapshot]:
-        normalized_scope = (scope or "client").strip().lower().replace("-", "_")
-        if normalized_scope not in {"client", "all_clients"}:
+        normalized_scope = _SCOPE_CANON.get(scope or "client")
+        if normalized_scope is None:
+            normalized_scope = _SCOPE_CANON.get(scope.strip().lower().replace("-", "_"))
+        if normalized_scope is None:
             raise ValueError("scope must be 'client' or 'all_clients'")
         return await self._port.list_active_orders(account=account, scope=normalized_scope)
@@ -14,7 +14,7 @@ class BreakoutAction(str, Enum):
     STOP = "stop"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FastEntryConfig:
     enabled: bool = True
     distance_max_cents: int = 15
@@ -28,7 +28,7 @@ class FastEntryConfig:
     scale_above_10: float = 1.25
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FastEntryThresholds:
     elapsed_seconds: int
     bucket_start_seconds: int
@@ -38,13 +38,13 @@ class FastEntryThresholds:
     spread_cents: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BreakoutRuleConfig:
     level: float
     fast_entry: FastEntryConfig = field(default_factory=FastEntryConfig)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BreakoutState:
     break_seen: bool = False
     break_bar_time: Optional[datetime] = None
@@ -61,14 +61,43 @@ def validate_take_profit_levels(levels: Sequence[float]) -> bool:
     return True
 
 
+TP_LADDER_NOT_INCREASING = "not_increasing"
+TP_LADDER_BELOW_STOP = "below_stop"
+DETACHED70_RATIOS: tuple[float, ...] = (0.7, 0.3)
+_DEFAULT_TAKE_PROFIT_RATIOS: dict[int, tuple[float, ...]] = {
+    1: (1.0,),
+    2: DETACHED70_RATIOS,
+    3: (0.6, 0.3, 0.1),
+}
+
+
+def check_take_profit_ladder(levels: Sequence[float], *, stop_loss: float) -> str | None:
+    """Check a ladder in one pass; returns a TP_LADDER_* error code or None.
+
+    Ordering is checked before the stop-loss bound, as validate_take_profit_levels
+    callers always did, so a ladder breaking both reports the ordering error.
+    """
+    if not levels or levels[0] <= 0:
+        return TP_LADDER_NOT_INCREASING
+    previous = levels[0]
+    for level in levels[1:]:
+        if level <= previous:
+            return TP_LADDER_NOT_INCREASING
+        previous = level
+    if levels[0] <= stop_loss:
+        return TP_LADDER_BELOW_STOP
+    return None
+
+
 def default_take_profit_ratios(count: int) -> list[float]:
-    if count == 1:
-        return [1.0]
-    if count == 2:
-        return [0.7, 0.3]
-    if count == 3:
-        return [0.6, 0.3, 0.1]
-    raise ValueError("count must be 1, 2, or 3")
+    return list(_default_take_profit_ratios(count))
+
+
+def _default_take_profit_ratios(count: int) -> tuple[float, ...]:
+    ratios = _DEFAULT_TAKE_PROFIT_RATIOS.get(count)
+    if ratios is None:
+        raise ValueError("count must be 1, 2, or 3")
+    return ratios
 
 
 def parse_take_profit_ratios(value: object, expected_count: int) -> list[float] | None:
@@ -77,20 +106,23 @@ def parse_take_profit_ratios(value: object, expected_count: int) -> list[float]
     text = _coerce_str(value)
     if not text:
         return None
-    parts = [part.strip() for part in text.split("-") if part.strip()]
-    if len(parts) != expected_count:
-        return None
     ratios: list[float] = []
-    for part in parts:
+    total = 0.0
+    for part in text.split("-"):
+        if not part or part.isspace():
+            continue
+        if len(ratios) == expected_count:
+            return None
+        # float() tolerates the surrounding whitespace the old strip() removed.
         try:
             parsed = float(part)
         except ValueError:
             return None
+        if parsed <= 0:
+            return None
         ratios.append(parsed)
-    if any(ratio <= 0 for ratio in ratios):
-        return None
-    total = sum(ratios)
-    if total <= 0:
+        total += parsed
+    if len(ratios) != expected_count or total <= 0:
         return None
     if total > 1.5:
         return [ratio / total for ratio in ratios]
@@ -109,14 +141,27 @@ def split_qty_by_ratios(total_qty: int, ratios: Sequence[float]) -> list[int]:
     total = sum(ratios)
     if total <= 0:
         raise ValueError("ratios sum must be positive")
-    normalized = [ratio / total for ratio in ratios]
-    raw = [total_qty * ratio for ratio in normalized]
-    qtys = [int(value) for value in raw]
-    remainder = total_qty - sum(qtys)
-    if remainder > 0:
-        fractions = [(idx, raw[idx] - qtys[idx]) for idx in range(len(qtys))]
-        fractions.sort(key=lambda item: (-item[1], item[0]))
-        for idx, _fraction in fractions[:remainder]:
+    qtys: list[int] = []
+    fractions: list[float] = []
+    assigned = 0
+    best_idx = 0
+    best_fraction = -1.0
+    for idx, ratio in enumerate(ratios):
+        exact = total_qty * (ratio / total)
+        qty = int(exact)
+        fraction = exact - qty
+        qtys.append(qty)
+        fractions.append(fraction)
+        assigned += qty
+        if fraction > best_fraction:
+            best_fraction = fraction
+            best_idx = idx
+    remainder = total_qty - assigned
+    if remainder == 1:
+        qtys[best_idx] += 1
+    elif remainder > 1:
+        order = sorted(range(len(qtys)), key=lambda idx: (-fractions[idx], idx))
+        for idx in order[:remainder]:
             qtys[idx] += 1
     if any(qty <= 0 for qty in qtys):
         raise ValueError("qty too small for requested tp allocation")
@@ -124,8 +169,7 @@ def split_qty_by_ratios(total_qty: int, ratios: Sequence[float]) -> list[int]:
 
 
 def split_take_profit_qtys(total_qty: int, count: int) -> list[int]:
-    ratios = default_take_profit_ratios(count)
-    return split_qty_by_ratios(total_qty, ratios)
+    return split_qty_by_ratios(total_qty, _default_take_profit_ratios(count))
 
 
 def stop_updates_for_take_profits(take_profits: Sequence[float], breakout_level: float) -> list[float]:
@@ -137,7 +181,7 @@ def stop_updates_for_take_profits(take_profits: Sequence[float], breakout_level:
 
 
 def expected_detached70_qtys(total_qty: int) -> list[int]:
-    return split_qty_by_ratios(total_qty, [0.7, 0.3])
+    return split_qty_by_ratios(total_qty, DETACHED70_RATIOS)
 
 
 def validate_ladder_execution_mode(
@@ -42,7 +42,7 @@ from apps.core.strategies.breakout.policy import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BreakoutRunConfig:
     symbol: str
     qty: int
@@ -40,6 +40,7 @@ from apps.adapters.broker._ib_compat import (
     attach_bar_update_event,
     attach_trade_events,
     detach_bar_update_event,
+    detach_trade_events,
     req_tickers_snapshot,
     silence_ib_client_loggers,
     what_if_order,
@@ -196,3 +197,17 @@ def test_what_if_order_falls_back_to_what_if_order_async() -> None:
     assert req_id is None
     assert state.contract is contract
     assert state.order is order
+
+
+def test_detach_trade_events_removes_registered_handlers() -> None:
+    trade = SimpleNamespace(statusEvent=_FakeEvent(), filledEvent=_FakeEvent())
+
+    def _handler(*_args: object) -> None:
+        return None
+
+    attach_trade_events(trade, on_status=_handler, on_filled=_handler)
+    detached = detach_trade_events(trade, on_status=_handler, on_filled=_handler)
+
+    assert set(detached) == {"statusEvent", "filledEvent"}
+    assert trade.statusEvent.handlers == []
+    assert trade.filledEvent.handlers == []
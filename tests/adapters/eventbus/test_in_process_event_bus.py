@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+
+from apps.adapters.eventbus.in_process import InProcessEventBus
+
+
+class _Ping:
+    pass
+
+
+def test_async_handler_task_is_retained_until_done() -> None:
+    bus = InProcessEventBus()
+    seen: list[object] = []
+    release = asyncio.Event()
+
+    async def _handler(event: _Ping) -> None:
+        await release.wait()
+        seen.append(event)
+
+    async def _run() -> None:
+        bus.subscribe(_Ping, _handler)
+        event = _Ping()
+        bus.publish(event)
+        await asyncio.sleep(0)
+        assert len(bus._handler_tasks) == 1
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert seen == [event]
+        assert not bus._handler_tasks
+
+    asyncio.run(_run())
@@ -127,3 +127,58 @@ def test_print_event_hides_empty_detached_session_restore_summary() -> None:
     )
 
     assert print_event(event) is False
+
+
+def test_leg_from_kind_caches_parsed_kind_spellings() -> None:
+    event_printer._leg_from_kind.cache_clear()
+
+    assert event_printer._leg_from_kind("det70_tp_2") == "tp2"
+    assert event_printer._leg_from_kind("stop_loss") == "sl1"
+    assert event_printer._leg_from_kind("det70_emergency_stop") == "sl_emergency"
+    assert event_printer._leg_from_kind("stop_loss") == "sl1"
+    cache_info = event_printer._leg_from_kind.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
+    assert cache_info.maxsize is not None
+
+
+def test_format_time_matches_strftime_centiseconds() -> None:
+    for microsecond in (0, 9_999, 10_000, 123_456, 999_999):
+        timestamp = datetime(2026, 1, 2, 3, 4, 5, microsecond, tzinfo=timezone.utc)
+        assert event_printer._format_time(timestamp) == timestamp.strftime("%H:%M:%S.%f")[:-4]
+
+
+def test_format_tp_list_reuses_text_per_ladder() -> None:
+    event_printer._format_tp_levels.cache_clear()
+
+    assert event_printer._format_tp_list([1.5, 2.0, 2.25]) == "[1.5,2,2.25]"
+    assert event_printer._format_tp_list([1.5, 2.0, 2.25]) == "[1.5,2,2.25]"
+    cache_info = event_printer._format_tp_levels.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+    assert cache_info.maxsize is not None
+
+
+def test_prompting_printer_writes_each_event_immediately(monkeypatch, capsys) -> None:
+    def _fake_print_event(event: object) -> bool:
+        print(f"event {event}")
+        return True
+
+    monkeypatch.setattr(event_printer, "print_event", _fake_print_event)
+    monkeypatch.setattr(event_printer, "readline", None)
+    handler = event_printer.make_prompting_event_printer("> ")
+
+    handler(1)
+    assert capsys.readouterr().out == "event 1\n> "
+    handler(2)
+    assert capsys.readouterr().out == "event 2\n> "
+
+
+def test_is_fill_event_matches_only_fill_status_spellings() -> None:
+    assert event_printer._is_fill_event("Filled", None)
+    assert event_printer._is_fill_event(" PartiallyFilled ", 0.0)
+    assert event_printer._is_fill_event("partially_filled", None)
+    assert event_printer._is_fill_event("Submitted", 5.0)
+    # The display normalizer folds these into fill statuses; fill detection does not.
+    assert not event_printer._is_fill_event("Partially Filled", None)
+    assert not event_printer._is_fill_event("fil_led", None)
+    assert not event_printer._is_fill_event("Submitted", 0.0)
+    assert not event_printer._is_fill_event(None, None)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import importlib
+from datetime import datetime, timezone
+import sys
+import types
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+from apps.cli.repl import _format_active_orders_table
+from apps.core.active_orders.models import ActiveOrderSnapshot
+
+
+def _order(order_id: int | None, *, account: str | None, symbol: str, status: str = "Submitted") -> ActiveOrderSnapshot:
+    return ActiveOrderSnapshot(
+        order_id=order_id,
+        perm_id=None,
+        parent_order_id=None,
+        client_id=1,
+        account=account,
+        symbol=symbol,
+        sec_type="STK",
+        exchange="SMART",
+        currency="USD",
+        side="SELL",
+        order_type="LMT",
+        qty=10.0,
+        filled_qty=0.0,
+        remaining_qty=10.0,
+        limit_price=11.5,
+        stop_price=None,
+        status=status,
+        tif="DAY",
+        outside_rth=False,
+        client_tag=None,
+    )
+
+
+def test_active_orders_table_sorts_by_account_symbol_then_id() -> None:
+    lines = _format_active_orders_table(
+        [
+            _order(7, account="DU2", symbol="AAPL"),
+            _order(None, account="DU1", symbol="MSFT"),
+            _order(5, account="DU1", symbol="MSFT"),
+            _order(9, account=None, symbol="TSLA"),
+            # Identical sort keys fall back to input order.
+            _order(None, account="DU1", symbol="MSFT", status="PreSubmitted"),
+        ]
+    )
+
+    body = [line.split(" | ") for line in lines[2:]]
+    assert [(cells[0].strip(), cells[2].strip(), cells[10].strip()) for cells in body] == [
+        ("9", "TSLA", "Submitted"),
+        ("-", "MSFT", "Submitted"),
+        ("-", "MSFT", "PreSubmitted"),
+        ("5", "MSFT", "Submitted"),
+        ("7", "AAPL", "Submitted"),
+    ]
+    assert body[0][8].strip() == "11.5"
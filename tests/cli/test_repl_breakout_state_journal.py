@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+from datetime import datetime, timezone
+import sys
+import types
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+import apps.cli.repl as repl_module
+from apps.cli.repl import REPL
+from apps.core.strategies.breakout.logic import BreakoutRuleConfig
+from apps.core.strategies.breakout.runner import BreakoutRunConfig
+
+
+class _FakeConnectionConfig:
+    timeout = 2.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.config = _FakeConnectionConfig()
+        self.ib = object()
+
+    def is_connected(self) -> bool:
+        return False
+
+    def status(self) -> dict[str, object]:
+        return {"connected": False}
+
+
+def _config(symbol: str, level: float) -> BreakoutRunConfig:
+    return BreakoutRunConfig(symbol=symbol, qty=10, rule=BreakoutRuleConfig(level=level))
+
+
+def _track(repl: REPL, config: BreakoutRunConfig) -> str:
+    name = repl._breakout_task_name(config)
+    repl._breakout_tasks[name] = (config, object())  # type: ignore[assignment]
+    repl._record_breakout_state_upsert(name, config)
+    return name
+
+
+def test_breakout_state_first_write_snapshots_then_appends(tmp_path) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+
+    _track(repl, _config("AAPL", 10.0))
+    assert state_path.exists()
+    assert not repl._breakout_journal_path.exists()
+
+    msft = _track(repl, _config("MSFT", 20.0))
+    repl._breakout_tasks.pop(msft)
+    repl._record_breakout_state_delete(msft)
+    _track(repl, _config("TSLA", 30.0))
+
+    lines = repl._breakout_journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["upsert", "delete", "upsert"]
+
+    reloaded = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    symbols = sorted(config.symbol for config in reloaded._load_breakout_state())
+    assert symbols == ["AAPL", "TSLA"]
+
+
+def test_breakout_state_load_skips_torn_journal_line(tmp_path, capsys) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    _track(repl, _config("AAPL", 10.0))
+    _track(repl, _config("MSFT", 20.0))
+    with repl._breakout_journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "upsert", "key": "breakout:TSLA')
+
+    configs = repl._load_breakout_state()
+
+    assert sorted(config.symbol for config in configs) == ["AAPL", "MSFT"]
+    assert "Skipped 1 invalid breakout state entries." in capsys.readouterr().out
+
+
+def test_clear_breakout_state_removes_snapshot_and_journal(tmp_path) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    _track(repl, _config("AAPL", 10.0))
+    _track(repl, _config("MSFT", 20.0))
+
+    repl._clear_breakout_state()
+
+    assert not state_path.exists()
+    assert not repl._breakout_journal_path.exists()
+    assert repl._load_breakout_state() == []
+
+
+def test_stop_breakouts_by_symbol_only_cancels_indexed_watchers(tmp_path, monkeypatch) -> None:
+    async def _run_forever(_config: BreakoutRunConfig, **_kwargs: object) -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr("apps.cli.repl.run_breakout", _run_forever)
+    repl = REPL(  # type: ignore[arg-type]
+        _FakeConnection(),
+        bar_stream=object(),  # type: ignore[arg-type]
+        order_service=types.SimpleNamespace(prewarm_session_phase=_prewarm_noop),
+        breakout_state_path=str(tmp_path / "breakout_state.json"),
+    )
+
+    async def _scenario() -> None:
+        assert repl._launch_breakout(_config("AAPL", 10.0), source="test")
+        assert repl._launch_breakout(_config("MSFT", 20.0), source="test")
+        await repl._stop_breakouts(symbol="aapl")
+        remaining = set(repl._breakout_tasks)
+        assert remaining == {repl._breakout_task_name(_config("MSFT", 20.0))}
+        assert set(repl._breakout_task_names_by_symbol) == {"MSFT"}
+        await repl._stop_breakouts()
+        assert repl._breakout_task_names_by_symbol == {}
+
+    asyncio.run(_scenario())
+
+
+async def _prewarm_noop(*, symbol: str) -> None:
+    return None
+
+
+def test_breakout_state_mutations_in_one_loop_tick_flush_once(tmp_path) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+
+    async def _scenario() -> None:
+        for symbol, level in (("AAPL", 10.0), ("MSFT", 20.0), ("TSLA", 30.0)):
+            _track(repl, _config(symbol, level))
+        assert not state_path.exists()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(_scenario())
+
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    assert [entry["symbol"] for entry in payload["breakouts"]] == ["AAPL", "MSFT", "TSLA"]
+    assert not repl._breakout_journal_path.exists()
+
+
+def test_breakout_state_snapshot_skips_identical_rewrite(tmp_path, monkeypatch) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    _track(repl, _config("AAPL", 10.0))
+    first_payload = json.loads(state_path.read_text(encoding="utf-8"))
+    dumps: list[object] = []
+    real_dump = repl_module._dump_breakout_state
+    monkeypatch.setattr(
+        repl_module,
+        "_dump_breakout_state",
+        lambda payload: dumps.append(payload) or real_dump(payload),
+    )
+
+    repl._persist_breakout_state()
+    assert dumps == []
+    assert json.loads(state_path.read_text(encoding="utf-8")) == first_payload
+
+    _track(repl, _config("MSFT", 20.0))
+    repl._persist_breakout_state()
+    assert len(dumps) == 1
+    assert not (tmp_path / "breakout_state.json.tmp").exists()
+
+
+def test_deserialize_breakout_config_coerces_numeric_fields() -> None:
+    payload = {
+        "symbol": " aapl ",
+        "level": 10,
+        "qty": 10.0,
+        "take_profits": [11, 12.5],
+        "take_profit_qtys": [7, 3.0],
+        "stop_loss": "9.5",
+    }
+
+    config = repl_module._deserialize_breakout_config(payload)
+
+    assert config is not None
+    assert config.symbol == "AAPL"
+    assert config.rule.level == 10.0 and type(config.rule.level) is float
+    assert config.qty == 10 and type(config.qty) is int
+    assert config.take_profits == [11.0, 12.5]
+    assert config.take_profit_qtys == [7, 3]
+    assert config.stop_loss == 9.5
+    assert repl_module._deserialize_breakout_config({**payload, "qty": True}) is None
+
+
+def test_breakout_cancel_then_immediate_quit_keeps_delete(tmp_path, monkeypatch) -> None:
+    async def _run_forever(_config: BreakoutRunConfig, **_kwargs: object) -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr("apps.cli.repl.run_breakout", _run_forever)
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(  # type: ignore[arg-type]
+        _FakeConnection(),
+        bar_stream=object(),  # type: ignore[arg-type]
+        order_service=types.SimpleNamespace(prewarm_session_phase=_prewarm_noop),
+        breakout_state_path=str(state_path),
+    )
+
+    async def _scenario() -> None:
+        assert repl._launch_breakout(_config("AAPL", 10.0), source="test")
+        await asyncio.sleep(0.1)
+        await repl._stop_breakouts(symbol="AAPL")
+        await repl._cmd_quit([], {})
+
+    asyncio.run(_scenario())
+
+    reloaded = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    assert reloaded._load_breakout_state() == []
+
+
+def test_breakout_cancel_journals_delete_once(tmp_path, monkeypatch) -> None:
+    async def _run_forever(_config: BreakoutRunConfig, **_kwargs: object) -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr("apps.cli.repl.run_breakout", _run_forever)
+    repl = REPL(  # type: ignore[arg-type]
+        _FakeConnection(),
+        bar_stream=object(),  # type: ignore[arg-type]
+        order_service=types.SimpleNamespace(prewarm_session_phase=_prewarm_noop),
+        breakout_state_path=str(tmp_path / "breakout_state.json"),
+    )
+
+    async def _scenario() -> None:
+        assert repl._launch_breakout(_config("AAPL", 10.0), source="test")
+        assert repl._launch_breakout(_config("MSFT", 20.0), source="test")
+        await asyncio.sleep(0.1)
+        await repl._stop_breakouts(symbol="AAPL")
+        repl._flush_pending_breakout_state()
+
+    asyncio.run(_scenario())
+
+    lines = repl._breakout_journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["delete"]
+
+
+def test_breakout_journal_appends_after_truncated_line(tmp_path) -> None:
+    state_path = tmp_path / "breakout_state.json"
+    repl = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    _track(repl, _config("AAPL", 10.0))
+    _track(repl, _config("MSFT", 20.0))
+    # A crash mid-append leaves a newline-less fragment, cut inside a UTF-8 sequence.
+    with repl._breakout_journal_path.open("ab") as handle:
+        handle.write(b'{"op": "upsert", "key": "breakout:TSLA\xe2\x82')
+
+    _track(repl, _config("NVDA", 30.0))
+
+    lines = repl._breakout_journal_path.read_bytes().splitlines()
+    assert lines[-2].endswith(b"\xe2\x82")
+    assert json.loads(lines[-1])["key"] == repl._breakout_task_name(_config("NVDA", 30.0))
+    reloaded = REPL(_FakeConnection(), breakout_state_path=str(state_path))  # type: ignore[arg-type]
+    symbols = sorted(config.symbol for config in reloaded._load_breakout_state())
+    assert symbols == ["AAPL", "MSFT", "NVDA"]
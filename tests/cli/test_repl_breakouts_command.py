@@ -33,7 +33,7 @@ except Exception:
     ib_client_stub.parse_ib_datetime = _parse_ib_datetime
     sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
 
-from apps.cli.repl import REPL
+from apps.cli.repl import REPL, _match_prefix, _match_sorted_prefix
 
 
 class _FakeConnectionConfig:
@@ -46,6 +46,9 @@ class _FakeConnection:
         self.config = _FakeConnectionConfig()
         self.ib = object()
 
+    def is_connected(self) -> bool:
+        return self._connected
+
     def status(self) -> dict[str, object]:
         return {"connected": self._connected}
 
@@ -63,6 +66,16 @@ def test_breakouts_command_registration_and_completion() -> None:
     assert "cancel" in completion_tokens
 
 
+def test_command_name_completion_matches_prefix_scan() -> None:
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+    names = repl._command_names()
+
+    for text in ("", "b", "break", "breakouts", "p", "q", "zzz"):
+        assert _match_sorted_prefix(text, names) == _match_prefix(text, names)
+    assert "breakouts" in _match_sorted_prefix("break", names)
+    assert repl._command_names() is names
+
+
 def test_cmd_breakouts_shows_running_watchers_table(capsys) -> None:
     repl = REPL(_FakeConnection())  # type: ignore[arg-type]
 
@@ -79,3 +92,88 @@ def test_cmd_breakouts_rejects_extra_args(capsys) -> None:
 
     captured = capsys.readouterr()
     assert "breakouts" in captured.out
+
+
+def test_cmd_set_invalidates_cached_config_values() -> None:
+    repl = REPL(_FakeConnection(), initial_config={"max_bars": "5"})  # type: ignore[arg-type]
+
+    assert repl._cfg.parsed("max_bars", int) == 5
+    version = repl._cfg.version
+
+    asyncio.run(repl._cmd_set([], {"max_bars": "7"}))
+
+    assert repl._cfg.version == version + 1
+    assert repl._cfg.parsed("max_bars", int) == 7
+    assert repl._config["max_bars"] == "7"
+
+
+def test_cmd_show_lists_config_keys_sorted_after_set(capsys) -> None:
+    repl = REPL(_FakeConnection(), initial_config={"tif": "DAY", "account": "DU1"})  # type: ignore[arg-type]
+
+    asyncio.run(repl._cmd_set([], {"bar_size": "5 mins", "max_bars": "7", "tif": "GTC"}))
+    capsys.readouterr()
+    asyncio.run(repl._cmd_show([], {}))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == ["bar_size=5 mins", "max_bars=7", "tif=GTC"]
+    assert repl._cfg.sorted_keys() == ["account", "bar_size", "max_bars", "tif"]
+
+
+def test_parse_line_plain_and_quoted_input_tokenize_alike() -> None:
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+
+    plain = repl._parse_line("buy AAPL qty=10 -l 12.5")
+    quoted = repl._parse_line("buy 'AAPL' qty=\"10\" -l 12.5")
+
+    assert plain == quoted
+    assert plain[0] == "buy"
+    assert repl._parse_line('buy "AAPL') == (None, [], {})
+    assert repl._resolve_command("reload") is repl._commands["refresh"]
+    assert repl._resolve_command("nope") is None
+
+
+def test_cmd_help_lists_commands_sorted(capsys) -> None:
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+
+    asyncio.run(repl._cmd_help([], {}))
+    first = capsys.readouterr().out
+    asyncio.run(repl._cmd_help([], {}))
+
+    names = [line.split()[0] for line in first.splitlines()]
+    assert names == sorted(repl._commands)
+    assert capsys.readouterr().out == first
+
+
+def test_cmd_breakout_reports_ladder_errors_before_tp_alloc(capsys) -> None:
+    repl = REPL(  # type: ignore[arg-type]
+        _FakeConnection(connected=True),
+        bar_stream=object(),  # type: ignore[arg-type]
+        order_service=types.SimpleNamespace(),  # type: ignore[arg-type]
+    )
+    base = {"level": "10", "qty": "10", "entry": "market", "sl": "9.5", "tp_alloc": "bad"}
+
+    # Below the stop and not increasing: the ordering error wins, then tp_alloc.
+    asyncio.run(repl._cmd_breakout(["AAPL"], {**base, "tp": "9-8"}))
+    asyncio.run(repl._cmd_breakout(["AAPL"], {**base, "tp": "11-12"}))
+
+    assert capsys.readouterr().out.splitlines() == [
+        "tp ladder levels must be strictly increasing and greater than zero",
+        "tp_alloc must match ladder size, e.g. 70-30 or 60-30-10",
+    ]
+
+
+def test_cmd_breakout_checks_entry_quote_source_before_tuning_options(capsys) -> None:
+    repl = REPL(  # type: ignore[arg-type]
+        _FakeConnection(connected=True),
+        bar_stream=object(),  # type: ignore[arg-type]
+        order_service=types.SimpleNamespace(),  # type: ignore[arg-type]
+    )
+    base = {"level": "10", "qty": "10", "max_bars": "many"}
+
+    asyncio.run(repl._cmd_breakout(["AAPL"], base))
+    asyncio.run(repl._cmd_breakout(["AAPL"], {**base, "entry": "market"}))
+
+    assert capsys.readouterr().out.splitlines() == [
+        "limit entry requires quote_port or quote_stream to be configured",
+        "max_bars must be an integer",
+    ]
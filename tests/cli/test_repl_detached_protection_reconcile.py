@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import importlib
 from datetime import datetime, timezone
 import sys
@@ -40,6 +41,7 @@ from apps.core.ops.events import (
     DetachedProtectionReconciliationCompleted,
     DetachedSessionRestoreCompleted,
     DetachedSessionRestored,
+    OrphanExitOrderDetected,
 )
 from apps.core.positions.models import PositionSnapshot
 
@@ -62,6 +64,9 @@ class _FakeConnection:
         self.config = _FakeConnectionConfig()
         self.ib = object()
 
+    def is_connected(self) -> bool:
+        return self._connected
+
     def status(self) -> dict[str, object]:
         return {"connected": self._connected}
 
@@ -230,3 +235,67 @@ def test_restore_detached_sessions_publishes_restored_and_summary_events() -> No
     assert len(summary_events) == 1
     assert summary_events[0].restored_count == 1
     assert summary_events[0].protected_count == 1
+
+
+class _ConcurrentCancelOrderService:
+    def __init__(self, *, failing_order_id: int) -> None:
+        self._failing_order_id = failing_order_id
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def cancel_order(self, spec):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if spec.order_id == self._failing_order_id:
+            raise RuntimeError("not found")
+        return types.SimpleNamespace(order_id=spec.order_id, status="PendingCancel")
+
+
+def test_broker_cancel_all_issues_cancels_concurrently(capsys) -> None:
+    order_service = _ConcurrentCancelOrderService(failing_order_id=102)
+    repl = REPL(
+        _FakeConnection(connected=True),  # type: ignore[arg-type]
+        order_service=order_service,  # type: ignore[arg-type]
+        active_orders_service=_FakeActiveOrdersService(
+            [
+                _stop_order(order_id=101, account="DU1", symbol="AAPL", remaining_qty=70),
+                _tp_order(order_id=102, account="DU1", symbol="AAPL", remaining_qty=70),
+            ]
+        ),  # type: ignore[arg-type]
+    )
+
+    asyncio.run(repl._cmd_order_broker_cancel_all([], {}))
+
+    captured = capsys.readouterr()
+    assert order_service.max_in_flight == 2
+    assert "requested=1 failed=1" in captured.out
+    assert "Cancel failed: order_id=102 error=not found" in captured.out
+
+
+def test_reconcile_orphan_exit_orders_flags_only_flat_positions() -> None:
+    bus = _FakeEventBus()
+    positions = [
+        _position(account="DU1", symbol="AAPL", qty=100.0),
+        _position(account="DU1", symbol="AAPL", qty=-100.0),
+        _position(account="DU1", symbol="MSFT", qty=0.5),
+    ]
+    orders = [
+        dataclasses.replace(
+            _stop_order(order_id=order_id, account="DU1", symbol=symbol, remaining_qty=10),
+            parent_order_id=order_id - 1,
+        )
+        for order_id, symbol in ((101, "AAPL"), (201, "MSFT"))
+    ]
+    repl = REPL(
+        _FakeConnection(connected=True),  # type: ignore[arg-type]
+        positions_service=_FakePositionsService(positions),  # type: ignore[arg-type]
+        active_orders_service=_FakeActiveOrdersService(orders),  # type: ignore[arg-type]
+        event_bus=bus,  # type: ignore[arg-type]
+    )
+
+    asyncio.run(repl._reconcile_orphan_exit_orders(trigger="test"))
+
+    detected = [event for event in bus.events if isinstance(event, OrphanExitOrderDetected)]
+    assert [event.order_id for event in detected] == [101]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+from datetime import datetime, timezone
+import sys
+import types
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from apps.cli.repl import REPL
+
+
+class _FakeConnectionConfig:
+    timeout = 2.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.config = _FakeConnectionConfig()
+        self.ib = object()
+
+    def is_connected(self) -> bool:
+        return False
+
+    def status(self) -> dict[str, object]:
+        return {"connected": False}
+
+
+class _FakePnlService:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Path, str, str, str]] = []
+
+    def ingest_flex(self, csv_path: Path, account: str, source: str) -> SimpleNamespace:
+        self.calls.append((csv_path, account, source, threading.current_thread().name))
+        return SimpleNamespace(days_ingested=2, rows_read=5, rows_used=4, csv_path=csv_path)
+
+
+def test_ingest_flex_runs_on_dedicated_executor_until_quit(capsys) -> None:
+    pnl_service = _FakePnlService()
+    repl = REPL(_FakeConnection(), pnl_service=pnl_service)  # type: ignore[arg-type]
+
+    async def _scenario() -> None:
+        await repl._cmd_ingest_flex(["flex.csv"], {"account": "DU1"})
+        await repl._cmd_quit([], {})
+
+    asyncio.run(_scenario())
+
+    ((csv_path, account, source, thread_name),) = pnl_service.calls
+    assert (csv_path, account, source) == (Path("flex.csv"), "DU1", "flex")
+    assert thread_name.startswith("flex-ingest")
+    assert "Ingested 2 days (rows read=5, used=4) from flex.csv" in capsys.readouterr().out
+    assert repl._ingest_executor._shutdown
+
+
+class _DisconnectingConnection(_FakeConnection):
+    def disconnect(self) -> None:
+        return None
+
+
+def test_ingest_flex_still_runs_after_failed_refresh(monkeypatch, tmp_path, capsys) -> None:
+    monkeypatch.setenv("APPS_PNL_PROCESSES_PATH", str(tmp_path / "pnl_processes.json"))
+
+    def _failing_execv(*_args: object) -> None:
+        raise OSError("exec format error")
+
+    monkeypatch.setattr("apps.cli.repl.os.execv", _failing_execv)
+    pnl_service = _FakePnlService()
+    repl = REPL(_DisconnectingConnection(), pnl_service=pnl_service)  # type: ignore[arg-type]
+
+    async def _scenario() -> None:
+        await repl._cmd_refresh([], {})
+        await repl._cmd_ingest_flex(["flex.csv"], {"account": "DU1"})
+
+    asyncio.run(_scenario())
+
+    output = capsys.readouterr().out
+    assert "Refresh failed: exec format error" in output
+    assert "Ingested 2 days" in output
+    assert len(pnl_service.calls) == 1
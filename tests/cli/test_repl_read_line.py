@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+from datetime import datetime, timezone
+import sys
+import types
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+from apps.cli.repl import REPL
+
+
+class _FakeConnectionConfig:
+    timeout = 2.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.config = _FakeConnectionConfig()
+        self.ib = object()
+
+    def is_connected(self) -> bool:
+        return False
+
+    def status(self) -> dict[str, object]:
+        return {"connected": False}
+
+
+def test_read_line_uses_loop_reader_for_piped_stdin(monkeypatch, capsys) -> None:
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"orders\r\nquit\n")
+    os.close(write_fd)
+    monkeypatch.setattr(sys, "stdin", os.fdopen(read_fd, "r"))
+
+    def _unexpected_input(_prompt: str) -> str:
+        raise AssertionError("piped stdin must not go through input()")
+
+    monkeypatch.setattr("builtins.input", _unexpected_input)
+    repl = REPL(_FakeConnection(), prompt="> ")  # type: ignore[arg-type]
+
+    async def _scenario() -> list[str]:
+        lines = [await repl._read_line("> "), await repl._read_line("> ")]
+        try:
+            await repl._read_line("> ")
+        except EOFError:
+            lines.append("<eof>")
+        return lines
+
+    try:
+        assert asyncio.run(_scenario()) == ["orders", "quit", "<eof>"]
+    finally:
+        sys.stdin.close()
+    assert capsys.readouterr().out == "> > > "
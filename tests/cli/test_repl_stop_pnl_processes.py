@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import os
+import socket
+import subprocess
+from datetime import datetime, timezone
+import sys
+import types
+
+import pytest
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+import apps.cli.repl as repl_module
+from apps.cli.repl import REPL
+
+
+class _FakeConnectionConfig:
+    timeout = 2.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.config = _FakeConnectionConfig()
+        self.ib = object()
+
+    def is_connected(self) -> bool:
+        return False
+
+    def status(self) -> dict[str, object]:
+        return {"connected": False}
+
+
+class _SlowProcess:
+    def __init__(self, pid: int, exit_delay: float) -> None:
+        self.pid = pid
+        self.returncode: int | None = None
+        self.terminated = False
+        self._exit_delay = exit_delay
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+    async def wait(self) -> int:
+        await asyncio.sleep(self._exit_delay)
+        self.returncode = 0
+        return 0
+
+
+def test_stop_pnl_processes_waits_for_children_concurrently(monkeypatch, tmp_path, capsys) -> None:
+    monkeypatch.setenv("APPS_PNL_PROCESSES_PATH", str(tmp_path / "pnl_processes.json"))
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+    api = _SlowProcess(1, 0.2)
+    web = _SlowProcess(2, 0.2)
+    repl._pnl_processes = {"pnl api": api, "pnl web": web}  # type: ignore[dict-item]
+
+    async def _scenario() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await repl._stop_pnl_processes()
+        return loop.time() - started
+
+    elapsed = asyncio.run(_scenario())
+
+    assert api.terminated and web.terminated
+    assert api.returncode == 0 and web.returncode == 0
+    assert elapsed < 0.35
+    output = capsys.readouterr().out
+    assert "Stopped pnl api." in output
+    assert "Stopped pnl web." in output
+
+
+def _record(pid: int, port: int, cmd: list[str], start: int | None) -> dict[str, object]:
+    return {"pid": pid, "port": port, "cmd": cmd, "start": start}
+
+
+def _idle_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def _unexpected_spawn(*_args, **_kwargs):
+    raise AssertionError("a verified recorded process must not be respawned")
+
+
+def test_keep_running_leaves_pnl_processes_for_reattach(monkeypatch, tmp_path, capsys) -> None:
+    state_path = tmp_path / "pnl_processes.json"
+    monkeypatch.setenv("APPS_PNL_PROCESSES_PATH", str(state_path))
+    monkeypatch.setenv("APPS_PNL_KEEP_RUNNING", "1")
+    cmd = ["uvicorn", "apps.api.main:app"]
+    # Nothing listens on the port: a verified server that is still booting is
+    # reattached rather than respawned.
+    port = _idle_port()
+
+    async def _scenario() -> None:
+        first = REPL(_FakeConnection())  # type: ignore[arg-type]
+        live = _SlowProcess(os.getpid(), 0.0)
+        first._pnl_processes = {"pnl_api": live}  # type: ignore[dict-item]
+        first._pnl_process_records = {
+            "pnl_api": _record(live.pid, port, cmd, repl_module._pid_start_ticks(live.pid))
+        }
+        await first._stop_pnl_processes()
+        assert not live.terminated
+        assert json.loads(state_path.read_text(encoding="utf-8"))["pnl_api"]["pid"] == os.getpid()
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", _unexpected_spawn)
+        second = REPL(_FakeConnection())  # type: ignore[arg-type]
+        proc = await second._ensure_process(name="pnl_api", cmd=cmd, port=port)
+        assert proc is not None and proc.pid == os.getpid()
+        assert proc.returncode is None
+        assert second._recorded_pnl_process("pnl_api", ["other"], port) is None
+
+    asyncio.run(_scenario())
+    assert "reattached" in capsys.readouterr().out
+
+
+class _SpawnedProcess:
+    pid = 4242
+    returncode = None
+
+
+@pytest.mark.parametrize("keep_running", ["1", "0"])
+def test_ensure_process_spawns_over_unverifiable_record(monkeypatch, tmp_path, keep_running) -> None:
+    state_path = tmp_path / "pnl_processes.json"
+    monkeypatch.setenv("APPS_PNL_PROCESSES_PATH", str(state_path))
+    monkeypatch.setenv("APPS_PNL_KEEP_RUNNING", keep_running)
+    cmd = ["uvicorn", "apps.api.main:app"]
+    port = _idle_port()
+    own_start = repl_module._pid_start_ticks(os.getpid())
+    # Opted in, a live pid with a different start time is a recycled pid; opted
+    # out, even a matching record is never consulted.
+    start = own_start + 1 if keep_running == "1" else own_start
+    state_path.write_text(json.dumps({"pnl_api": _record(os.getpid(), port, cmd, start)}))
+    spawned: list[tuple[str, ...]] = []
+
+    async def _fake_spawn(*args, **_kwargs):
+        spawned.append(args)
+        return _SpawnedProcess()
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _fake_spawn)
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+
+    proc = asyncio.run(repl._ensure_process(name="pnl_api", cmd=cmd, port=port))
+
+    assert isinstance(proc, _SpawnedProcess)
+    assert spawned == [tuple(cmd)]
+    if keep_running == "1":
+        assert json.loads(state_path.read_text(encoding="utf-8"))["pnl_api"]["pid"] == 4242
+
+
+def test_quit_ignores_recorded_servers_without_keep_running(monkeypatch, tmp_path) -> None:
+    state_path = tmp_path / "pnl_processes.json"
+    monkeypatch.setenv("APPS_PNL_PROCESSES_PATH", str(state_path))
+    server = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        port = _idle_port()
+        cmd = repl_module._pnl_server_command("pnl_api", port)
+        start = repl_module._pid_start_ticks(server.pid)
+        state_path.write_text(json.dumps({"pnl_api": _record(server.pid, port, cmd, start)}))
+        repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+
+        asyncio.run(repl._cmd_quit([], {}))
+
+        assert server.poll() is None
+    finally:
+        server.kill()
+        server.wait()
+
+
+def test_resolve_pnl_processes_path_defaults_to_runtime_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv("APPS_PNL_PROCESSES_PATH", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    path = repl_module._resolve_pnl_processes_path()
+
+    assert path is not None and path.startswith(str(tmp_path))
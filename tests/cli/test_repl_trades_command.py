@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+from datetime import datetime, timedelta, timezone
+import sys
+import types
+
+_IB_CLIENT_MODULE = "apps.adapters.broker._ib_client"
+
+try:
+    importlib.import_module(_IB_CLIENT_MODULE)
+except Exception:
+    ib_client_stub = types.ModuleType(_IB_CLIENT_MODULE)
+
+    def _stub_type(name: str):
+        return type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+
+    def _parse_ib_datetime(_value: object) -> datetime:
+        return datetime.now(timezone.utc)
+
+    ib_client_stub.IB = _stub_type("IB")
+    ib_client_stub.Stock = _stub_type("Stock")
+    ib_client_stub.Ticker = _stub_type("Ticker")
+    ib_client_stub.BarData = _stub_type("BarData")
+    ib_client_stub.Trade = _stub_type("Trade")
+    ib_client_stub.MarketOrder = _stub_type("MarketOrder")
+    ib_client_stub.LimitOrder = _stub_type("LimitOrder")
+    ib_client_stub.StopOrder = _stub_type("StopOrder")
+    ib_client_stub.StopLimitOrder = _stub_type("StopLimitOrder")
+    ib_client_stub.IB_CLIENT_BACKEND = "test-stub"
+    ib_client_stub.UNSET_DOUBLE = float("nan")
+    ib_client_stub.parse_ib_datetime = _parse_ib_datetime
+    sys.modules[_IB_CLIENT_MODULE] = ib_client_stub
+
+import apps.cli.repl as repl_module
+from apps.cli.repl import REPL, _jsonl_event_type_hint, _scan_trades_log
+
+
+class _FakeConnectionConfig:
+    timeout = 2.0
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.config = _FakeConnectionConfig()
+        self.ib = object()
+
+    def is_connected(self) -> bool:
+        return False
+
+    def status(self) -> dict[str, object]:
+        return {"connected": False}
+
+
+_TAG = "breakout:AAPL:10"
+
+
+def _line(event_type: str, event: dict[str, object]) -> str:
+    event = {"timestamp": datetime.now().astimezone().isoformat(), **event}
+    return json.dumps({"event_type": event_type, "event": event})
+
+
+def _run_trades(monkeypatch, tmp_path, lines: list[str], *, raw_prefix: bytes = b"") -> None:
+    log_path = tmp_path / "events.jsonl"
+    log_path.write_bytes(raw_prefix + ("\n".join(lines) + "\n").encode("utf-8"))
+    monkeypatch.setenv("APPS_EVENT_LOG_PATH", str(log_path))
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+    asyncio.run(repl._cmd_trades([], {}))
+
+
+def _completed_breakout_lines() -> list[str]:
+    spec = {"symbol": "AAPL", "side": "BUY", "qty": 10, "client_tag": _TAG}
+    return [
+        _line(
+            "BreakoutConfirmed",
+            {"symbol": "AAPL", "level": 10.0, "take_profits": [11.0], "stop_loss": 9.5, "client_tag": _TAG},
+        ),
+        _line("OrderIdAssigned", {"spec": spec, "order_id": 101}),
+        _line(
+            "OrderFilled",
+            {
+                "spec": spec,
+                "order_id": 101,
+                "status": "Filled",
+                "filled_qty": 10,
+                "avg_fill_price": 10.05,
+                "remaining_qty": 0,
+            },
+        ),
+        _line(
+            "BracketChildOrderFilled",
+            {
+                "kind": "take_profit",
+                "symbol": "AAPL",
+                "side": "SELL",
+                "price": 11.0,
+                "order_id": 102,
+                "parent_order_id": 101,
+                "status": "Filled",
+                "filled_qty": 10,
+                "avg_fill_price": 11.0,
+                "client_tag": _TAG,
+            },
+        ),
+    ]
+
+
+def test_trades_reports_fills_and_completed_breakout(monkeypatch, tmp_path, capsys) -> None:
+    _run_trades(monkeypatch, tmp_path, _completed_breakout_lines())
+
+    output = capsys.readouterr().out
+    fills_section = output.split("Breakout lifecycle today:")[0]
+    assert "entry" in fills_section
+    assert "| 101 " in fills_section
+    assert "| 102 " in fills_section
+    completed_section = output.split("Completed breakout trades (full exits only):")[1]
+    assert "No completed breakout trades found today." not in completed_section
+    assert _TAG in completed_section
+    assert "9.5" in completed_section
+
+
+def test_trades_skips_malformed_and_untracked_lines(monkeypatch, tmp_path, capsys) -> None:
+    noise = [
+        "{not json",
+        "[1, 2, 3]",
+        _line("BarReceived", {"symbol": "AAPL", "close": 10.0}),
+        "",
+    ]
+    _run_trades(monkeypatch, tmp_path, noise + _completed_breakout_lines(), raw_prefix=b"\xff\xfe torn\n")
+
+    output = capsys.readouterr().out
+    assert "No fills found today." not in output
+    assert _TAG in output.split("Completed breakout trades (full exits only):")[1]
+
+
+def test_jsonl_event_type_hint_reads_logger_prefix_only() -> None:
+    assert _jsonl_event_type_hint(_line("OrderFilled", {}).encode()) == b"OrderFilled"
+    assert _jsonl_event_type_hint(b'{"event": {}, "event_type": "OrderFilled"}') is None
+    assert _jsonl_event_type_hint(b'{"event_type": "Trunc') is None
+
+
+def test_trades_parses_lines_with_non_logger_key_order(monkeypatch, tmp_path, capsys) -> None:
+    reordered = [
+        json.dumps({"event": json.loads(line)["event"], "event_type": json.loads(line)["event_type"]})
+        for line in _completed_breakout_lines()
+    ]
+    _run_trades(monkeypatch, tmp_path, reordered)
+
+    assert _TAG in capsys.readouterr().out.split("Completed breakout trades (full exits only):")[1]
+
+
+def test_trades_ignores_events_from_previous_days(monkeypatch, tmp_path, capsys) -> None:
+    stale_timestamp = (datetime.now().astimezone() - timedelta(days=3)).isoformat()
+    stale = [
+        json.dumps({**json.loads(line), "event": {**json.loads(line)["event"], "timestamp": stale_timestamp}})
+        for line in _completed_breakout_lines()
+    ]
+    _run_trades(monkeypatch, tmp_path, stale)
+
+    output = capsys.readouterr().out
+    assert "No fills found today." in output
+    assert "No breakout sessions found today." in output
+
+
+def test_trades_keeps_todays_events_logged_in_utc(monkeypatch, tmp_path, capsys) -> None:
+    utc_timestamp = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+    utc_lines = [
+        json.dumps({**json.loads(line), "event": {**json.loads(line)["event"], "timestamp": utc_timestamp}})
+        for line in _completed_breakout_lines()
+    ]
+    _run_trades(monkeypatch, tmp_path, utc_lines)
+
+    assert _TAG in capsys.readouterr().out.split("Completed breakout trades (full exits only):")[1]
+
+
+def test_trades_lists_manual_child_fill_once_per_execution(monkeypatch, tmp_path, capsys) -> None:
+    child_fill = {
+        "kind": "stop_loss",
+        "symbol": "MSFT",
+        "side": "SELL",
+        "price": 20.0,
+        "order_id": 202,
+        "parent_order_id": 201,
+        "status": "Filled",
+        "filled_qty": 5,
+        "client_tag": "manual",
+    }
+    _run_trades(monkeypatch, tmp_path, [_line("BracketChildOrderFilled", child_fill)] * 3)
+
+    fills_section = capsys.readouterr().out.split("Breakout lifecycle today:")[0]
+    assert fills_section.count("| 202 ") == 1
+
+
+def _today_prefixes() -> tuple[str, ...]:
+    today = datetime.now().astimezone().date()
+    return tuple((today + timedelta(days=delta)).isoformat() for delta in (-1, 0, 1))
+
+
+def test_scan_trades_log_resumes_after_last_complete_line(tmp_path) -> None:
+    log_path = tmp_path / "events.jsonl"
+    lines = ["{torn", _line("BarReceived", {})] + _completed_breakout_lines()
+    complete = "\n".join(lines[:-1]) + "\n"
+    log_path.write_text(complete + lines[-1], encoding="utf-8")
+    prefixes = _today_prefixes()
+
+    records, resume_at, partial_records = _scan_trades_log(str(log_path), 0, prefixes)
+
+    assert [event_type for event_type, _ in records] == ["BreakoutConfirmed", "OrderIdAssigned", "OrderFilled"]
+    assert [event_type for event_type, _ in partial_records] == ["BracketChildOrderFilled"]
+    assert resume_at == len(complete.encode("utf-8"))
+    assert _scan_trades_log(str(log_path), resume_at, prefixes) == ([], resume_at, partial_records)
+
+
+def test_trades_rescans_only_appended_lines(monkeypatch, tmp_path, capsys) -> None:
+    lines = _completed_breakout_lines()
+    log_path = tmp_path / "events.jsonl"
+    first_line = lines[0] + "\n"
+    # The second line is mid-append: parsed for this call, re-read next time.
+    log_path.write_bytes((first_line + lines[1]).encode("utf-8"))
+    monkeypatch.setenv("APPS_EVENT_LOG_PATH", str(log_path))
+    repl = REPL(_FakeConnection())  # type: ignore[arg-type]
+
+    asyncio.run(repl._cmd_trades([], {}))
+    assert repl._trades_log_cache.offset == len(first_line.encode("utf-8"))
+    assert len(repl._trades_log_cache.records) == 1
+
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n" + "\n".join(lines[2:]) + "\n")
+    scanned_from: list[int] = []
+    real_scan = repl_module._scan_trades_log
+    monkeypatch.setattr(
+        repl_module,
+        "_scan_trades_log",
+        lambda path, start, prefixes: scanned_from.append(start) or real_scan(path, start, prefixes),
+    )
+    capsys.readouterr()
+    asyncio.run(repl._cmd_trades([], {}))
+
+    assert scanned_from == [len(first_line.encode("utf-8"))]
+    assert len(repl._trades_log_cache.records) == 4
+    assert _TAG in capsys.readouterr().out.split("Completed breakout trades (full exits only):")[1]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from apps.core.active_orders.service import ActiveOrdersService
+
+
+class _RecordingPort:
+    def __init__(self) -> None:
+        self.scopes: list[str] = []
+
+    async def list_active_orders(self, *, account=None, scope: str = "client"):
+        self.scopes.append(scope)
+        return []
+
+
+@pytest.mark.parametrize(
+    ("scope", "expected"),
+    [
+        ("client", "client"),
+        ("", "client"),
+        (" Client ", "client"),
+        ("all_clients", "all_clients"),
+        ("all-clients", "all_clients"),
+        ("All-Clients", "all_clients"),
+    ],
+)
+def test_list_active_orders_canonicalizes_scope(scope: str, expected: str) -> None:
+    port = _RecordingPort()
+    service = ActiveOrdersService(port)
+
+    asyncio.run(service.list_active_orders(scope=scope))
+
+    assert port.scopes == [expected]
+
+
+def test_list_active_orders_rejects_unknown_scope() -> None:
+    service = ActiveOrdersService(_RecordingPort())
+
+    with pytest.raises(ValueError, match="scope must be"):
+        asyncio.run(service.list_active_orders(scope="everyone"))
@@ -4,7 +4,10 @@ import pytest
 
 from apps.core.orders.models import LadderExecutionMode
 from apps.core.strategies.breakout.policy import (
+    check_take_profit_ladder,
     default_take_profit_ratios,
+    TP_LADDER_BELOW_STOP,
+    TP_LADDER_NOT_INCREASING,
     expected_detached70_qtys,
     infer_ladder_execution_mode,
     ladder_execution_mode_label,
@@ -102,6 +105,19 @@ def test_validate_take_profit_levels() -> None:
     assert not validate_take_profit_levels([1.0, -1.0])
 
 
+def test_check_take_profit_ladder_reports_first_failed_rule() -> None:
+    assert check_take_profit_ladder([11.0, 12.0], stop_loss=9.5) is None
+    assert check_take_profit_ladder([9.0, 12.0], stop_loss=9.5) == TP_LADDER_BELOW_STOP
+    assert check_take_profit_ladder([11.0, 11.0], stop_loss=9.5) == TP_LADDER_NOT_INCREASING
+    assert check_take_profit_ladder([-1.0, 1.0], stop_loss=0.5) == TP_LADDER_NOT_INCREASING
+    assert check_take_profit_ladder([], stop_loss=0.5) == TP_LADDER_NOT_INCREASING
+
+
+def test_check_take_profit_ladder_reports_ordering_before_stop_loss() -> None:
+    # Below the stop and not increasing: ordering is reported, as before the single pass.
+    assert check_take_profit_ladder([9.0, 8.0], stop_loss=9.5) == TP_LADDER_NOT_INCREASING
+
+
 def test_default_take_profit_ratios_by_count() -> None:
     assert default_take_profit_ratios(1) == [1.0]
     assert default_take_profit_ratios(2) == [0.7, 0.3]
@@ -110,6 +126,13 @@ def test_default_take_profit_ratios_by_count() -> None:
         default_take_profit_ratios(4)
 
 
+def test_default_take_profit_ratios_returns_fresh_list() -> None:
+    ratios = default_take_profit_ratios(2)
+    ratios[0] = 0.5
+
+    assert default_take_profit_ratios(2) == [0.7, 0.3]
+
+
 def test_parse_take_profit_ratios_handles_percent_style_and_decimal_style() -> None:
     assert parse_take_profit_ratios("70-30", 2) == [0.7, 0.3]
     assert parse_take_profit_ratios("60-30-10", 3) == [0.6, 0.3, 0.1]
@@ -128,6 +151,8 @@ def test_parse_take_profit_ratios_rejects_invalid_shapes_or_values() -> None:
 def test_split_qty_by_ratios_rounding_and_errors() -> None:
     assert split_qty_by_ratios(10, [0.7, 0.3]) == [7, 3]
     assert split_qty_by_ratios(7, [0.6, 0.3, 0.1]) == [4, 2, 1]
+    assert split_qty_by_ratios(5, [1, 1, 1]) == [2, 2, 1]
+    assert split_qty_by_ratios(4, [1, 1, 1]) == [2, 1, 1]
 
     with pytest.raises(ValueError, match="qty must be greater than zero"):
         split_qty_by_ratios(0, [0.7, 0.3])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import replace
 
 import pytest
 
@@ -26,8 +27,7 @@ def _base_config(**overrides) -> BreakoutRunConfig:
         rule=BreakoutRuleConfig(level=10.0),
         entry_type=OrderType.MARKET,
     )
-    values = {**config.__dict__, **overrides}
-    return BreakoutRunConfig(**values)
+    return replace(config, **overrides)
 
 
 def test_default_breakout_tag_format_is_stable() -> None: